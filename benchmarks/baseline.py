@@ -0,0 +1,198 @@
+"""Baselines of the benchmark suite, and their comparison with new runs.
+
+A run of the suite is saved as a JSON file holding the samples of every benchmark
+with the metadata of the environment it ran in. A new run is compared with a
+baseline benchmark by benchmark: it regresses when its median time grew by more
+than a threshold and a one-sided Mann-Whitney U test finds its samples slower
+than the baseline ones at the chosen significance level, so the noise of a busy
+machine is not taken for a regression.
+
+The comparison runs from the suite, with `pytest benchmarks/ --benchmark-compare
+FILE`, or between two saved runs, exiting with 1 on a regression:
+
+    python -m benchmarks.baseline BASELINE RUN [--threshold 0.1] [--alpha 0.01]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Relative growth of the median time, and significance level, of a regression.
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_ALPHA = 0.01
+
+
+def environment() -> dict[str, Any]:
+    """Return the metadata of the environment the benchmarks run in."""
+    import httpx
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "httpx": httpx.__version__,
+        "commit": commit,
+        "datetime": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def save(path: str | Path, samples_ns: dict[str, list[int]]) -> None:
+    """Save the samples of a run, by benchmark name, with the environment."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"environment": environment(), "benchmarks": samples_ns}
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def load(path: str | Path) -> dict[str, Any]:
+    """Load a saved run, with its `environment` and `benchmarks` samples."""
+    data: dict[str, Any] = json.loads(Path(path).read_text(encoding="utf-8"))
+    return data
+
+
+def mann_whitney_greater(baseline: Sequence[float], run: Sequence[float]) -> float:
+    """
+    Return the p-value of the samples of `run` being greater than the baseline ones.
+
+    One-sided Mann-Whitney U test, with the normal approximation corrected for ties
+    and continuity, which is accurate from about ten samples per side.
+
+    Parameters
+    ----------
+    baseline : sequence of float
+        The samples of the baseline.
+    run : sequence of float
+        The samples of the new run.
+
+    Returns
+    -------
+    float
+        The probability of a U statistic at least as large with no slowdown.
+    """
+    values = sorted([(value, 0) for value in baseline] + [(value, 1) for value in run])
+    count = len(values)
+    rank_sum = 0.0
+    tie_term = 0
+    start = 0
+    while start < count:
+        end = start
+        while end < count and values[end][0] == values[start][0]:
+            end += 1
+        ties = end - start
+        tie_term += ties**3 - ties
+        average_rank = (start + end + 1) / 2
+        rank_sum += average_rank * sum(side for _, side in values[start:end])
+        start = end
+
+    n_baseline, n_run = len(baseline), len(run)
+    u_run = rank_sum - n_run * (n_run + 1) / 2
+    mean = n_baseline * n_run / 2
+    variance = (
+        n_baseline * n_run / 12 * ((count + 1) - tie_term / (count * (count - 1)))
+    )
+    if variance <= 0:
+        return 1.0
+    z = (u_run - mean - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Comparison of the samples of a benchmark with its baseline."""
+
+    name: str
+    baseline_median_us: float
+    median_us: float
+    p_value: float
+
+    @property
+    def change(self) -> float:
+        """Return the relative change of the median time, positive when slower."""
+        return self.median_us / self.baseline_median_us - 1
+
+    def is_regression(
+        self, threshold: float = DEFAULT_THRESHOLD, alpha: float = DEFAULT_ALPHA
+    ) -> bool:
+        """Return whether the benchmark got significantly slower than the threshold."""
+        return self.change > threshold and self.p_value < alpha
+
+    def __str__(self) -> str:
+        """Return the comparison on one line."""
+        return (
+            f"{self.name}: median {self.baseline_median_us:.1f} -> "
+            f"{self.median_us:.1f} us ({self.change:+.1%}, p={self.p_value:.3g})"
+        )
+
+
+def compare(
+    baseline: dict[str, list[int]], run: dict[str, list[int]]
+) -> list[Comparison]:
+    """Compare the samples of the benchmarks present in both runs, by name."""
+    return [
+        Comparison(
+            name=name,
+            baseline_median_us=statistics.median(baseline[name]) / 1000,
+            median_us=statistics.median(samples) / 1000,
+            p_value=mann_whitney_greater(baseline[name], samples),
+        )
+        for name, samples in run.items()
+        if baseline.get(name) and samples
+    ]
+
+
+def environment_changes(baseline: dict[str, Any], run: dict[str, Any]) -> list[str]:
+    """Return the differences of the environments which make timings incomparable."""
+    return [
+        f"{key}: {baseline.get(key)} -> {run.get(key)}"
+        for key in ("python", "implementation", "machine", "processor", "cpu_count")
+        if baseline.get(key) != run.get(key)
+    ]
+
+
+def main() -> None:
+    """Compare two saved runs, print the results and exit with 1 on a regression."""
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs.")
+    parser.add_argument("baseline")
+    parser.add_argument("run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    args = parser.parse_args()
+
+    baseline, run = load(args.baseline), load(args.run)
+    for change in environment_changes(baseline["environment"], run["environment"]):
+        print(f"environment changed, {change}")
+    regressed = False
+    for comparison in compare(baseline["benchmarks"], run["benchmarks"]):
+        regression = comparison.is_regression(args.threshold, args.alpha)
+        regressed |= regression
+        print(f"{comparison}  {'REGRESSION' if regression else 'OK'}")
+    sys.exit(regressed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark of the memory used by `ArticleStore` against a list of article dicts.
+
+Run with `python -m benchmarks.bench_columnar [--articles N]`.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any
+
+from toolkit.columnar import ArticleStore
+
+
+def make_payload(count: int) -> bytes:
+    """Return an `/everything` response body holding synthetic articles."""
+    articles = [
+        {
+            "source": {"id": None, "name": f"Source {i % 50}"},
+            "author": f"Author {i % 1000}",
+            "title": f"Title of the article number {i}",
+            "description": "A short description of the article. " * 3,
+            "url": f"https://www.example.com/news/{i}",
+            "urlToImage": f"https://www.example.com/images/{i}.jpg",
+            "publishedAt": f"2025-01-{1 + i % 28:02d}T{i % 24:02d}:00:00Z",
+            "content": "The first characters of the article content. " * 4,
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"status": "ok", "articles": articles}).encode()
+
+
+def measure(payload: bytes, columnar: bool) -> tuple[float, float]:
+    """Decode the payload and return the retained bytes and the elapsed seconds."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    articles: list[dict[str, Any]] = json.loads(payload)["articles"]
+    kept: list[dict[str, Any]] | ArticleStore = articles
+    if columnar:
+        kept = ArticleStore.from_articles(articles)
+        del articles
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained, elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100_000)
+    args = parser.parse_args()
+
+    payload = make_payload(args.articles)
+    for name, columnar in (("dicts", False), ("columnar", True)):
+        retained, elapsed = measure(payload, columnar)
+        print(
+            f"{name:>9}: {retained / args.articles:8,.0f} bytes per article, "
+            f"{elapsed:6.2f}s to load {args.articles:,} articles"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark of the throughput of `ParallelCrawler` by number of worker processes.
+
+The pages come from an in-process transport, so the benchmark measures how the
+decoding, validation and normalization of the pages scale with the cores.
+
+Run with `python -m benchmarks.bench_crawler [--pages N] [--max-workers N]`.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from toolkit.api_clients import AsyncAPIClient
+from toolkit.crawler import ParallelCrawler
+from toolkit.enums import APIEndpointEnum
+from toolkit.transports import CannedTransport, newsapi_payloads
+
+
+def run(workers: int, pages: int, transport: CannedTransport) -> float:
+    """Crawl the pages with the given number of workers, returning pages per second."""
+    api_client = AsyncAPIClient("https://newsapi.org/v2", transport=transport)
+    crawler = ParallelCrawler(api_client, workers=workers, max_concurrency=32)
+    requests = [
+        (APIEndpointEnum.EVERYTHING.value, {"q": "bitcoin", "page": page})
+        for page in range(pages)
+    ]
+
+    async def crawl_all() -> None:
+        async with api_client:
+            await crawler.crawl(requests)
+
+    start = time.perf_counter()
+    asyncio.run(crawl_all())
+    return pages / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    transport = CannedTransport(newsapi_payloads(page_size=100))
+    workers = [0] + [2**i for i in range(args.max_workers.bit_length())]
+    if args.max_workers not in workers:
+        workers.append(args.max_workers)
+    for count in workers:
+        pages_per_second = run(count, args.pages, transport)
+        label = "in-loop" if count == 0 else f"{count} workers"
+        print(f"{label:>11}: {pages_per_second:8,.1f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark of the article deduplication index, in both modes.
+
+Run with `python -m benchmarks.bench_dedupe [--articles N]`.
+"""
+
+import argparse
+import time
+from typing import Any
+
+from toolkit.dedupe import ArticleDeduplicator
+from toolkit.enums import DedupeModeEnum
+
+
+def make_articles(count: int) -> list[dict[str, Any]]:
+    """Return synthetic articles, every tenth one being a duplicate."""
+    return [
+        {
+            "url": f"https://www.example.com/news/{i - i % 10 if i % 10 == 9 else i}",
+            "title": f"Article number {i - i % 10 if i % 10 == 9 else i}",
+        }
+        for i in range(count)
+    ]
+
+
+def bench(mode: DedupeModeEnum, articles: list[dict[str, Any]]) -> dict[str, float]:
+    """Insert every article and return the throughput and memory figures."""
+    deduplicator = ArticleDeduplicator(mode=mode, capacity=len(articles))
+    start = time.perf_counter()
+    unique = len(deduplicator.filter(articles))
+    elapsed = time.perf_counter() - start
+    return {
+        "unique": unique,
+        "articles_per_second": len(articles) / elapsed,
+        "mb_per_million_articles": deduplicator.nbytes / unique * 1e6 / 2**20,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles)
+    for mode in DedupeModeEnum:
+        result = bench(mode, articles)
+        print(
+            f"{mode.value:>12}: {result['unique']:>10,.0f} unique, "
+            f"{result['articles_per_second']:>10,.0f} articles/s, "
+            f"{result['mb_per_million_articles']:6.2f} MiB per million articles"
+        )
+
+
+if __name__ == "__main__":
+    main()
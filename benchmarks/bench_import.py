@@ -0,0 +1,98 @@
+"""Benchmark of the import time of the toolkit and config packages.
+
+Every statement runs in a fresh interpreter under `python -X importtime`, and the
+self times of all the imported modules are summed. The statements with a budget
+fail the run when they get slower than it, so heavy imports creeping back into
+the light paths are caught.
+
+Run with `python -m benchmarks.bench_import [--repeat N]`.
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Statement, mapped to its import time budget in milliseconds, if any.
+STATEMENTS: dict[str, float | None] = {
+    "import toolkit": 5.0,
+    "from toolkit import APIEndpointEnum": 5.0,
+    "import config.base": 5.0,
+    "from toolkit import AsyncAPIClient": None,
+    "from toolkit.published_at import published_at_array": None,
+}
+
+
+def import_time(
+    statement: str, startup: set[str]
+) -> tuple[float, list[tuple[float, str]]]:
+    """
+    Return the import time of a statement and the slowest imported modules.
+
+    Parameters
+    ----------
+    statement : str
+        The Python statement to run.
+    startup : set of str
+        The modules imported by the interpreter startup, which are left out.
+
+    Returns
+    -------
+    tuple
+        The total import time in milliseconds, and the `(self time, module)` pairs of
+        the imported modules, slowest first.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line.removeprefix("import time:").split("|")
+        modules.append((int(self_us) / 1000, module.strip()))
+    modules = [(ms, module) for ms, module in modules if module not in startup]
+    return sum(ms for ms, _ in modules), sorted(modules, reverse=True)
+
+
+def startup_modules() -> set[str]:
+    """Return the modules imported by the interpreter startup itself."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+
+
+def main() -> None:
+    """Run the benchmark, print the results and exit with 1 on a budget overrun."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=3)
+    args = parser.parse_args()
+
+    startup = startup_modules()
+    over_budget = False
+    for statement, budget in STATEMENTS.items():
+        runs = [import_time(statement, startup) for _ in range(args.repeat)]
+        total, modules = min(runs)
+        status = ""
+        if budget is not None:
+            over_budget |= total > budget
+            status = "OK" if total <= budget else f"OVER BUDGET ({budget:.1f} ms)"
+        print(f"{total:8.2f} ms  {statement}  {status}")
+        for ms, module in modules[: args.top]:
+            print(f"{'':12}{ms:8.2f} ms  {module}")
+    sys.exit(over_budget)
+
+
+if __name__ == "__main__":
+    main()
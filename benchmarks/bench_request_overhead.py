@@ -0,0 +1,125 @@
+"""Benchmark of the per-request overhead of the API clients.
+
+The requests go to an in-process transport, so only the client and httpx are
+measured. The URL and header construction is also timed on its own, against the
+previous approach of rebuilding both on every request.
+
+With `--profile FILE`, the requests are sent once more with a `RequestProfiler`,
+whose stage timings are printed and dumped to `FILE` in the `pstats` format.
+
+Run with `python -m benchmarks.bench_request_overhead [--requests N] [--profile FILE]`.
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from toolkit.api_clients import APIClient, AsyncAPIClient
+from toolkit.enums import APIEndpointEnum
+from toolkit.profiling import RequestProfiler
+from toolkit.transports import CannedTransport
+
+BASE_URL = "https://newsapi.org/v2/"
+DEFAULT_HEADERS = {"X-API-KEY": "benchmark", "Accept": "application/json"}
+
+
+def rebuild_every_time(
+    endpoint: str, headers: dict[str, Any] | None = None
+) -> tuple[str, dict[str, Any]]:
+    """Build the URL and headers as the clients did before they were prepared."""
+    full_url = f"{BASE_URL.rstrip('/')}/{endpoint.lstrip('/')}"
+    request_headers = {**DEFAULT_HEADERS, **(headers or {})}
+    return full_url, request_headers
+
+
+def per_call_ns(function: Callable[[], Any], calls: int) -> float:
+    """Return the mean duration of a call, in nanoseconds."""
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter_ns() - start) / calls
+
+
+async def async_requests(client: AsyncAPIClient, requests: int) -> float:
+    """Send the requests one after another, returning the elapsed seconds."""
+    start = time.perf_counter()
+    for _ in range(requests):
+        await client.get(APIEndpointEnum.EVERYTHING.value, params={"q": "bitcoin"})
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--profile", metavar="FILE")
+    args = parser.parse_args()
+
+    client = APIClient(
+        BASE_URL,
+        default_headers=DEFAULT_HEADERS,
+        transport=CannedTransport(),
+    )
+    endpoint = APIEndpointEnum.EVERYTHING.value
+    before = per_call_ns(lambda: rebuild_every_time(endpoint), args.calls)
+    after = per_call_ns(
+        lambda: (client._build_url(endpoint), client._build_headers(None)),
+        args.calls,
+    )
+    print(f"URL and headers, rebuilt:  {before:8.1f} ns per request")
+    print(f"URL and headers, prepared: {after:8.1f} ns per request")
+
+    start = time.perf_counter()
+    for _ in range(args.requests):
+        client.get(endpoint, params={"q": "bitcoin"})
+    elapsed = time.perf_counter() - start
+    print(
+        f"APIClient.get:      {elapsed / args.requests * 1e6:8.1f} us per request, "
+        f"{args.requests / elapsed:8,.0f} requests/s"
+    )
+
+    async_client = AsyncAPIClient(
+        BASE_URL,
+        default_headers=DEFAULT_HEADERS,
+        transport=CannedTransport(),
+    )
+    elapsed = asyncio.run(async_requests(async_client, args.requests))
+    print(
+        f"AsyncAPIClient.get: {elapsed / args.requests * 1e6:8.1f} us per request, "
+        f"{args.requests / elapsed:8,.0f} requests/s"
+    )
+
+    if args.profile:
+        profile(args.requests, args.profile)
+
+
+def profile(requests: int, path: str) -> None:
+    """Send the requests with both clients profiled, printing and dumping the stages."""
+    profiler = RequestProfiler()
+    client = APIClient(
+        BASE_URL,
+        default_headers=DEFAULT_HEADERS,
+        transport=CannedTransport(),
+        profiler=profiler,
+    )
+    for _ in range(requests):
+        # Decoded like the tests do, for the profiler to time the `decode` stage.
+        client.get(APIEndpointEnum.EVERYTHING.value, params={"q": "bitcoin"}).json()
+    async_client = AsyncAPIClient(
+        BASE_URL,
+        default_headers=DEFAULT_HEADERS,
+        transport=CannedTransport(),
+        profiler=profiler,
+    )
+    asyncio.run(async_requests(async_client, requests))
+    print(f"\nStages of {profiler.requests} requests, in us:")
+    print(profiler.summary())
+    profiler.dump_stats(path)
+    print(f"Profile written to {path}, read it with `python -m pstats {path}`.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Module providing the `benchmark` fixture of the benchmark suite.
+
+The fixture follows the `pytest-benchmark` style: a benchmark test passes the
+function under test to `benchmark`, which runs it for a number of warmup and
+measured rounds, and the statistics of every benchmark are reported at the end of
+the session. Run the suite with `pytest benchmarks/`.
+
+With `--benchmark-save FILE` the samples of the run are saved as a JSON baseline,
+and with `--benchmark-compare FILE` the run is compared with a saved baseline and
+fails on a regression, see `benchmarks.baseline`.
+"""
+
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import pytest
+
+from benchmarks import baseline
+
+if TYPE_CHECKING:
+    from _pytest.terminal import TerminalReporter
+
+T = TypeVar("T")
+
+_RESULTS_KEY = pytest.StashKey[list["Benchmark"]]()
+_COMPARISONS_KEY = pytest.StashKey[list[baseline.Comparison]]()
+
+
+class Benchmark:
+    """Timer running a function for several rounds and keeping every sample."""
+
+    def __init__(self, name: str, rounds: int, warmup: int) -> None:
+        """
+        Initialize the `Benchmark`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the benchmark, the node id of its test.
+        rounds : int
+            Number of measured rounds.
+        warmup : int
+            Number of rounds run before the measured ones.
+        """
+        self.name = name
+        self.rounds = rounds
+        self.warmup = warmup
+        self.operations_per_round = 1
+        self.samples_ns: list[int] = []
+
+    def __call__(self, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Benchmark a synchronous function, returning its last result."""
+        for _ in range(self.warmup):
+            function(*args, **kwargs)
+        for _ in range(self.rounds):
+            start = time.perf_counter_ns()
+            result = function(*args, **kwargs)
+            self.samples_ns.append(time.perf_counter_ns() - start)
+        return result
+
+    async def run_async(
+        self, function: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Benchmark a coroutine function, returning its last result."""
+        for _ in range(self.warmup):
+            await function(*args, **kwargs)
+        for _ in range(self.rounds):
+            start = time.perf_counter_ns()
+            result = await function(*args, **kwargs)
+            self.samples_ns.append(time.perf_counter_ns() - start)
+        return result
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Return the statistics of the samples, in microseconds."""
+        samples_us = [sample / 1000 for sample in self.samples_ns]
+        mean = statistics.fmean(samples_us)
+        return {
+            "min": min(samples_us),
+            "max": max(samples_us),
+            "mean": mean,
+            "median": statistics.median(samples_us),
+            "stddev": statistics.stdev(samples_us) if len(samples_us) > 1 else 0.0,
+            "ops": self.operations_per_round / mean * 1e6,
+        }
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options of the benchmark suite."""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-rounds", type=int, default=200, help="Measured rounds per test."
+    )
+    group.addoption(
+        "--benchmark-warmup", type=int, default=20, help="Warmup rounds per test."
+    )
+    group.addoption(
+        "--benchmark-save",
+        metavar="FILE",
+        help="Save the samples of the run, with the environment, as a JSON baseline.",
+    )
+    group.addoption(
+        "--benchmark-compare",
+        metavar="FILE",
+        help="Compare the run with a JSON baseline, failing on a regression.",
+    )
+    group.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=baseline.DEFAULT_THRESHOLD,
+        help="Relative growth of the median time counted as a regression.",
+    )
+    group.addoption(
+        "--benchmark-alpha",
+        type=float,
+        default=baseline.DEFAULT_ALPHA,
+        help="Significance level of the regressions.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Initialize the list of the benchmark results of the session."""
+    config.stash[_RESULTS_KEY] = []
+    config.stash[_COMPARISONS_KEY] = []
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    """
+    Fixture to provide a `Benchmark` for the requesting test.
+
+    Returns
+    -------
+    Benchmark
+        The timer of the test; its samples are reported at the end of the session.
+    """
+    benchmark = Benchmark(
+        name=request.node.nodeid,
+        rounds=request.config.getoption("--benchmark-rounds"),
+        warmup=request.config.getoption("--benchmark-warmup"),
+    )
+    request.config.stash[_RESULTS_KEY].append(benchmark)
+    return benchmark
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Save the samples of the run, and fail it on a regression from the baseline."""
+    config = session.config
+    samples_ns = {
+        result.name: result.samples_ns
+        for result in config.stash[_RESULTS_KEY]
+        if result.samples_ns
+    }
+    compare_path = config.getoption("--benchmark-compare")
+    if compare_path and samples_ns:
+        comparisons = baseline.compare(
+            baseline.load(compare_path)["benchmarks"], samples_ns
+        )
+        config.stash[_COMPARISONS_KEY] = comparisons
+        threshold = config.getoption("--benchmark-threshold")
+        alpha = config.getoption("--benchmark-alpha")
+        if any(
+            comparison.is_regression(threshold, alpha) for comparison in comparisons
+        ):
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    save_path = config.getoption("--benchmark-save")
+    if save_path and samples_ns:
+        baseline.save(save_path, samples_ns)
+
+
+def pytest_terminal_summary(
+    terminalreporter: "TerminalReporter", config: pytest.Config
+) -> None:
+    """Report the statistics of every benchmark which ran."""
+    results = [result for result in config.stash[_RESULTS_KEY] if result.samples_ns]
+    if not results:
+        return
+    terminalreporter.section("benchmark (times in us)")
+    width = max(len(result.name) for result in results)
+    terminalreporter.write_line(
+        f"{'name':<{width}} {'min':>10} {'mean':>10} {'median':>10} "
+        f"{'stddev':>10} {'ops/s':>12}"
+    )
+    for result in results:
+        stats = result.stats
+        terminalreporter.write_line(
+            f"{result.name:<{width}} {stats['min']:>10.1f} {stats['mean']:>10.1f} "
+            f"{stats['median']:>10.1f} {stats['stddev']:>10.1f} {stats['ops']:>12,.0f}"
+        )
+    _report_comparisons(terminalreporter, config)
+
+
+def _report_comparisons(
+    terminalreporter: "TerminalReporter", config: pytest.Config
+) -> None:
+    """Report the comparison of every benchmark with the baseline."""
+    comparisons = config.stash[_COMPARISONS_KEY]
+    if not comparisons:
+        return
+    terminalreporter.section("benchmark comparison")
+    environment = baseline.load(config.getoption("--benchmark-compare"))["environment"]
+    for change in baseline.environment_changes(environment, baseline.environment()):
+        terminalreporter.write_line(f"environment changed, {change}", yellow=True)
+    threshold = config.getoption("--benchmark-threshold")
+    alpha = config.getoption("--benchmark-alpha")
+    for comparison in comparisons:
+        if comparison.is_regression(threshold, alpha):
+            terminalreporter.write_line(f"{comparison}  REGRESSION", red=True)
+        else:
+            terminalreporter.write_line(f"{comparison}  OK")
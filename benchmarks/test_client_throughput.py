@@ -0,0 +1,107 @@
+"""Benchmarks of the client overhead, through the whole stack to the transport."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.conftest import Benchmark
+from toolkit.api_clients import APIClient, AsyncAPIClient, RequestSpec
+from toolkit.enums import APIEndpointEnum
+from toolkit.transports import CannedTransport
+
+BASE_URL = "https://newsapi.org/v2"
+DEFAULT_HEADERS = {"X-API-KEY": "benchmark"}
+PARAMS = {"q": "bitcoin", "pageSize": 100}
+# Load scenario: requests per round, in flight at a time, simulated latency.
+LOAD_REQUESTS = 200
+LOAD_CONCURRENCY = 16
+LOAD_LATENCY = 0.002
+
+
+@pytest.fixture(scope="module")
+def transport() -> CannedTransport:
+    """Fixture to provide a transport shared by the benchmarks of the module."""
+    return CannedTransport()
+
+
+@pytest.mark.parametrize("method", ["get", "post"])
+def test_api_client_request(
+    benchmark: Benchmark, transport: CannedTransport, method: str
+) -> None:
+    """Benchmark a synchronous request."""
+    api_client = APIClient(
+        BASE_URL, default_headers=DEFAULT_HEADERS, transport=transport
+    )
+    send = getattr(api_client, method)
+
+    response: httpx.Response = benchmark(
+        send, APIEndpointEnum.EVERYTHING.value, params=PARAMS
+    )
+
+    assert response.status_code == httpx.codes.OK
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["get", "post"])
+async def test_async_api_client_request(
+    benchmark: Benchmark, transport: CannedTransport, method: str
+) -> None:
+    """Benchmark an asynchronous request."""
+    api_client = AsyncAPIClient(
+        BASE_URL, default_headers=DEFAULT_HEADERS, transport=transport
+    )
+    send = getattr(api_client, method)
+
+    response: httpx.Response = await benchmark.run_async(
+        send, APIEndpointEnum.EVERYTHING.value, params=PARAMS
+    )
+
+    assert response.status_code == httpx.codes.OK
+
+
+@pytest.mark.asyncio
+async def test_async_api_client_concurrent_requests(
+    benchmark: Benchmark, transport: CannedTransport
+) -> None:
+    """Benchmark rounds of 50 concurrent asynchronous requests."""
+    api_client = AsyncAPIClient(
+        BASE_URL, default_headers=DEFAULT_HEADERS, transport=transport
+    )
+    benchmark.operations_per_round = 50
+
+    async def send_batch() -> list[httpx.Response]:
+        return await asyncio.gather(
+            *(
+                api_client.get(APIEndpointEnum.EVERYTHING.value, params=PARAMS)
+                for _ in range(benchmark.operations_per_round)
+            )
+        )
+
+    responses = await benchmark.run_async(send_batch)
+
+    assert all(response.status_code == httpx.codes.OK for response in responses)
+
+
+@pytest.mark.asyncio
+async def test_async_api_client_map_load(benchmark: Benchmark) -> None:
+    """Benchmark rounds of a load scenario, pages sent by `map` with some latency."""
+    api_client = AsyncAPIClient(
+        BASE_URL,
+        default_headers=DEFAULT_HEADERS,
+        transport=CannedTransport(latency=LOAD_LATENCY),
+    )
+    specs = [
+        RequestSpec(APIEndpointEnum.EVERYTHING.value, params={**PARAMS, "page": page})
+        for page in range(1, LOAD_REQUESTS + 1)
+    ]
+    benchmark.rounds = max(1, benchmark.rounds // 20)
+    benchmark.warmup = 1
+    benchmark.operations_per_round = LOAD_REQUESTS
+
+    async with api_client:
+        results = await benchmark.run_async(
+            api_client.map, specs, max_concurrency=LOAD_CONCURRENCY
+        )
+
+    assert all(result.response is not None for result in results)
@@ -1,5 +1,22 @@
 """Module for defining base configurations."""
 
-from config.settings import get_settings
+from typing import TYPE_CHECKING, Any
 
-settings = get_settings()
+if TYPE_CHECKING:
+    from config.settings import Settings
+
+    settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the `settings` lazily, on their first access.
+
+    Importing `pydantic` and reading the `.env` file are deferred until the settings
+    are actually used; `get_settings` caches the instance afterwards.
+    """
+    if name == "settings":
+        from config.settings import get_settings
+
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
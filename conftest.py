@@ -0,0 +1,8 @@
+"""Root pytest configuration, registering the plugins shared by every suite."""
+
+pytest_plugins = [
+    "toolkit.plugins.bdd",
+    "toolkit.plugins.concurrency",
+    "toolkit.plugins.latency",
+    "toolkit.plugins.quota",
+]
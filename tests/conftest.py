@@ -1,26 +1,257 @@
 """Module providing pytest fixtures and configuration for the test suite."""
 
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import httpx
 import pytest
 
 from config.base import settings
 from toolkit import AsyncAPIClient
+from toolkit.canonical import canonical_query
+from toolkit.plugins import fresh_responses
+from toolkit.spreadsheet import PLACEHOLDER_VALUES, CaseBatch, SpreadsheetCase
+
+if TYPE_CHECKING:
+    from _pytest.terminal import TerminalReporter
+
+# Responses worth sending the request again for, as they may differ on a retry.
+_TRANSIENT_STATUS_CODES = frozenset({HTTPStatus.TOO_MANY_REQUESTS}) | {
+    status for status in HTTPStatus if status >= HTTPStatus.INTERNAL_SERVER_ERROR
+}
+
+
+class ResponseMemo:
+    """
+    Responses of the requests sent during the session, by canonical request.
+
+    Tests sending the same request, with the same headers, share one response, so
+    every distinct request hits the API at most once per run. Identical requests in
+    flight at the same time on the same event loop share the same request as well.
+    Rate limited and server error responses are not kept.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty `ResponseMemo`."""
+        self._responses: dict[str, httpx.Response] = {}
+        self._pending: dict[str, asyncio.Future[httpx.Response]] = {}
+        self.sent = 0
+        self.saved = 0
+
+    @staticmethod
+    def key(
+        base_url: str,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        headers: Mapping[str, Any],
+    ) -> str:
+        """Return the key of a request, the same for equivalent requests."""
+        request = [
+            base_url.rstrip("/"),
+            method.upper(),
+            canonical_query(endpoint, params),
+            sorted((name.lower(), str(value)) for name, value in headers.items()),
+        ]
+        return hashlib.sha256(json.dumps(request).encode()).hexdigest()
+
+    async def fetch(
+        self, key: str, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Return the response of a request, sending it only when not known yet."""
+        response = self._responses.get(key)
+        if response is not None:
+            self.saved += 1
+            return response
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            self.saved += 1
+            return await asyncio.shield(pending)
+
+        future = self._pending[key] = loop.create_future()
+        self.sent += 1
+        try:
+            response = await send()
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved, in case no other test waits for it.
+            future.exception()
+            raise
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+        future.set_result(response)
+        if response.status_code not in _TRANSIENT_STATUS_CODES:
+            self._responses[key] = response
+        return response
+
+
+class MemoizedAsyncAPIClient(AsyncAPIClient):
+    """`AsyncAPIClient` answering its `GET` requests from a `ResponseMemo`."""
+
+    def __init__(self, *args: Any, memo: ResponseMemo, **kwargs: Any) -> None:
+        """Initialize the client, recording its responses in the given memo."""
+        super().__init__(*args, **kwargs)
+        self.memo = memo
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, or return the response of an equivalent one."""
+        send = partial(
+            super()._request,
+            method,
+            endpoint,
+            headers=headers,
+            params=params,
+            payload=payload,
+            **kwargs,
+        )
+        if (
+            method.upper() != "GET"
+            or payload is not None
+            or kwargs
+            or fresh_responses.get()
+        ):
+            return await send()
+
+        key = self.memo.key(
+            self.base_url,
+            method,
+            endpoint,
+            params,
+            self._build_headers(headers),
+        )
+        return await self.memo.fetch(key, send)
+
+
+_MEMO_KEY = pytest.StashKey[ResponseMemo]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options enabling the shared responses and the spreadsheet cases."""
+    parser.addoption(
+        "--response-memo",
+        action="store_true",
+        default=False,
+        help="Send every distinct request of the tests once, sharing its response.",
+    )
+    parser.addoption(
+        "--spreadsheet",
+        action="store_true",
+        default=False,
+        help="Run the cases generated from the test case spreadsheet.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Create the response memo of the session, when enabled."""
+    if config.getoption("--response-memo"):
+        config.stash[_MEMO_KEY] = ResponseMemo()
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Deselect the spreadsheet cases, unless enabled, as they spend the quota."""
+    if config.getoption("--spreadsheet"):
+        return
+    selected: list[pytest.Item] = []
+    deselected: list[pytest.Item] = []
+    for item in items:
+        marker = item.get_closest_marker("spreadsheet")
+        (selected if marker is None else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_terminal_summary(terminalreporter: "TerminalReporter") -> None:
+    """Report how many requests the response memo saved."""
+    memo = terminalreporter.config.stash.get(_MEMO_KEY, None)
+    if memo is None or not memo.sent + memo.saved:
+        return
+    total = memo.sent + memo.saved
+    terminalreporter.write_sep("-", "response memo")
+    terminalreporter.write_line(
+        f"{memo.sent} requests sent, {memo.saved} of {total} served from the memo "
+        f"({memo.saved / total:.0%} saved)"
+    )
+
+
+@pytest.fixture(scope="session")
+def response_memo(pytestconfig: pytest.Config) -> ResponseMemo | None:
+    """Provide the response memo of the session, `None` when disabled."""
+    if _MEMO_KEY not in pytestconfig.stash:
+        return None
+    return pytestconfig.stash[_MEMO_KEY]
 
 
 @pytest.fixture(scope="session")
-def api_client() -> AsyncAPIClient:
+def api_client(response_memo: ResponseMemo | None) -> AsyncAPIClient:
     """
     Fixture to provide an instance of AsyncAPIClient.
 
     This fixture sets up a client to interact with the API, initializing it with the
     base URL and API key from the settings. It is shared across all tests within the
-    session.
+    session. With `--response-memo`, so are the responses of its `GET` requests:
+    every distinct request is sent once per run.
 
     Returns
     -------
     AsyncAPIClient
         The API client instance for use in tests.
     """
-    return AsyncAPIClient(
+    if response_memo is None:
+        return AsyncAPIClient(
+            base_url=settings.BASE_URL,
+            default_headers={"X-API-KEY": settings.API_KEY},
+        )
+    return MemoizedAsyncAPIClient(
         base_url=settings.BASE_URL,
         default_headers={"X-API-KEY": settings.API_KEY},
+        memo=response_memo,
     )
+
+
+@pytest.fixture(scope="session")
+def case_batch(request: pytest.FixtureRequest, api_client: AsyncAPIClient) -> CaseBatch:
+    """
+    Fixture to provide the batch of the spreadsheet cases selected for the run.
+
+    The requests of every selected `SpreadsheetCase` are sent concurrently, in one
+    batch, when the first case asks for its result, each in the name of the test of
+    its case.
+
+    Returns
+    -------
+    CaseBatch
+        The batch of the cases, with the API keys of the settings.
+    """
+    cases, test_ids = [], {}
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        case = callspec.params.get("case") if callspec is not None else None
+        if isinstance(case, SpreadsheetCase):
+            cases.append(case)
+            test_ids[case.case_id] = item.nodeid
+    values = {
+        **PLACEHOLDER_VALUES,
+        "valid_key": settings.API_KEY,
+        "rate_limited_key": settings.RATE_LIMITED_API_KEY,
+    }
+    return CaseBatch(api_client, cases, values, test_ids=test_ids)
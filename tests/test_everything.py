@@ -13,6 +13,7 @@ from toolkit import (
     ResponseCodeEnum,
     ResponseStatusEnum,
 )
+from toolkit.published_at import in_range, published_at_array
 
 
 @pytest.mark.asyncio
@@ -334,6 +335,25 @@ async def test_valid_exclude_domains_success(
     # TODO: Check the validity of the articles, filtered by the specified query params
 
 
+@pytest.mark.asyncio
+@pytest.mark.latency(p95_ms=2000, samples=5)
+@pytest.mark.quota(cost=5)
+async def test_unknown_exclude_domains_latency(api_client: AsyncAPIClient) -> None:
+    """Test that an unknown excludeDomains param does not slow down the response."""
+    query_params = {
+        "q": "ethereum",
+        "excludeDomains": "this-domain-does-not-exist.com",
+        "pageSize": 5,
+    }
+    response = await api_client.get(
+        APIEndpointEnum.EVERYTHING.value, params=query_params
+    )
+
+    actual_response_status_code = response.status_code
+    expected_response_status_code = HTTPStatus.OK
+    assert actual_response_status_code == expected_response_status_code
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "from_param",
@@ -363,12 +383,8 @@ async def test_valid_from_query_param_success(
     articles = response.json().get("articles", "No `articles` in body")
     assert isinstance(articles, list)
 
-    from_datetime = datetime.fromisoformat(from_param).replace(tzinfo=timezone.utc)
-    for article in articles:
-        published_at = datetime.fromisoformat(
-            article["publishedAt"].replace("Z", "+00:00")
-        )
-        assert published_at >= from_datetime
+    published_at = published_at_array(articles)
+    assert in_range(published_at, start=from_param).all()
 
 
 @pytest.mark.asyncio
@@ -400,12 +416,8 @@ async def test_valid_to_query_param_success(
     articles = response.json().get("articles", "No `articles` in body")
     assert isinstance(articles, list)
 
-    to_datetime = datetime.fromisoformat(to_param).replace(tzinfo=timezone.utc)
-    for article in articles:
-        published_at = datetime.fromisoformat(
-            article["publishedAt"].replace("Z", "+00:00")
-        )
-        assert published_at <= to_datetime
+    published_at = published_at_array(articles)
+    assert in_range(published_at, end=to_param).all()
 
 
 @pytest.mark.asyncio
@@ -450,13 +462,8 @@ async def test_valid_to_and_from_query_param_success(
     articles = response.json().get("articles", "No `articles` in body")
     assert isinstance(articles, list)
 
-    from_datetime = datetime.fromisoformat(from_param).replace(tzinfo=timezone.utc)
-    to_datetime = datetime.fromisoformat(to_param).replace(tzinfo=timezone.utc)
-    for article in articles:
-        published_at = datetime.fromisoformat(
-            article["publishedAt"].replace("Z", "+00:00")
-        )
-        assert from_datetime <= published_at <= to_datetime
+    published_at = published_at_array(articles)
+    assert in_range(published_at, start=from_param, end=to_param).all()
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,32 @@
+"""Module containing the test cases generated from the test case spreadsheet."""
+
+import pytest
+
+from toolkit.spreadsheet import CaseBatch, SpreadsheetCase, load_cases
+
+CASES = [
+    pytest.param(
+        case,
+        id=case.case_id,
+        marks=[pytest.mark.skip(reason=f"Manual case: {case.manual}.")]
+        if case.manual
+        else [],
+    )
+    for case in load_cases()
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.spreadsheet
+@pytest.mark.parametrize("case", CASES)
+async def test_spreadsheet_case(case: SpreadsheetCase, case_batch: CaseBatch) -> None:
+    """Test the response to the request of a case of the test case spreadsheet."""
+    result = await case_batch.result(case)
+    assert result.response is not None, f"The request failed: {result.error!r}"
+
+    actual_response_status_code = result.response.status_code
+    expected_response_status_code = case.status_code
+    assert actual_response_status_code == expected_response_status_code
+
+    actual_problems = case.check(result.response.json())
+    assert not actual_problems, f"{case.description} {actual_problems}"
@@ -0,0 +1,26 @@
+"""Module providing pytest fixtures for the BDD scenarios."""
+
+import pytest
+
+from config.base import settings
+from toolkit import AsyncAPIClient
+
+
+@pytest.fixture(scope="session")
+def api_client() -> AsyncAPIClient:
+    """
+    Fixture to provide an instance of AsyncAPIClient to the steps.
+
+    The client is shared across all scenarios within the session. It is opened on
+    the loop of the `async_bridge` fixture, which runs the `async_step` steps, so
+    every scenario reuses its connection pool.
+
+    Returns
+    -------
+    AsyncAPIClient
+        The API client instance for use in the steps.
+    """
+    return AsyncAPIClient(
+        base_url=settings.BASE_URL,
+        default_headers={"X-API-KEY": settings.API_KEY},
+    )
@@ -7,9 +7,9 @@ from typing import Any
 import httpx
 from pytest_bdd import given, scenarios, then, when
 
-from config.base import settings
-from toolkit.api_clients import APIClient
+from toolkit.api_clients import AsyncAPIClient
 from toolkit.enums import APIEndpointEnum, ResponseStatusEnum
+from toolkit.plugins.bdd import async_step
 
 scenarios("../features/scenarios.feature")
 
@@ -18,21 +18,25 @@ scenarios("../features/scenarios.feature")
     "a user with a valid API key",
     target_fixture="response",
 )
-def given_user_with_valid_api_key() -> httpx.Response:
+@async_step
+async def given_user_with_valid_api_key(api_client: AsyncAPIClient) -> httpx.Response:
     """
     Provide a user with a valid API key for making API requests.
 
+    Parameters
+    ----------
+    api_client : AsyncAPIClient
+        The pooled API client shared by the scenarios.
+
     Returns
     -------
     httpx.Response
         An instance of httpx.Response indicating the HTTP response.
     """
-    api_client = APIClient(
-        base_url=settings.BASE_URL,
-        default_headers={"X-API-KEY": settings.API_KEY},
-    )
     query_params = {"country": "us"}
-    response = api_client.get(APIEndpointEnum.TOP_HEADLINES.value, params=query_params)
+    response = await api_client.get(
+        APIEndpointEnum.TOP_HEADLINES.value, params=query_params
+    )
     return response
 
 
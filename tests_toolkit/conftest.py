@@ -0,0 +1,102 @@
+"""Module providing an offline fake of the API for the toolkit tests."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+import pytest
+
+from toolkit import AsyncAPIClient, ResponseCodeEnum, ResponseStatusEnum
+from toolkit.timestamps import parse_published_at
+
+BASE_URL = "https://newsapi.test/v2"
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeNewsAPI:
+    """
+    In-memory `/everything` and `/top-headlines`, served through `httpx.MockTransport`.
+
+    The articles are filtered by the inclusive `from` and `to` params, sorted newest
+    first and paginated, and the pages past `max_results` are refused like the API
+    does with its developer plan.
+    """
+
+    def __init__(self, max_results: int = 100) -> None:
+        """Initialize the fake API without articles."""
+        self.max_results = max_results
+        self.articles: list[dict[str, Any]] = []
+        self.requests: list[httpx.Request] = []
+
+    def publish(self, count: int, start: datetime | None = None) -> list[str]:
+        """Publish articles one minute apart after `start`, returning their URLs."""
+        start = start or START + timedelta(minutes=len(self.articles))
+        urls = []
+        for index in range(count):
+            number = len(self.articles)
+            published_at = start + timedelta(minutes=index)
+            self.articles.append(
+                {
+                    "url": f"https://news.test/{number}",
+                    "title": f"Article {number}",
+                    "publishedAt": published_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
+            )
+            urls.append(f"https://news.test/{number}")
+        return urls
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request like the API would."""
+        self.requests.append(request)
+        params = request.url.params
+        articles = sorted(
+            self._matching(params),
+            key=lambda article: article["publishedAt"],
+            reverse=True,
+        )
+        page, page_size = int(params.get("page", 1)), int(params.get("pageSize", 100))
+        if (page - 1) * page_size >= self.max_results and articles:
+            return httpx.Response(
+                HTTPStatus.UPGRADE_REQUIRED,
+                json={
+                    "status": ResponseStatusEnum.ERROR.value,
+                    "code": ResponseCodeEnum.MAXIMUM_RESULTS_REACHED.value,
+                },
+            )
+        end = min(page * page_size, self.max_results)
+        body = {
+            "status": ResponseStatusEnum.OK.value,
+            "totalResults": len(articles),
+            "articles": articles[(page - 1) * page_size : end],
+        }
+        return httpx.Response(HTTPStatus.OK, content=json.dumps(body).encode())
+
+    def _matching(self, params: httpx.QueryParams) -> list[dict[str, Any]]:
+        """Return the articles inside the `from` and `to` params of a request."""
+        start = _parse(params.get("from"))
+        end = _parse(params.get("to"))
+        return [
+            article
+            for article in self.articles
+            if (start is None or parse_published_at(article["publishedAt"]) >= start)
+            and (end is None or parse_published_at(article["publishedAt"]) <= end)
+        ]
+
+
+def _parse(value: str | None) -> datetime | None:
+    """Parse a `from` or `to` param, `None` when not given."""
+    return None if value is None else parse_published_at(value)
+
+
+@pytest.fixture
+def fake_api() -> FakeNewsAPI:
+    """Fixture to provide an empty fake API."""
+    return FakeNewsAPI()
+
+
+@pytest.fixture
+def fake_client(fake_api: FakeNewsAPI) -> AsyncAPIClient:
+    """Fixture to provide an `AsyncAPIClient` sending its requests to the fake API."""
+    return AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(fake_api.handler))
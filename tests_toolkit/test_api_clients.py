@@ -0,0 +1,55 @@
+"""Module containing test cases for the API clients."""
+
+import time
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import APIClient, AsyncAPIClient, RateLimiter, RequestSpec
+
+
+def test_map_elapsed_leaves_out_the_rate_limiter_wait() -> None:
+    """Test that the time of a mapped request does not count its wait for a token."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+    )
+    api_client = APIClient(
+        BASE_URL, transport=transport, rate_limiter=RateLimiter(rate=20)
+    )
+    specs = [RequestSpec("/sources", params={"page": page}) for page in range(5)]
+
+    start = time.perf_counter()
+    results = api_client.map(specs, max_workers=len(specs))
+    total = time.perf_counter() - start
+
+    # The last request waits for 4 tokens, at 20 per second.
+    assert total >= 0.15
+    assert all(result.response is not None for result in results)
+    actual_max_elapsed = max(result.elapsed for result in results)
+    expected_max_elapsed = 0.1
+    assert actual_max_elapsed < expected_max_elapsed
+
+
+@pytest.mark.asyncio
+async def test_async_map_elapsed_leaves_out_the_rate_limiter_wait() -> None:
+    """Test that the async client waits for the limiter, out of the mapped times."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+    )
+    api_client = AsyncAPIClient(
+        BASE_URL, transport=transport, rate_limiter=RateLimiter(rate=20)
+    )
+    specs = [RequestSpec("/sources", params={"page": page}) for page in range(5)]
+
+    start = time.perf_counter()
+    results = await api_client.map(specs, max_concurrency=len(specs))
+    total = time.perf_counter() - start
+
+    # The last request waits for 4 tokens, at 20 per second.
+    assert total >= 0.15
+    assert all(result.response is not None for result in results)
+    actual_max_elapsed = max(result.elapsed for result in results)
+    expected_max_elapsed = 0.1
+    assert actual_max_elapsed < expected_max_elapsed
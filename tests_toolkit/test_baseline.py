@@ -0,0 +1,68 @@
+"""Module containing test cases for the comparison of the benchmark baselines."""
+
+import pytest
+
+from benchmarks.baseline import compare, mann_whitney_greater
+
+FAST = [10, 12, 11, 13, 12, 11, 10, 12, 13, 11]
+SLOW = [14, 15, 13, 16, 15, 14, 17, 15, 14, 16]
+
+
+# Checked against `scipy.stats.mannwhitneyu(run, baseline, alternative="greater",
+# method="asymptotic")` of SciPy 1.17.1, whose U statistic is in the comments.
+@pytest.mark.parametrize(
+    ("baseline", "run", "expected_p_value"),
+    [
+        # U = 99
+        (FAST, SLOW, 0.00010909867839654794),
+        # U = 1
+        (SLOW, FAST, 0.9999194117260863),
+        # U = 72, with ties across the samples.
+        (
+            [1, 2, 2, 3, 3, 3, 4, 4, 5, 5],
+            [2, 3, 3, 4, 4, 5, 5, 5, 6, 6],
+            0.048464117905655066,
+        ),
+        # U = 55
+        (list(range(1, 20, 2)), list(range(2, 21, 2)), 0.3668649978481236),
+        # U = 50, every sample equal.
+        ([7] * 10, [7] * 10, 1.0),
+    ],
+    ids=["slower", "faster", "ties", "interleaved", "equal"],
+)
+def test_mann_whitney_greater_matches_scipy(
+    baseline: list[int], run: list[int], expected_p_value: float
+) -> None:
+    """Test the p-values of the one-sided test against the ones of SciPy."""
+    actual_p_value = mann_whitney_greater(baseline, run)
+    assert actual_p_value == pytest.approx(expected_p_value, rel=1e-9)
+
+
+def test_compare_flags_a_regression_but_not_noise() -> None:
+    """Test that a slower run regresses, and a run as fast with noise does not."""
+    baseline = {
+        "test_slower": [sample * 1000 for sample in FAST * 3],
+        "test_noisy": [sample * 1000 for sample in FAST * 3],
+        "test_outlier": [sample * 1000 for sample in FAST * 3],
+        "test_removed": [1000],
+    }
+    run = {
+        # 30% slower on every sample.
+        "test_slower": [sample * 1300 for sample in FAST * 3],
+        # The same samples, shuffled, one microsecond apart.
+        "test_noisy": [sample * 1000 + 1 for sample in reversed(FAST * 3)],
+        # The same samples, but for a few very slow rounds of a busy machine.
+        "test_outlier": [sample * 1000 for sample in FAST * 3][:-3] + [90_000] * 3,
+        "test_added": [1000],
+    }
+
+    comparisons = {comparison.name: comparison for comparison in compare(baseline, run)}
+
+    assert set(comparisons) == {"test_slower", "test_noisy", "test_outlier"}
+    actual_regressions = {
+        name for name, comparison in comparisons.items() if comparison.is_regression()
+    }
+    expected_regressions = {"test_slower"}
+    assert actual_regressions == expected_regressions
+    assert comparisons["test_slower"].change == pytest.approx(0.3)
+    assert comparisons["test_slower"].median_us == pytest.approx(14.95)
@@ -0,0 +1,176 @@
+"""Module containing test cases for the asynchronous steps of `pytest-bdd`."""
+
+import asyncio
+import inspect
+from collections.abc import Generator
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import AsyncAPIClient
+from toolkit.bridge import AsyncBridge
+from toolkit.plugins.bdd import BRIDGE_FIXTURE, async_step
+
+pytest_plugins = ["pytester"]
+
+
+async def running_loop() -> asyncio.AbstractEventLoop:
+    """Return the loop running the coroutine."""
+    return asyncio.get_running_loop()
+
+
+@pytest.fixture
+def bridge() -> Generator[AsyncBridge, None, None]:
+    """Fixture to provide a bridge to a client answering every request."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+    )
+    with AsyncBridge(AsyncAPIClient(BASE_URL, transport=transport)) as bridge:
+        yield bridge
+
+
+def test_async_step_requests_the_bridge(bridge: AsyncBridge) -> None:
+    """Test that the step takes the bridge first, and runs the coroutine on it."""
+
+    async def given_country(country: str) -> tuple[str, asyncio.AbstractEventLoop]:
+        return country, asyncio.get_running_loop()
+
+    step = async_step(given_country)
+
+    actual_params = list(inspect.signature(step).parameters)
+    expected_params = [BRIDGE_FIXTURE, "country"]
+    assert actual_params == expected_params
+    country, loop = step(**{BRIDGE_FIXTURE: bridge, "country": "us"})
+    assert country == "us"
+    assert loop is bridge.run(running_loop())
+
+
+def test_async_step_keeps_a_requested_bridge(bridge: AsyncBridge) -> None:
+    """Test that a step asking for the bridge itself gets it, and no second one."""
+
+    async def when_requested(async_bridge: AsyncBridge, endpoint: str) -> int:
+        response = await async_bridge.api_client.get(endpoint)
+        return response.status_code
+
+    step = async_step(when_requested)
+
+    actual_params = list(inspect.signature(step).parameters)
+    expected_params = [BRIDGE_FIXTURE, "endpoint"]
+    assert actual_params == expected_params
+    assert step(**{BRIDGE_FIXTURE: bridge, "endpoint": "/sources"}) == HTTPStatus.OK
+
+
+FEATURE = """
+Feature: Headlines
+    Scenario: Resolved steps
+        Given the country us
+        When the headlines are requested
+        Then 1 request is sent on the loop of the bridge
+
+    Scenario: Ambiguous step
+        Given a page of 20 articles
+        Then the page comes from the test module
+
+    Scenario: Missing step
+        Given a step nobody wrote
+"""
+
+CONFTEST = """
+from pytest_bdd import given, parsers
+
+
+@given(parsers.parse("a page of {size:d} articles"), target_fixture="page")
+def given_any_page(size):
+    return "conftest", size
+"""
+
+STEPS = """
+import asyncio
+from http import HTTPStatus
+
+import httpx
+import pytest
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from toolkit import AsyncAPIClient
+from toolkit.plugins.bdd import async_step
+
+scenarios("headlines.feature")
+
+sent = []
+
+
+def handler(request):
+    sent.append(request)
+    return httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    return AsyncAPIClient(
+        "https://news.test/v2", transport=httpx.MockTransport(handler)
+    )
+
+
+@given(parsers.parse("the country {country}"), target_fixture="country")
+@async_step
+async def given_country(country):
+    return country
+
+
+@when("the headlines are requested", target_fixture="response")
+@async_step
+async def when_requested(api_client, country):
+    response = await api_client.get("/top-headlines", params={"country": country})
+    return response, asyncio.get_running_loop()
+
+
+async def running_loop():
+    return asyncio.get_running_loop()
+
+
+@then(parsers.parse("{count:d} request is sent on the loop of the bridge"))
+def then_sent(count, response, async_bridge):
+    response, loop = response
+    assert response.status_code == HTTPStatus.OK
+    assert len(sent) == count
+    assert sent[0].url.params["country"] == "us"
+    assert loop is async_bridge.run(running_loop())
+
+
+@given("a page of 20 articles", target_fixture="page")
+def given_first_page():
+    return "module", 20
+
+
+@then("the page comes from the test module")
+def then_module_page(page):
+    assert page == ("module", 20)
+"""
+
+
+def test_steps_are_resolved_from_the_feature(pytester: pytest.Pytester) -> None:
+    """Test that the closest matching steps run, and that a missing one fails."""
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_mode = auto
+        asyncio_default_fixture_loop_scope = function
+        """
+    )
+    pytester.makefile(".feature", headlines=FEATURE)
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_headlines=STEPS)
+
+    result = pytester.runpytest("-p", "toolkit.plugins.bdd", "-p", "no:randomly")
+
+    result.assert_outcomes(passed=2, failed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*StepDefinitionNotFoundError: Step definition is not found: "
+            'Given "a step nobody wrote"*',
+            "FAILED test_headlines.py::test_missing_step*",
+        ]
+    )
@@ -0,0 +1,106 @@
+"""Module containing test cases for the `AsyncBridge`."""
+
+from collections.abc import Generator
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import APIClient, AsyncAPIClient, AsyncBridge, RequestValidator
+
+
+class CountingValidator(RequestValidator):
+    """Validator counting the requests it validates."""
+
+    calls = 0
+
+    def validate(
+        self, endpoint: str, params: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Count the call, then validate the params."""
+        self.calls += 1
+        return super().validate(endpoint, params)
+
+
+@pytest.fixture
+def sent() -> list[httpx.Request]:
+    """Fixture to provide the list of the requests received by the transport."""
+    return []
+
+
+@pytest.fixture
+def validator() -> CountingValidator:
+    """Fixture to provide a validator counting its calls."""
+    return CountingValidator()
+
+
+@pytest.fixture
+def bridge(
+    sent: list[httpx.Request], validator: CountingValidator
+) -> Generator[AsyncBridge, None, None]:
+    """Fixture to provide a bridge to a client recording its requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+
+    async_client = AsyncAPIClient(
+        BASE_URL,
+        timeout=10,
+        default_headers={"X-API-KEY": "async"},
+        transport=httpx.MockTransport(handler),
+        validator=validator,
+    )
+    with AsyncBridge(async_client) as bridge:
+        yield bridge
+
+
+def test_bridged_client_keeps_its_own_settings(
+    bridge: AsyncBridge, sent: list[httpx.Request]
+) -> None:
+    """Test that the bridged requests use the URL, headers and timeout of the client."""
+    api_client = APIClient(
+        "https://other.test/v1/",
+        timeout=3,
+        default_headers={"X-API-KEY": "sync"},
+        bridge=bridge,
+    )
+
+    api_client.get("/sources", headers={"X-Trace": "1"}, params={"country": "us"})
+
+    (request,) = sent
+    actual_url = str(request.url)
+    expected_url = "https://other.test/v1/sources?country=us"
+    assert actual_url == expected_url
+    assert request.headers["X-API-KEY"] == "sync"
+    assert request.headers["X-Trace"] == "1"
+    assert request.extensions["timeout"]["read"] == 3
+
+
+def test_sync_client_takes_the_settings_of_the_bridged_client(
+    bridge: AsyncBridge, sent: list[httpx.Request]
+) -> None:
+    """Test that `sync_client` sends the requests like the bridged client would."""
+    api_client = bridge.sync_client()
+    api_client.get("/sources")
+
+    (request,) = sent
+    assert str(request.url) == f"{BASE_URL}/sources"
+    assert request.headers["X-API-KEY"] == "async"
+    assert api_client.validator is bridge.api_client.validator
+    assert api_client.profiler is bridge.api_client.profiler
+
+
+def test_bridged_requests_are_validated_once(
+    bridge: AsyncBridge, sent: list[httpx.Request], validator: CountingValidator
+) -> None:
+    """Test that a bridged request is validated by the sync client only."""
+    bridge.sync_client().get("/top-headlines", params={"country": "us"})
+    APIClient(BASE_URL, validator=validator, bridge=bridge).get(
+        "/top-headlines", params={"country": "us"}
+    )
+
+    assert validator.calls == 2
+    assert len(sent) == 2
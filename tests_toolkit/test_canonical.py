@@ -0,0 +1,104 @@
+"""Module containing test cases for the canonical form of the requests."""
+
+from typing import Any
+
+import pytest
+
+from toolkit.canonical import (
+    canonical_endpoint,
+    canonical_query,
+    canonical_value,
+    request_key,
+)
+
+
+@pytest.mark.parametrize(
+    ("name", "value", "expected_value"),
+    [
+        ("q", "bitcoin+price", "bitcoin price"),
+        ("q", "+bitcoin -price", "+bitcoin -price"),
+        ("q", "bitcoin ++price", "bitcoin ++price"),
+        ("q", "  bitcoin \n price ", "bitcoin price"),
+        ("qInTitle", "crypto+news", "crypto news"),
+        ("sortBy", "a+b", "a+b"),
+        ("sources", "cnn, BBC-News,cnn", "bbc-news,cnn"),
+        ("sources", ["cnn", "bbc-news", None], "bbc-news,cnn"),
+        ("domains", {"wsj.com", "bbc.co.uk"}, "bbc.co.uk,wsj.com"),
+        ("searchIn", ("title", "content", ""), "content,title"),
+        ("searchIn", "Title", "Title"),
+        ("page", 1, None),
+        ("page", "1", None),
+        ("page", 2, "2"),
+        ("pageSize", 1, "1"),
+        ("q", None, None),
+        ("includeDomains", True, "true"),
+    ],
+)
+def test_canonical_value(name: str, value: Any, expected_value: str | None) -> None:
+    """Test the canonical string of the param values."""
+    actual_value = canonical_value(name, value)
+    assert actual_value == expected_value
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "expected_endpoint"),
+    [
+        ("/everything", "/everything"),
+        ("everything/", "/everything"),
+        (" //top-headlines/sources/ ", "/top-headlines/sources"),
+    ],
+)
+def test_canonical_endpoint(endpoint: str, expected_endpoint: str) -> None:
+    """Test that the endpoints have one leading slash and no trailing one."""
+    assert canonical_endpoint(endpoint) == expected_endpoint
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (
+            ("/everything", {"q": "bitcoin", "sortBy": "publishedAt"}),
+            ("everything", {"sortBy": "publishedAt", "q": "bitcoin"}),
+        ),
+        (
+            ("/everything", {"q": "bitcoin+price", "page": 1}),
+            ("/everything", {"q": "bitcoin price"}),
+        ),
+        (
+            ("/top-headlines", {"sources": "cnn,bbc-news", "pageSize": 20}),
+            ("/top-headlines", {"sources": ["bbc-news", "CNN"], "pageSize": "20"}),
+        ),
+    ],
+)
+def test_equivalent_requests_share_a_key(
+    first: tuple[str, dict[str, Any]], second: tuple[str, dict[str, Any]]
+) -> None:
+    """Test that equivalent requests have the same canonical form and key."""
+    assert canonical_query(*first) == canonical_query(*second)
+    assert request_key(*first) == request_key(*second)
+
+
+@pytest.mark.parametrize(
+    ("first", "second"),
+    [
+        (("/everything", {"q": "+bitcoin"}), ("/everything", {"q": "bitcoin"})),
+        (("/everything", {"q": "ai", "page": 2}), ("/everything", {"q": "ai"})),
+        (("/everything", {"q": "ai"}), ("/top-headlines", {"q": "ai"})),
+    ],
+)
+def test_different_requests_have_different_keys(
+    first: tuple[str, dict[str, Any]], second: tuple[str, dict[str, Any]]
+) -> None:
+    """Test that requests the API answers differently do not share a key."""
+    assert request_key(*first) != request_key(*second)
+    assert request_key(*first) != request_key(*first, method="POST")
+
+
+def test_canonical_query_is_a_readable_relative_url() -> None:
+    """Test the canonical form of a request, and of one without params."""
+    actual_query = canonical_query(
+        "everything/", {"sources": "cnn,bbc-news", "q": "bitcoin price", "page": 1}
+    )
+    expected_query = "/everything?q=bitcoin+price&sources=bbc-news%2Ccnn"
+    assert actual_query == expected_query
+    assert canonical_query("/sources", {"page": 1}) == "/sources"
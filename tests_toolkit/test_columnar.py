@@ -0,0 +1,110 @@
+"""Module containing test cases for the columnar `ArticleStore`."""
+
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from toolkit import ArticleStore
+from toolkit.transports import make_article
+
+
+def make_articles(count: int) -> list[dict[str, Any]]:
+    """Return synthetic articles shaped like the ones of the API."""
+    return [cast(dict[str, Any], make_article(index)) for index in range(count)]
+
+
+@pytest.fixture
+def articles() -> list[dict[str, Any]]:
+    """Fixture to provide articles shaped like the ones of the API."""
+    articles = make_articles(10)
+    articles[3]["author"] = None
+    articles[4]["source"]["id"] = "bbc-news"
+    articles[5]["publishedAt"] = None
+    return articles
+
+
+def test_round_trip_of_articles(articles: list[dict[str, Any]]) -> None:
+    """Test that the articles come back from the store unchanged."""
+    store = ArticleStore.from_articles(articles)
+
+    actual_articles = list(store)
+    expected_articles = articles
+    assert actual_articles == expected_articles
+    assert len(store) == len(articles)
+    assert store[-1] == articles[-1]
+
+
+def test_slices_and_filters(articles: list[dict[str, Any]]) -> None:
+    """Test that slicing and filtering return the matching articles as stores."""
+    store = ArticleStore.from_articles(articles)
+
+    assert list(store[2:5]) == articles[2:5]
+    assert list(store[::3]) == articles[::3]
+    assert list(store[8:2]) == []
+
+    actual_authors = [article["author"] for article in store.where("author", bool)]
+    expected_authors = [
+        article["author"] for article in articles if article["author"] is not None
+    ]
+    assert actual_authors == expected_authors
+
+    mask = [index % 2 == 0 for index in range(len(articles))]
+    assert list(store.filter(mask)) == articles[::2]
+
+
+def test_timestamps_are_stored_as_epoch_seconds(
+    articles: list[dict[str, Any]],
+) -> None:
+    """Test that `publishedAt` is kept as epoch seconds, nulls included."""
+    store = ArticleStore.from_articles(articles)
+    column = store.columns["published_at"]
+
+    actual_null_count = column.null_count
+    expected_null_count = 1
+    assert actual_null_count == expected_null_count
+    assert column[0] == 1735689600  # 2025-01-01T00:00:00Z
+    assert column[5] is None
+
+
+def test_memory_grows_with_the_text_only() -> None:
+    """Test that the store holds the text of the articles and fixed-size offsets."""
+    articles = make_articles(1_000)
+    store = ArticleStore.from_articles(articles)
+
+    text_bytes = sum(
+        len((value or "").encode())
+        for article in articles
+        for value in (
+            article["source"]["name"],
+            article["author"],
+            article["title"],
+            article["description"],
+            article["url"],
+            article["urlToImage"],
+            article["content"],
+        )
+    )
+    # Every article adds an int64 offset and a validity byte to the 8 string
+    # columns and an int64 and a validity byte to the timestamps; the string
+    # columns start with a zero offset.
+    per_article_overhead = 8 * (8 + 1) + (8 + 1)
+    actual_nbytes = store.nbytes
+    expected_nbytes = text_bytes + len(articles) * per_article_overhead + 8 * 8
+    assert actual_nbytes == expected_nbytes
+
+
+def test_parquet_round_trip(articles: list[dict[str, Any]], tmp_path: Path) -> None:
+    """Test that the Parquet export holds every article."""
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    store = ArticleStore.from_articles(articles)
+    path = tmp_path / "articles.parquet"
+    store.write_parquet(path)
+
+    table = pyarrow.parquet.read_table(path)
+    actual_urls = table.column("url").to_pylist()
+    expected_urls = [article["url"] for article in articles]
+    assert actual_urls == expected_urls
+    assert table.column("published_at").null_count == 1
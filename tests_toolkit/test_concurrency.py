@@ -0,0 +1,161 @@
+"""Module containing test cases for the concurrent runner of the async tests."""
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+TESTS = """
+import asyncio
+
+import pytest
+
+started = []
+
+
+@pytest.fixture(scope="session")
+def shared():
+    return "shared"
+
+
+@pytest.mark.parametrize("name", ["a", "b"])
+async def test_concurrent(shared, name):
+    started.append(name)
+    await asyncio.sleep(0.05)
+    # The other test started meanwhile, as they run together.
+    assert sorted(started) == ["a", "b"]
+
+
+@pytest.mark.taken_over
+async def test_taken_over(shared):
+    raise AssertionError("The test was called without its plugin.")
+"""
+
+PLUGIN = """
+import pytest
+
+
+class CallTaker:
+    call_markers = ("taken_over",)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        if pyfuncitem.get_closest_marker("taken_over") is None:
+            return None
+        return True
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(CallTaker(), "call-taker")
+"""
+
+
+def test_tests_taken_over_by_a_plugin_run_alone(pytester: pytest.Pytester) -> None:
+    """Test that the tests of `call_markers` are called by their plugin alone."""
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_mode = auto
+        asyncio_default_fixture_loop_scope = function
+        markers = taken_over: tests called by a plugin
+        """
+    )
+    pytester.makepyfile(call_taker=PLUGIN, test_calls=TESTS)
+    pytester.syspathinsert()
+
+    result = pytester.runpytest(
+        "-p",
+        "call_taker",
+        "-p",
+        "toolkit.plugins.concurrency",
+        "-p",
+        "no:randomly",
+        "--async-concurrency",
+        "2",
+    )
+
+    result.assert_outcomes(passed=3)
+
+
+OUTCOMES = """
+import asyncio
+
+import pytest
+
+started = []
+
+
+@pytest.fixture(scope="session")
+def shared():
+    return "shared"
+
+
+async def wait_for_all(name):
+    started.append(name)
+    # Every test of the batch starts before any of them ends.
+    for _ in range(100):
+        if len(started) == 5:
+            return
+        await asyncio.sleep(0.01)
+    raise RuntimeError("The test ran alone.")
+
+
+async def test_passing(shared):
+    await wait_for_all("passing")
+
+
+async def test_failing(shared):
+    await wait_for_all("failing")
+    assert shared == "other"
+
+
+async def test_skipping(shared):
+    await wait_for_all("skipping")
+    pytest.skip("not today")
+
+
+@pytest.mark.xfail(strict=True, reason="expected to fail")
+async def test_strict_xpass(shared):
+    await wait_for_all("strict_xpass")
+
+
+@pytest.mark.xfail(reason="expected to fail")
+async def test_xfail(shared):
+    await wait_for_all("xfail")
+    raise ValueError("failed as expected")
+"""
+
+
+def test_outcomes_of_a_concurrent_batch_are_isolated(
+    pytester: pytest.Pytester,
+) -> None:
+    """Test that every test of a batch gets its own outcome and report."""
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_mode = auto
+        asyncio_default_fixture_loop_scope = function
+        """
+    )
+    pytester.makepyfile(test_outcomes=OUTCOMES)
+
+    result = pytester.runpytest(
+        "-p",
+        "toolkit.plugins.concurrency",
+        "-p",
+        "no:randomly",
+        "-rA",
+        "--async-concurrency",
+        "5",
+    )
+
+    result.assert_outcomes(passed=1, failed=2, skipped=1, xfailed=1)
+    result.stdout.fnmatch_lines_random(
+        [
+            "PASSED test_outcomes.py::test_passing",
+            "FAILED test_outcomes.py::test_failing - AssertionError*",
+            "SKIPPED [[]1[]] test_outcomes.py:*: not today",
+            "[[]XPASS(strict)[]] expected to fail",
+            "FAILED test_outcomes.py::test_strict_xpass",
+            "XFAIL test_outcomes.py::test_xfail - expected to fail",
+        ]
+    )
@@ -0,0 +1,120 @@
+"""Module containing test cases for the `ParallelCrawler`."""
+
+import json
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import AsyncAPIClient, ParallelCrawler
+from toolkit.crawler import CrawlResult, process_page
+
+PAGES = 4
+
+
+def make_article(number: int) -> dict[str, Any]:
+    """Return a valid article."""
+    return {
+        "url": f"https://news.test/{number}",
+        "title": f"Article {number}",
+        "publishedAt": f"2025-01-01T00:{number:02d}:00Z",
+        "source": {"id": None, "name": "News"},
+    }
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """
+    Answer a page of ten articles, the last five of which are on the next page too.
+
+    Every page also has an article without a title, and the page `fail` fails.
+    """
+    page = int(request.url.params["page"])
+    if request.url.params.get("fail") == str(page):
+        raise httpx.ConnectError("Connection refused", request=request)
+    articles = [make_article(number) for number in range(5 * page, 5 * page + 10)]
+    articles.append({**make_article(99), "title": ""})
+    return httpx.Response(
+        HTTPStatus.OK, content=json.dumps({"status": "ok", "articles": articles})
+    )
+
+
+def requests(**params: Any) -> list[tuple[str, dict[str, Any]]]:
+    """Return the requests of every page."""
+    return [("/everything", {"page": page, **params}) for page in range(PAGES)]
+
+
+async def crawl(params: dict[str, Any] | None = None, **options: Any) -> CrawlResult:
+    """Crawl every page with a crawler answered by the handler."""
+    api_client = AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler))
+    crawler = ParallelCrawler(api_client, **options)
+    return await crawler.crawl(requests(**(params or {})))
+
+
+@pytest.mark.parametrize(
+    ("content", "expected_failed", "expected_invalid"),
+    [
+        (b"not json", True, 0),
+        (b'{"status": "error", "code": "rateLimited"}', True, 0),
+        (
+            json.dumps(
+                {
+                    "status": "ok",
+                    "articles": [
+                        make_article(1),
+                        {**make_article(2), "url": None},
+                        {**make_article(3), "publishedAt": "yesterday"},
+                    ],
+                }
+            ).encode(),
+            False,
+            2,
+        ),
+    ],
+)
+def test_process_page_of_failed_and_invalid_pages(
+    content: bytes, expected_failed: bool, expected_invalid: int
+) -> None:
+    """Test that bad bodies fail the page, and bad articles are only counted."""
+    page = process_page(content)
+
+    assert page.failed == expected_failed
+    assert page.invalid == expected_invalid
+    assert len(page.rows) == len(page.fingerprints) == (0 if page.failed else 1)
+
+
+@pytest.mark.asyncio
+async def test_crawl_counts_the_pages_and_the_duplicates() -> None:
+    """Test that the overlapping articles are kept once, and the bad ones counted."""
+    result = await crawl(workers=0)
+
+    assert (result.pages, result.failed_pages) == (PAGES, 0)
+    assert result.invalid == PAGES
+    actual_counts = (len(result.store), result.duplicates)
+    expected_counts = (5 * PAGES + 5, 5 * (PAGES - 1))
+    assert actual_counts == expected_counts
+
+
+@pytest.mark.asyncio
+async def test_failed_request_only_fails_its_page() -> None:
+    """Test that a request error is counted, and the other pages still crawled."""
+    result = await crawl({"fail": 0}, workers=0)
+
+    assert (result.pages, result.failed_pages) == (PAGES, 1)
+    assert len(result.store) == 5 * PAGES
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("buffer_size", [2**16, 1], ids=["shared", "oversize"])
+async def test_workers_give_the_result_of_the_event_loop(buffer_size: int) -> None:
+    """Test that the process pool, with or without shared memory, changes nothing."""
+    expected_result = await crawl(workers=0)
+
+    actual_result = await crawl(workers=2, buffer_size=buffer_size)
+
+    assert sorted(actual_result.store, key=lambda article: article["url"]) == sorted(
+        expected_result.store, key=lambda article: article["url"]
+    )
+    assert actual_result.duplicates == expected_result.duplicates
+    assert actual_result.invalid == expected_result.invalid
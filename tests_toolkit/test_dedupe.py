@@ -0,0 +1,115 @@
+"""Module containing test cases for the article deduplication."""
+
+import random
+
+import pytest
+
+from toolkit import ArticleDeduplicator, DedupeModeEnum
+from toolkit.dedupe import BloomFilter, FingerprintSet, fingerprint, normalize_url
+
+
+def random_fingerprints(count: int, seed: int) -> list[int]:
+    """Return distinct random non-zero 64-bit fingerprints."""
+    generator = random.Random(seed)
+    values: set[int] = set()
+    while len(values) < count:
+        values.add(generator.getrandbits(64) or 1)
+    return list(values)
+
+
+def test_fingerprint_set_grows_without_losing_values() -> None:
+    """Test that the set keeps every fingerprint across its resizes."""
+    fingerprints = random_fingerprints(10_000, seed=1)
+    fingerprint_set = FingerprintSet(capacity=8)
+    initial_nbytes = fingerprint_set.nbytes
+
+    added = [fingerprint_set.add(value) for value in fingerprints]
+
+    assert all(added)
+    actual_len = len(fingerprint_set)
+    expected_len = len(fingerprints)
+    assert actual_len == expected_len
+    assert all(value in fingerprint_set for value in fingerprints)
+    assert fingerprint_set.nbytes > initial_nbytes
+    # The table is at most half full, and at least a quarter full after a resize.
+    assert 16 * len(fingerprint_set) <= fingerprint_set.nbytes
+    assert fingerprint_set.nbytes <= 32 * len(fingerprint_set)
+
+
+def test_fingerprint_set_rejects_duplicates() -> None:
+    """Test that adding a fingerprint twice reports it as seen."""
+    fingerprint_set = FingerprintSet()
+    fingerprint_set.add(42)
+
+    assert not fingerprint_set.add(42)
+    assert len(fingerprint_set) == 1
+    assert 43 not in fingerprint_set
+    assert 0 not in fingerprint_set
+
+
+def test_fingerprint_set_stores_zero_as_one() -> None:
+    """Test that a zero fingerprint is not taken for an empty slot."""
+    fingerprint_set = FingerprintSet(capacity=8)
+
+    assert fingerprint_set.add(0)
+    assert not fingerprint_set.add(0)
+    assert not fingerprint_set.add(1)
+    assert len(fingerprint_set) == 1
+    assert 0 in fingerprint_set
+    assert 1 in fingerprint_set
+    for value in range(2, 40):
+        fingerprint_set.add(value)
+    assert 0 in fingerprint_set
+    assert len(fingerprint_set) == 39
+
+
+def test_bloom_filter_false_positive_rate() -> None:
+    """Test that the Bloom filter stays near its target false positive rate."""
+    capacity, error_rate = 20_000, 0.01
+    fingerprints = random_fingerprints(2 * capacity, seed=2)
+    added, unseen = fingerprints[:capacity], fingerprints[capacity:]
+    bloom_filter = BloomFilter(capacity, error_rate)
+    for value in added:
+        bloom_filter.add(value)
+
+    # No false negatives.
+    assert all(value in bloom_filter for value in added)
+
+    actual_rate = sum(value in bloom_filter for value in unseen) / len(unseen)
+    expected_max_rate = 2 * error_rate
+    assert actual_rate <= expected_max_rate
+
+
+@pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 0), (10, 1)])
+def test_bloom_filter_invalid_params(capacity: int, error_rate: float) -> None:
+    """Test that an invalid capacity or error rate is refused."""
+    with pytest.raises(ValueError):
+        BloomFilter(capacity, error_rate)
+
+
+def test_normalize_url_drops_tracking_and_presentation_details() -> None:
+    """Test that variants of the same article URL are normalized to one string."""
+    actual_url = normalize_url(
+        "https://www.Example.com/news/1/?utm_source=feed&b=2&a=1&fbclid=x#comments"
+    )
+    expected_url = "//example.com/news/1?a=1&b=2"
+    assert actual_url == expected_url
+
+
+@pytest.mark.parametrize("mode", list(DedupeModeEnum))
+def test_deduplicator_filters_repeated_articles(mode: DedupeModeEnum) -> None:
+    """Test that repeated articles are dropped, whatever their URL variant."""
+    deduplicator = ArticleDeduplicator(mode, capacity=100)
+    article = {"url": "https://example.com/a", "title": "Bitcoin  rallies"}
+    variant = {
+        "url": "http://www.example.com/a/?utm_medium=x",
+        "title": "bitcoin RALLIES",
+    }
+    other = {"url": "https://example.com/b", "title": "Bitcoin rallies"}
+
+    actual_articles = deduplicator.filter([article, variant, other, article])
+    expected_articles = [article, other]
+    assert actual_articles == expected_articles
+    assert fingerprint(article) == fingerprint(variant)
+    assert variant in deduplicator
+    assert len(deduplicator) == 2
@@ -0,0 +1,123 @@
+"""Module containing test cases for the request journal and the job runner."""
+
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import AsyncAPIClient, JournaledJobRunner, RequestJournal
+
+JOB: list[tuple[str, dict[str, Any]]] = [
+    ("/everything", {"q": f"topic-{index}", "page": 1}) for index in range(10)
+]
+
+
+class FlakyAPI:
+    """Fake API answering `fail_after` requests, then only `fail_status`."""
+
+    def __init__(
+        self, fail_after: int, fail_status: int = HTTPStatus.TOO_MANY_REQUESTS
+    ) -> None:
+        """Initialize the fake API."""
+        self.fail_after = fail_after
+        self.fail_status = fail_status
+        self.queries: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request, or refuse it once `fail_after` requests were answered."""
+        if len(self.queries) >= self.fail_after:
+            return httpx.Response(self.fail_status, json={"status": "error"})
+        self.queries.append(request.url.params["q"])
+        return httpx.Response(HTTPStatus.OK, json={"q": request.url.params["q"]})
+
+    def client(self) -> AsyncAPIClient:
+        """Return a client sending its requests to the fake API."""
+        return AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(self.handler))
+
+
+async def run_job(
+    api: FlakyAPI, tmp_path: Path, job: list[tuple[str, dict[str, Any]]] = JOB
+) -> tuple[int, int, int, bool]:
+    """Run the job with a freshly opened journal, like a new process would."""
+    with RequestJournal(tmp_path / "journal.sqlite") as journal:
+        runner = JournaledJobRunner(
+            api.client(), journal, tmp_path / "responses", max_concurrency=1
+        )
+        summary = await runner.run(job)
+    return (
+        len(summary.completed),
+        len(summary.skipped),
+        len(summary.pending),
+        summary.rate_limited,
+    )
+
+
+def test_journal_keeps_entries_across_reopening(tmp_path: Path) -> None:
+    """Test that the recorded requests are found again after a restart."""
+    path = tmp_path / "journal.sqlite"
+    with RequestJournal(path) as journal:
+        key = journal.record(
+            "everything", {"q": "bitcoin", "page": 1}, 200, tmp_path / "a.json"
+        )
+
+    with RequestJournal(path) as journal:
+        assert len(journal) == 1
+        assert journal.is_completed(key)
+        assert journal.request_key("/everything/", {"q": "bitcoin"}) == key
+        (entry,) = journal.entries()
+
+    actual_entry = (entry.endpoint, entry.params, entry.status_code)
+    expected_entry = ("everything", {"q": "bitcoin", "page": 1}, 200)
+    assert actual_entry == expected_entry
+
+
+@pytest.mark.asyncio
+async def test_job_resumes_after_rate_limit(tmp_path: Path) -> None:
+    """Test that a restarted job sends only the requests missing from the journal."""
+    first_api = FlakyAPI(fail_after=4)
+    actual_first_run = await run_job(first_api, tmp_path)
+    expected_first_run = (4, 0, 6, True)
+    assert actual_first_run == expected_first_run
+
+    second_api = FlakyAPI(fail_after=len(JOB))
+    actual_second_run = await run_job(second_api, tmp_path)
+    expected_second_run = (6, 4, 0, False)
+    assert actual_second_run == expected_second_run
+
+    # Every request was answered exactly once over the two runs.
+    actual_queries = sorted(first_api.queries + second_api.queries)
+    expected_queries = sorted(params["q"] for _, params in JOB)
+    assert actual_queries == expected_queries
+    assert len(list((tmp_path / "responses").glob("*.json"))) == len(JOB)
+    assert not list((tmp_path / "responses").glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried_on_the_next_run(tmp_path: Path) -> None:
+    """Test that server errors are left out of the journal without stopping the job."""
+    failing_api = FlakyAPI(fail_after=0, fail_status=HTTPStatus.BAD_GATEWAY)
+    actual_first_run = await run_job(failing_api, tmp_path)
+    expected_first_run = (0, 0, len(JOB), False)
+    assert actual_first_run == expected_first_run
+
+    actual_second_run = await run_job(FlakyAPI(fail_after=len(JOB)), tmp_path)
+    expected_second_run = (len(JOB), 0, 0, False)
+    assert actual_second_run == expected_second_run
+
+
+@pytest.mark.asyncio
+async def test_equivalent_requests_are_sent_once(tmp_path: Path) -> None:
+    """Test that requests differing only in their form share one journal entry."""
+    job: list[tuple[str, dict[str, Any]]] = [
+        ("/everything", {"q": "bitcoin", "sources": "bbc-news,cnn"}),
+        ("everything/", {"sources": "cnn,BBC-News", "q": "bitcoin", "page": 1}),
+    ]
+    api = FlakyAPI(fail_after=len(job))
+
+    actual_run = await run_job(api, tmp_path, job)
+    expected_run = (1, 1, 0, False)
+    assert actual_run == expected_run
+    assert api.queries == ["bitcoin"]
@@ -0,0 +1,116 @@
+"""Module containing test cases for the latency objectives plugin."""
+
+import pytest
+
+pytest_plugins = ["pytester"]
+
+TESTS = """
+import httpx
+import pytest
+
+from toolkit.plugins import fresh_responses
+
+calls = []
+
+
+def handler(request):
+    return httpx.Response(200, json={"status": "ok"})
+
+
+@pytest.fixture(scope="session")
+def client():
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.latency(p95_ms=10_000, samples=6, concurrency=3)
+async def test_async(client):
+    calls.append("async")
+    assert fresh_responses.get()
+    await client.get("https://news.test/")
+
+
+@pytest.mark.latency(max_ms=10_000, samples=4, concurrency=2)
+def test_sync():
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        client.get("https://news.test/")
+        client.get("https://news.test/")
+
+
+@pytest.mark.latency(p50_ms=0, samples=2)
+async def test_breached(client):
+    await client.get("https://news.test/")
+
+
+@pytest.mark.latency(samples=2)
+async def test_without_requests(client):
+    pass
+
+
+async def test_plain(client):
+    await client.get("https://news.test/")
+
+
+def test_called_repeatedly():
+    assert calls == ["async"] * 6
+"""
+
+
+@pytest.mark.parametrize(
+    "options", [[], ["--async-concurrency", "2"]], ids=["serial", "concurrent"]
+)
+def test_latency_tests_are_repeated_and_reported(
+    pytester: pytest.Pytester, options: list[str]
+) -> None:
+    """Test that the latency tests are checked and reported, run concurrently or not."""
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_mode = auto
+        asyncio_default_fixture_loop_scope = function
+        markers = latency: latency objectives
+        """
+    )
+    pytester.makepyfile(test_timed=TESTS)
+
+    result = pytester.runpytest(
+        "-p",
+        "toolkit.plugins.latency",
+        "-p",
+        "toolkit.plugins.concurrency",
+        "-p",
+        "no:randomly",
+        *options,
+    )
+
+    result.assert_outcomes(passed=4, failed=2)
+    result.stdout.fnmatch_lines(
+        [
+            "*Latency objective breached: p50 * ms > 0 ms*",
+            "*The latency test sent no request.*",
+            "*- latency -*",
+            "*test_async: 6 requests in 6 calls (concurrency 3)*",
+            "*test_sync: 8 requests in 4 calls (concurrency 2)*",
+        ]
+    )
+
+
+def test_no_latency_calls_the_tests_once(pytester: pytest.Pytester) -> None:
+    """Test that with `--no-latency` the tests are called once, unchecked."""
+    pytester.makeini(
+        """
+        [pytest]
+        asyncio_mode = auto
+        asyncio_default_fixture_loop_scope = function
+        markers = latency: latency objectives
+        """
+    )
+    pytester.makepyfile(test_timed=TESTS.replace('["async"] * 6', '["async"]'))
+
+    result = pytester.runpytest(
+        "-p", "toolkit.plugins.latency", "-p", "no:randomly", "--no-latency"
+    )
+
+    # Only `test_async` fails, as its responses are no longer signaled fresh.
+    result.assert_outcomes(passed=5, failed=1)
+    result.stdout.fnmatch_lines(["FAILED test_timed.py::test_async*"])
+    result.stdout.no_fnmatch_line("*- latency -*")
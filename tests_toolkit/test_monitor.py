@@ -0,0 +1,129 @@
+"""Module containing test cases for the API monitor and its sample store."""
+
+import time
+from collections.abc import Generator
+from datetime import timedelta
+from http import HTTPStatus
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import APIMonitor, AsyncAPIClient, SampleStore
+from toolkit.monitor import Sample
+
+DAY = timedelta(days=1)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Generator[SampleStore, None, None]:
+    """Fixture to provide an empty sample store."""
+    store = SampleStore(tmp_path / "monitor.sqlite")
+    yield store
+    store.close()
+
+
+def make_samples(
+    latencies: list[float], status_code: int = HTTPStatus.OK, age: float = 0.0
+) -> list[Sample]:
+    """Return samples of `/everything` with the given latencies, `age` seconds old."""
+    timestamp = time.time() - age
+    return [
+        Sample(timestamp, "/everything", status_code, latency, 100)
+        for latency in latencies
+    ]
+
+
+def test_percentiles_use_the_nearest_rank(store: SampleStore) -> None:
+    """Test that the percentiles of the successful probes are the ranked latencies."""
+    store.record(make_samples([float(latency) for latency in range(100, 0, -1)]))
+    store.record(make_samples([10_000.0], status_code=HTTPStatus.BAD_GATEWAY))
+
+    actual_percentiles = store.percentiles("/everything", DAY, (50, 95, 99, 100))
+    expected_percentiles = {50: 50.0, 95: 95.0, 99: 99.0, 100: 100.0}
+    assert actual_percentiles == expected_percentiles
+    assert store.percentiles("/sources", DAY) == {}
+
+
+def test_error_rate_counts_failed_and_error_probes(store: SampleStore) -> None:
+    """Test that error responses and failed requests both count as errors."""
+    store.record(make_samples([1.0] * 8))
+    store.record(make_samples([1.0], status_code=HTTPStatus.TOO_MANY_REQUESTS))
+    store.record(make_samples([1.0], status_code=0))
+
+    actual_error_rate = store.error_rate("/everything", DAY)
+    expected_error_rate = 0.2
+    assert actual_error_rate == pytest.approx(expected_error_rate)
+    assert store.error_rate("/sources", DAY) == 0.0
+
+    (summary,) = store.summary(DAY)
+    assert summary.samples == 10
+
+
+def test_samples_past_the_retention_are_dropped(tmp_path: Path) -> None:
+    """Test that recording drops the old samples, and windows leave them out."""
+    store = SampleStore(tmp_path / "monitor.sqlite", retention=timedelta(days=30))
+    store.record(make_samples([1.0], age=timedelta(days=40).total_seconds()))
+    store.record(make_samples([2.0], age=timedelta(days=2).total_seconds()))
+    store.record(make_samples([3.0]))
+
+    assert [sample.latency_ms for sample in store.samples("/everything", DAY)] == [3.0]
+    actual_latencies = [
+        sample.latency_ms for sample in store.samples("/everything", 60 * DAY)
+    ]
+    expected_latencies = [2.0, 3.0]
+    assert actual_latencies == expected_latencies
+    store.close()
+
+
+def test_interval_fits_the_daily_quota(store: SampleStore) -> None:
+    """Test that the probes are spread so they stay within the daily quota."""
+    api_client = AsyncAPIClient(BASE_URL)
+
+    monitor = APIMonitor(api_client, store, daily_quota=48)
+    # 3 probes per round, 16 rounds per day.
+    assert monitor.interval == timedelta(hours=1.5)
+    monitor = APIMonitor(api_client, store, daily_quota=None)
+    assert monitor.interval == timedelta(minutes=15)
+    with pytest.raises(ValueError):
+        APIMonitor(api_client, store, daily_quota=0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_probes_back_off(store: SampleStore) -> None:
+    """Test that a rate limited round doubles the delay, and a success resets it."""
+    status_codes = [HTTPStatus.TOO_MANY_REQUESTS] * 7 + [HTTPStatus.OK]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_codes[0], json={"status": "ok"})
+
+    api_client = AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler))
+    monitor = APIMonitor(api_client, store, daily_quota=None)
+
+    delays = []
+    while status_codes:
+        await monitor.probe_all()
+        delays.append(monitor.next_delay)
+        status_codes.pop(0)
+
+    actual_hours = [delay / timedelta(hours=1) for delay in delays]
+    expected_hours = [0.5, 1, 2, 4, 8, 16, 16, 0.25]
+    assert actual_hours == expected_hours
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_is_recorded_as_an_error(store: SampleStore) -> None:
+    """Test that a probe whose request fails is recorded with status code 0."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    api_client = AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler))
+    monitor = APIMonitor(api_client, store, daily_quota=None)
+
+    samples = await monitor.probe_all()
+
+    assert {sample.status_code for sample in samples} == {0}
+    assert all(sample.is_error for sample in samples)
+    assert store.error_rate("/everything", DAY) == 1.0
@@ -0,0 +1,88 @@
+"""Module containing test cases for the `QueryPlanner`."""
+
+from datetime import timedelta
+
+import pytest
+
+from tests_toolkit.conftest import START, FakeNewsAPI
+from toolkit import AsyncAPIClient, QueryPlanner
+
+QUERY = {"q": "bitcoin"}
+
+
+@pytest.mark.asyncio
+async def test_plan_splits_windows_over_the_results_cap(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient
+) -> None:
+    """Test that the shards fit under the cap and cover the window without gaps."""
+    fake_api.publish(250)
+    end = START + timedelta(minutes=249)
+    planner = QueryPlanner(fake_client)
+
+    shards = await planner.plan(QUERY, START, end)
+
+    assert len(shards) > 1
+    assert all(shard.total_results <= planner.max_results for shard in shards)
+    assert not any(shard.truncated for shard in shards)
+    assert shards[0].start == START
+    assert shards[-1].end == end
+    for previous, shard in zip(shards, shards[1:]):
+        assert shard.start == previous.end + timedelta(seconds=1)
+
+    actual_total = sum(shard.total_results for shard in shards)
+    expected_total = 250
+    assert actual_total == expected_total
+
+
+@pytest.mark.asyncio
+async def test_run_retrieves_every_article_once(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient
+) -> None:
+    """Test that the shards and their later pages return the complete result set."""
+    urls = fake_api.publish(250)
+    planner = QueryPlanner(fake_client, page_size=20)
+
+    articles = await planner.run(QUERY, START, START + timedelta(minutes=249))
+
+    actual_urls = sorted(article["url"] for article in articles)
+    expected_urls = sorted(urls)
+    assert actual_urls == expected_urls
+
+
+@pytest.mark.asyncio
+async def test_window_under_the_cap_is_fetched_with_its_probe(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient
+) -> None:
+    """Test that a small window is fetched with its probe request only."""
+    fake_api.publish(60)
+    planner = QueryPlanner(fake_client)
+
+    articles = await planner.run(QUERY, START, START + timedelta(hours=1))
+
+    assert len(articles) == 60
+    assert len(fake_api.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_window_at_the_minimum_is_flagged_truncated(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient
+) -> None:
+    """Test that a window which can not be split further is flagged as truncated."""
+    for _ in range(150):
+        fake_api.publish(1, start=START)
+    planner = QueryPlanner(fake_client, min_window=timedelta(minutes=1))
+
+    shards = await planner.plan(QUERY, START, START + timedelta(seconds=30))
+
+    (shard,) = shards
+    assert shard.truncated
+    assert shard.total_results == 150
+
+
+@pytest.mark.asyncio
+async def test_plan_of_an_empty_window(fake_client: AsyncAPIClient) -> None:
+    """Test that a window ending before it starts, or past the horizon, is empty."""
+    planner = QueryPlanner(fake_client, horizon=timedelta(days=1))
+
+    assert await planner.plan(QUERY, START + timedelta(days=1), START) == []
+    assert await planner.plan(QUERY, START, START + timedelta(days=1)) == []
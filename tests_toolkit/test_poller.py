@@ -0,0 +1,180 @@
+"""Module containing test cases for the `ArticlePoller`."""
+
+from http import HTTPStatus
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL, FakeNewsAPI
+from toolkit import APIEndpointEnum, ArticlePoller, AsyncAPIClient
+
+QUERY = {"q": "bitcoin"}
+
+
+def make_poller(
+    api_client: AsyncAPIClient, tmp_path: Path, max_pages: int = 1
+) -> tuple[ArticlePoller, str]:
+    """Return a poller of 10 articles per page, tracking the `/everything` query."""
+    poller = ArticlePoller(
+        api_client, tmp_path / "poller.json", page_size=10, max_pages=max_pages
+    )
+    return poller, poller.track(APIEndpointEnum.EVERYTHING.value, QUERY)
+
+
+@pytest.mark.asyncio
+async def test_poll_delivers_only_new_articles(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient, tmp_path: Path
+) -> None:
+    """Test that a poll returns the articles published since the previous one."""
+    fake_api.publish(5)
+    poller, key = make_poller(fake_client, tmp_path)
+    await poller.poll(key)
+    new_urls = fake_api.publish(3)
+
+    articles = await poller.poll(key)
+
+    actual_urls = {article["url"] for article in articles}
+    expected_urls = set(new_urls)
+    assert actual_urls == expected_urls
+
+    actual_watermark = poller.states[key].watermark
+    expected_watermark = fake_api.articles[-1]["publishedAt"]
+    assert actual_watermark == expected_watermark
+
+    assert await poller.poll(key) == []
+
+
+@pytest.mark.asyncio
+async def test_burst_larger_than_a_poll_is_delivered_over_later_polls(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient, tmp_path: Path
+) -> None:
+    """Test that a burst of articles beyond `max_pages` is fully delivered."""
+    fake_api.publish(5)
+    poller, key = make_poller(fake_client, tmp_path)
+    await poller.poll(key)
+    old_watermark = poller.states[key].watermark
+    burst_urls = fake_api.publish(35)
+
+    delivered: list[str] = []
+    articles = await poller.poll(key)
+    # The watermark stays until the poller reaches it again.
+    assert poller.states[key].watermark == old_watermark
+    while articles:
+        delivered.extend(article["url"] for article in articles)
+        articles = await poller.poll(key)
+
+    actual_len_delivered = len(delivered)
+    expected_len_delivered = len(burst_urls)
+    assert actual_len_delivered == expected_len_delivered
+    assert set(delivered) == set(burst_urls)
+
+    actual_watermark = poller.states[key].watermark
+    expected_watermark = fake_api.articles[-1]["publishedAt"]
+    assert actual_watermark == expected_watermark
+    assert poller.states[key].cursor is None
+
+
+@pytest.mark.asyncio
+async def test_burst_beyond_results_cap_resumes_below_cursor(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient, tmp_path: Path
+) -> None:
+    """Test that the results cap of the plan does not lose the older articles."""
+    fake_api.max_results = 20
+    fake_api.publish(1)
+    poller, key = make_poller(fake_client, tmp_path, max_pages=5)
+    await poller.poll(key)
+    burst_urls = fake_api.publish(45)
+
+    delivered: list[str] = []
+    while articles := await poller.poll(key):
+        delivered.extend(article["url"] for article in articles)
+
+    assert sorted(delivered) == sorted(burst_urls)
+
+
+@pytest.mark.asyncio
+async def test_cursor_survives_a_restart(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient, tmp_path: Path
+) -> None:
+    """Test that an unfinished drain resumes from the saved state."""
+    fake_api.publish(1)
+    poller, key = make_poller(fake_client, tmp_path)
+    await poller.poll(key)
+    burst_urls = fake_api.publish(15)
+    delivered = [article["url"] for article in await poller.poll(key)]
+    poller.save()
+
+    restarted, _ = make_poller(fake_client, tmp_path)
+    delivered.extend(article["url"] for article in await restarted.poll(key))
+
+    assert sorted(delivered) == sorted(burst_urls)
+
+
+@pytest.mark.asyncio
+async def test_articles_on_watermark_are_delivered_once(
+    fake_api: FakeNewsAPI, fake_client: AsyncAPIClient, tmp_path: Path
+) -> None:
+    """Test that the inclusive `from` param does not deliver boundary articles twice."""
+    fake_api.publish(2)
+    poller, key = make_poller(fake_client, tmp_path)
+    await poller.poll(key)
+    boundary = fake_api.articles[-1]["publishedAt"]
+    fake_api.articles.append({"url": "https://news.test/late", "publishedAt": boundary})
+
+    articles = await poller.poll(key)
+
+    actual_urls = [article["url"] for article in articles]
+    expected_urls = ["https://news.test/late"]
+    assert actual_urls == expected_urls
+    assert await poller.poll(key) == []
+
+
+@pytest.mark.asyncio
+async def test_non_json_error_raises_http_status_error(tmp_path: Path) -> None:
+    """Test that an error response with a non-JSON body raises `HTTPStatusError`."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(
+            HTTPStatus.BAD_GATEWAY, content=b"<html>Bad gateway</html>"
+        )
+    )
+    poller, key = make_poller(AsyncAPIClient(BASE_URL, transport=transport), tmp_path)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await poller.poll(key)
+
+    assert poller.states[key].watermark is None
+
+
+@pytest.mark.asyncio
+async def test_unsorted_headlines_are_paged_past_the_watermark(tmp_path: Path) -> None:
+    """Test that an old headline on a page does not hide the newer ones after it."""
+    pages = [
+        [("a", "10:00"), ("b", "09:00")],
+        [("c", "08:00")],
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = pages[int(request.url.params["page"]) - 1]
+        articles = [
+            {"url": f"https://news.test/{name}", "publishedAt": f"2025-01-01T{at}:00Z"}
+            for name, at in page
+        ]
+        return httpx.Response(
+            HTTPStatus.OK, json={"status": "ok", "articles": articles}
+        )
+
+    api_client = AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler))
+    poller = ArticlePoller(api_client, tmp_path / "poller.json", page_size=2)
+    key = poller.track(APIEndpointEnum.TOP_HEADLINES.value, {"country": "us"})
+    await poller.poll(key)
+    pages[:] = [
+        [("d", "11:00"), ("b", "09:00")],
+        [("e", "12:00")],
+    ]
+
+    articles = await poller.poll(key)
+
+    actual_urls = {article["url"] for article in articles}
+    expected_urls = {"https://news.test/d", "https://news.test/e"}
+    assert actual_urls == expected_urls
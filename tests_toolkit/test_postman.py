@@ -0,0 +1,157 @@
+"""Module containing test cases for the Postman collection runner."""
+
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import AsyncAPIClient, PostmanCollection, PostmanRunner
+
+
+def make_collection(auth: dict[str, Any] | None = None) -> PostmanCollection:
+    """Return a collection with a folder, disabled entries and inherited auth."""
+    return PostmanCollection(
+        {
+            "info": {"name": "News"},
+            "variable": [
+                {"key": "baseUrl", "value": "https://newsapi.org/v2"},
+                {"key": "apiKey", "value": "collection-key"},
+                {"key": "unused", "value": "x", "disabled": True},
+            ],
+            "auth": auth
+            or {
+                "type": "apikey",
+                "apikey": [
+                    {"key": "key", "value": "X-Api-Key"},
+                    {"key": "value", "value": "{{apiKey}}"},
+                    {"key": "in", "value": "header"},
+                ],
+            },
+            "item": [
+                {
+                    "name": "Everything",
+                    "item": [
+                        {
+                            "name": "Search",
+                            "request": {
+                                "method": "get",
+                                "header": [
+                                    {"key": "Accept", "value": "application/json"},
+                                    {"key": "X-Debug", "value": "1", "disabled": True},
+                                ],
+                                "url": {
+                                    "raw": "{{baseUrl}}/everything?q={{query}}",
+                                    "query": [
+                                        {"key": "q", "value": "{{query}}"},
+                                        {"key": "page", "value": "2", "disabled": True},
+                                        {"key": "sortBy", "value": "{{unknown}}"},
+                                    ],
+                                },
+                            },
+                        }
+                    ],
+                },
+                {
+                    "name": "Sources",
+                    "request": {
+                        "method": "GET",
+                        "auth": {
+                            "type": "apikey",
+                            "apikey": [
+                                {"key": "key", "value": "apiKey"},
+                                {"key": "value", "value": "{{apiKey}}"},
+                                {"key": "in", "value": "query"},
+                            ],
+                        },
+                        "url": "{{baseUrl}}/top-headlines/sources?country=us",
+                    },
+                },
+            ],
+        }
+    )
+
+
+def test_items_resolve_variables_and_skip_disabled_entries() -> None:
+    """Test that the variables are resolved and the disabled params left out."""
+    search, sources = make_collection().items({"query": "bitcoin"})
+
+    assert search.name == "Everything / Search"
+    assert search.method == "GET"
+    assert search.url == "https://newsapi.org/v2/everything"
+    actual_params = search.params
+    expected_params = {"q": "bitcoin", "sortBy": "{{unknown}}"}
+    assert actual_params == expected_params
+    actual_headers = search.headers
+    expected_headers = {"Accept": "application/json", "X-Api-Key": "collection-key"}
+    assert actual_headers == expected_headers
+
+    assert sources.url == "https://newsapi.org/v2/top-headlines/sources"
+    assert sources.params == {"country": "us", "apiKey": "collection-key"}
+    assert sources.headers == {}
+
+
+def test_given_variables_override_the_collection() -> None:
+    """Test that the variables given to `items` take precedence."""
+    (search, _) = make_collection().items(
+        {"baseUrl": BASE_URL, "apiKey": "settings-key", "query": "ai"}
+    )
+
+    assert search.url == f"{BASE_URL}/everything"
+    assert search.headers["X-Api-Key"] == "settings-key"
+
+
+def test_bearer_auth_and_unsupported_auth() -> None:
+    """Test that a bearer auth is sent as a header, and an unknown one refused."""
+    bearer = {"type": "bearer", "bearer": [{"key": "token", "value": "{{apiKey}}"}]}
+    (search, _) = make_collection(bearer).items()
+    assert search.headers["Authorization"] == "Bearer collection-key"
+
+    with pytest.raises(ValueError, match="'oauth2' auth"):
+        make_collection({"type": "oauth2", "oauth2": []}).items()
+
+
+def test_spec_is_relative_to_the_base_url() -> None:
+    """Test that the request is converted to an endpoint of the client."""
+    (search, _) = make_collection().items({"query": "ai"})
+
+    spec = search.spec("https://newsapi.org/v2/")
+    assert spec.endpoint == "/everything"
+    assert spec.params == search.params
+
+    with pytest.raises(ValueError, match="is not under"):
+        search.spec("https://newsapi.org/v3")
+
+
+@pytest.mark.asyncio
+async def test_runner_sends_every_request() -> None:
+    """Test that the runner sends the requests of the items, in order."""
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+
+    items = make_collection().items({"baseUrl": BASE_URL, "query": "ai"})
+    api_client = AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler))
+
+    results = await PostmanRunner(api_client).run(items)
+
+    actual_statuses = [
+        None if result.response is None else result.response.status_code
+        for result in results
+    ]
+    expected_statuses = [HTTPStatus.OK, HTTPStatus.OK]
+    assert actual_statuses == expected_statuses
+    actual_paths = sorted(request.url.path for request in sent)
+    expected_paths = ["/v2/everything", "/v2/top-headlines/sources"]
+    assert actual_paths == expected_paths
+
+
+def test_shipped_collection_is_supported() -> None:
+    """Test that every request of the collection of the repository is converted."""
+    items = PostmanCollection.from_file().items({"baseUrl": BASE_URL, "apiKey": "key"})
+
+    assert items
+    assert all(item.spec(BASE_URL).endpoint.startswith("/") for item in items)
@@ -0,0 +1,113 @@
+"""Module containing test cases for the profiler of the request pipeline."""
+
+import pstats
+from http import HTTPStatus
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import APIClient, AsyncAPIClient, AsyncBridge, RequestProfiler
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Return a JSON response to any request."""
+    return httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+
+
+def make_client(profiler: RequestProfiler) -> APIClient:
+    """Return a profiled client answered by the handler."""
+    return APIClient(
+        BASE_URL, transport=httpx.MockTransport(handler), profiler=profiler
+    )
+
+
+def test_every_request_records_its_stages() -> None:
+    """Test that the stage totals add up to the total of the requests."""
+    profiler = RequestProfiler()
+    client = make_client(profiler)
+
+    for _ in range(3):
+        client.get("/everything", params={"q": "bitcoin"})
+
+    assert profiler.requests == 3
+    assert {stage for stage, count in profiler.stage_counts.items() if count} == {
+        "url",
+        "headers",
+        "httpx",
+    }
+    actual_total_ns = sum(profiler.stage_totals_ns.values())
+    expected_total_ns = profiler.total_ns
+    assert actual_total_ns == expected_total_ns
+    assert profiler.percentile_us("total", 95) > 0
+
+
+def test_decode_times_the_json_calls_of_the_caller() -> None:
+    """Test that only the responses decoded by the caller have a `decode` stage."""
+    profiler = RequestProfiler()
+    client = make_client(profiler)
+
+    client.get("/everything")
+    response = client.get("/everything")
+    assert profiler.stage_counts["decode"] == 0
+
+    assert response.json() == {"status": "ok"}
+    assert profiler.stage_counts["decode"] == 1
+    assert profiler.stage_totals_ns["decode"] > 0
+    assert "decode" in profiler.records[-1]
+    assert "decode" not in profiler.records[0]
+    assert "decode" in profiler.summary()
+
+
+@pytest.mark.asyncio
+async def test_async_requests_are_profiled() -> None:
+    """Test that the requests of `AsyncAPIClient` are recorded too."""
+    profiler = RequestProfiler()
+    client = AsyncAPIClient(
+        BASE_URL, transport=httpx.MockTransport(handler), profiler=profiler
+    )
+
+    response = await client.get("/everything")
+    response.json()
+
+    actual_counts = (profiler.requests, profiler.stage_counts["decode"])
+    expected_counts = (1, 1)
+    assert actual_counts == expected_counts
+
+
+def test_bridged_requests_are_profiled() -> None:
+    """Test that the requests sent through a bridge are recorded once."""
+    profiler = RequestProfiler()
+    async_client = AsyncAPIClient(
+        BASE_URL, transport=httpx.MockTransport(handler), profiler=profiler
+    )
+
+    with AsyncBridge(async_client) as bridge:
+        bridge.sync_client().get("/everything")
+
+    assert profiler.requests == 1
+    assert profiler.stage_counts["url"] == 1
+    assert profiler.stage_counts["httpx"] == 1
+
+
+def test_dump_stats_is_readable_by_pstats(tmp_path: Path) -> None:
+    """Test that the dump loads in `pstats`, with the stages called by `request`."""
+    profiler = RequestProfiler()
+    client = make_client(profiler)
+    for _ in range(2):
+        client.get("/everything").json()
+    path = tmp_path / "requests.prof"
+
+    profiler.dump_stats(path)
+
+    stats = pstats.Stats(str(path)).stats  # type: ignore[attr-defined]
+    functions = {function: row for (_, _, function), row in stats.items()}
+    actual_functions = set(functions)
+    expected_functions = {"request", "url", "headers", "httpx", "decode"}
+    assert actual_functions == expected_functions
+    calls, _, _, cumulative_s, _ = functions["request"]
+    assert calls == 2
+    assert cumulative_s == pytest.approx(profiler.total_ns / 1e9)
+    assert set(functions["httpx"][4]) == {("<request>", 0, "request")}
+    assert functions["decode"][4] == {}
@@ -0,0 +1,100 @@
+"""Module containing test cases for the request quota scheduler."""
+
+from http import HTTPStatus
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
+
+import httpx
+import pytest
+
+from toolkit.plugins import current_test
+from toolkit.plugins.quota import QuotaScheduler
+
+
+class FakeItem:
+    """The parts of a `pytest.Item` the scheduler reads."""
+
+    def __init__(self, nodeid: str, *markers: pytest.MarkDecorator) -> None:
+        """Initialize the item with its markers."""
+        self.nodeid = nodeid
+        self.markers = {marker.name: marker.mark for marker in markers}
+
+    def get_closest_marker(self, name: str) -> pytest.Mark | None:
+        """Return the marker of the item with the given name, if any."""
+        return self.markers.get(name)
+
+
+def make_item(nodeid: str, *markers: pytest.MarkDecorator) -> pytest.Item:
+    """Return a fake test item."""
+    return cast(pytest.Item, FakeItem(nodeid, *markers))
+
+
+def run_test(scheduler: QuotaScheduler, nodeid: str, requests: int) -> None:
+    """Simulate the run of a test sending a number of requests."""
+    token = current_test.set(nodeid)
+    try:
+        for _ in range(requests):
+            scheduler.record(httpx.Response(HTTPStatus.OK))
+    finally:
+        current_test.reset(token)
+    scheduler.pytest_runtest_logfinish(nodeid)
+
+
+def test_deferred_tests_come_first_within_their_group(tmp_path: Path) -> None:
+    """Test that the tests deferred by the previous run are the most urgent."""
+    state_path = tmp_path / "quota.json"
+    state_path.write_text(
+        '{"last_run": {"a": 1.0, "b": 2.0, "c": 3.0}, "deferred": ["c"]}'
+    )
+    scheduler = QuotaScheduler(daily_quota=10, state_path=state_path)
+    items = [
+        make_item("a"),
+        make_item("b", pytest.mark.smoke),
+        make_item("c"),
+        make_item("d", pytest.mark.error),
+    ]
+
+    actual_order = [item.nodeid for item in sorted(items, key=scheduler.priority)]
+    expected_order = ["b", "d", "c", "a"]
+    assert actual_order == expected_order
+
+
+def test_recorded_cost_is_the_most_requests_of_a_run(tmp_path: Path) -> None:
+    """Test that a run sending fewer requests does not lower the cost of a test."""
+    state_path = tmp_path / "quota.json"
+    item = make_item("test_a")
+
+    scheduler = QuotaScheduler(daily_quota=10, state_path=state_path)
+    run_test(scheduler, "test_a", requests=3)
+    scheduler.pytest_sessionfinish()
+
+    scheduler = QuotaScheduler(daily_quota=10, state_path=state_path)
+    assert scheduler.cost(item) == 3
+    assert scheduler.remaining == 7
+    run_test(scheduler, "test_a", requests=0)
+    scheduler.pytest_sessionfinish()
+
+    actual_state = QuotaScheduler(daily_quota=10, state_path=state_path).state
+    assert actual_state.costs == {"test_a": 3}
+    assert actual_state.spent == 3
+
+
+def test_tests_over_the_quota_are_deferred(tmp_path: Path) -> None:
+    """Test that the tests which do not fit in the quota are deselected and saved."""
+    state_path = tmp_path / "quota.json"
+    scheduler = QuotaScheduler(daily_quota=4, state_path=state_path)
+    items = [
+        make_item("a", pytest.mark.quota(cost=3)),
+        make_item("b"),
+        make_item("c", pytest.mark.quota(cost=2)),
+    ]
+    hook = SimpleNamespace(pytest_deselected=lambda items: None)
+    config = cast(pytest.Config, SimpleNamespace(hook=hook))
+
+    scheduler.pytest_collection_modifyitems(config, items)
+    scheduler.pytest_sessionfinish()
+
+    assert [item.nodeid for item in items] == ["a", "b"]
+    actual_state = QuotaScheduler(daily_quota=4, state_path=state_path).state
+    assert actual_state.deferred == ["c"]
@@ -0,0 +1,150 @@
+"""Module containing test cases for the `SourceCatalog`."""
+
+import time
+from datetime import timedelta
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import AsyncAPIClient, SourceCatalog
+
+SOURCES: list[dict[str, Any]] = [
+    {"id": "bbc-news", "category": "general", "language": "en", "country": "gb"},
+    {"id": "bbc-sport", "category": "sports", "language": "en", "country": "gb"},
+    {"id": "cnn", "category": "general", "language": "en", "country": "us"},
+    {"id": "le-monde", "category": "general", "language": "fr", "country": "fr"},
+    {"id": None, "category": "general", "language": "en", "country": "us"},
+]
+
+
+class FakeSourcesAPI:
+    """`/sources` answering with a given list of sources, counting its requests."""
+
+    def __init__(self, sources: list[dict[str, Any]]) -> None:
+        """Initialize the fake API with its sources."""
+        self.sources = sources
+        self.requests = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request with the sources."""
+        self.requests += 1
+        return httpx.Response(
+            HTTPStatus.OK, json={"status": "ok", "sources": self.sources}
+        )
+
+
+@pytest.fixture
+def fake_sources() -> FakeSourcesAPI:
+    """Fixture to provide a fake `/sources` with the test sources."""
+    return FakeSourcesAPI(SOURCES)
+
+
+@pytest.fixture
+def sources_client(fake_sources: FakeSourcesAPI) -> AsyncAPIClient:
+    """Fixture to provide a client sending its requests to the fake `/sources`."""
+    return AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(fake_sources.handler))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("age", "refresh", "expected_requests"),
+    [
+        (timedelta(hours=1), False, 0),
+        (timedelta(days=2), False, 1),
+        (timedelta(hours=1), True, 1),
+    ],
+    ids=["fresh", "expired", "refresh"],
+)
+async def test_load_downloads_only_an_expired_cache(
+    fake_sources: FakeSourcesAPI,
+    sources_client: AsyncAPIClient,
+    tmp_path: Path,
+    age: timedelta,
+    refresh: bool,
+    expected_requests: int,
+) -> None:
+    """Test that the cached catalog is used until it gets older than its TTL."""
+    cache_path = tmp_path / "sources.json"
+    cached = SourceCatalog(SOURCES[:1], fetched_at=time.time() - age.total_seconds())
+    cached.save(cache_path)
+
+    catalog = await SourceCatalog.load(
+        sources_client, cache_path, ttl=timedelta(days=1), refresh=refresh
+    )
+
+    assert fake_sources.requests == expected_requests
+    actual_ids = list(catalog.by_id)
+    expected_ids = (
+        ["bbc-news"]
+        if expected_requests == 0
+        else ["bbc-news", "bbc-sport", "cnn", "le-monde"]
+    )
+    assert actual_ids == expected_ids
+    assert len(SourceCatalog.from_file(cache_path)) == len(catalog)
+
+
+@pytest.mark.asyncio
+async def test_load_without_a_cache_downloads_and_saves_it(
+    fake_sources: FakeSourcesAPI, sources_client: AsyncAPIClient, tmp_path: Path
+) -> None:
+    """Test that the first load downloads the sources, and the next one reuses them."""
+    cache_path = tmp_path / "cache" / "sources.json"
+
+    catalog = await SourceCatalog.load(sources_client, cache_path)
+    reloaded = await SourceCatalog.load(sources_client, cache_path)
+
+    assert fake_sources.requests == 1
+    assert list(reloaded.by_id) == list(catalog.by_id)
+    assert not list(cache_path.parent.glob("*.tmp"))
+
+
+def test_save_and_from_file_round_trip(tmp_path: Path) -> None:
+    """Test that a saved catalog loads back with its sources and download time."""
+    catalog = SourceCatalog(SOURCES, fetched_at=1_700_000_000.0)
+    path = tmp_path / "sources.json"
+
+    catalog.save(path)
+    loaded = SourceCatalog.from_file(path)
+
+    assert loaded.fetched_at == catalog.fetched_at
+    assert loaded.by_id == catalog.by_id
+    assert loaded.indexes == catalog.indexes
+    assert not path.with_suffix(".json.tmp").exists()
+
+
+@pytest.mark.parametrize(
+    ("criteria", "expected_ids"),
+    [
+        ({}, ["bbc-news", "bbc-sport", "cnn", "le-monde"]),
+        ({"category": "general"}, ["bbc-news", "cnn", "le-monde"]),
+        ({"category": "general", "language": "en"}, ["bbc-news", "cnn"]),
+        ({"language": "en", "country": "gb"}, ["bbc-news", "bbc-sport"]),
+        ({"category": "sports", "country": "us"}, []),
+        ({"country": "xx"}, []),
+    ],
+)
+def test_ids_intersect_the_given_values(
+    criteria: dict[str, str], expected_ids: list[str]
+) -> None:
+    """Test that the ids match every given value, in the order of the sources."""
+    catalog = SourceCatalog(SOURCES)
+
+    assert catalog.ids(**criteria) == expected_ids
+    assert [source["id"] for source in catalog.filter(**criteria)] == expected_ids
+
+
+def test_valid_values() -> None:
+    """Test the values of the params validated by the catalog."""
+    catalog = SourceCatalog(SOURCES)
+
+    actual_sources = catalog.valid_values("sources")
+    expected_sources = frozenset({"bbc-news", "bbc-sport", "cnn", "le-monde"})
+    assert actual_sources == expected_sources
+    assert catalog.countries == frozenset({"gb", "us", "fr"})
+    assert catalog.categories == frozenset({"general", "sports"})
+    with pytest.raises(ValueError, match="`sortBy` is not a param"):
+        catalog.valid_values("sortBy")
@@ -0,0 +1,95 @@
+"""Module containing test cases for the cases of the test case spreadsheet."""
+
+import asyncio
+from http import HTTPStatus
+
+import httpx
+import pytest
+
+from tests_toolkit.conftest import BASE_URL
+from toolkit import AsyncAPIClient
+from toolkit.plugins import current_test
+from toolkit.spreadsheet import COLUMNS, CaseBatch, cases_from_record, load_cases
+
+
+def make_record(**cells: str) -> dict[str, str]:
+    """Return a row of the spreadsheet, with the given cells by column key."""
+    record = {
+        COLUMNS["case_id"]: "TC-1",
+        COLUMNS["endpoint"]: "/top-headlines",
+        COLUMNS["method"]: "GET",
+        COLUMNS["params"]: "country=[us, gb]",
+        COLUMNS["status_code"]: "200 OK",
+        COLUMNS["expected"]: '- status: "ok"\n- articles: non-empty array',
+    }
+    record.update((COLUMNS[name], value) for name, value in cells.items())
+    return record
+
+
+def test_row_with_a_list_of_values_makes_one_case_per_value() -> None:
+    """Test that every value of a param gets its own case."""
+    cases = cases_from_record(make_record())
+
+    actual_ids = [case.case_id for case in cases]
+    expected_ids = ["TC-1-0", "TC-1-1"]
+    assert actual_ids == expected_ids
+    assert [case.params for case in cases] == [{"country": "us"}, {"country": "gb"}]
+    assert cases[0].status_code == HTTPStatus.OK
+    assert cases[0].expected == {"status": "ok"}
+    assert cases[0].non_empty == ("articles",)
+
+
+@pytest.mark.parametrize("status_code", ["", "  ", "See notes"])
+def test_row_without_a_status_code_is_manual(status_code: str) -> None:
+    """Test that a row with no expected status code is left to a manual run."""
+    (case,) = cases_from_record(make_record(status_code=status_code))
+
+    actual_manual = case.manual
+    expected_manual = "the expected status code is missing"
+    assert actual_manual == expected_manual
+
+
+def test_shipped_spreadsheet_is_loaded() -> None:
+    """Test that the spreadsheet of the repository gives runnable and manual cases."""
+    cases = list(load_cases())
+
+    assert any(case.manual is None for case in cases)
+    assert len({case.case_id for case in cases}) == len(cases)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [1, 8])
+async def test_batch_sends_every_request_as_the_test_of_its_case(
+    max_concurrency: int,
+) -> None:
+    """Test that the requests of the batch are attributed to their own tests."""
+    senders: dict[str, str | None] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        country = request.url.params["country"]
+        # The first request is still in flight while the second one is sent.
+        await asyncio.sleep(0.01 if country == "us" else 0)
+        senders[country] = current_test.get()
+        return httpx.Response(HTTPStatus.OK, json={"status": "ok"})
+
+    api_client = AsyncAPIClient(BASE_URL, transport=httpx.MockTransport(handler))
+    cases = cases_from_record(make_record())
+    batch = CaseBatch(
+        api_client,
+        cases,
+        {},
+        max_concurrency=max_concurrency,
+        test_ids={"TC-1-0": "test[TC-1-0]", "TC-1-1": "test[TC-1-1]"},
+    )
+
+    token = current_test.set("test[TC-1-0]")
+    try:
+        result = await batch.result(cases[0])
+        assert current_test.get() == "test[TC-1-0]"
+    finally:
+        current_test.reset(token)
+
+    assert result.response is not None
+    actual_senders = senders
+    expected_senders = {"us": "test[TC-1-0]", "gb": "test[TC-1-1]"}
+    assert actual_senders == expected_senders
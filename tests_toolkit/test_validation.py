@@ -0,0 +1,175 @@
+"""Module containing test cases for the pre-flight `RequestValidator`."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from toolkit import (
+    APIEndpointEnum,
+    RequestValidationError,
+    RequestValidator,
+    ResponseCodeEnum,
+    SourceCatalog,
+    ValidationModeEnum,
+)
+
+EVERYTHING = APIEndpointEnum.EVERYTHING.value
+
+CATALOG = SourceCatalog(
+    [
+        {"id": "bbc-news", "category": "general", "language": "en", "country": "gb"},
+        {"id": "le-monde", "category": "general", "language": "fr", "country": "fr"},
+    ]
+)
+
+
+def reject(endpoint: str, params: dict[str, Any]) -> RequestValidationError:
+    """Return the error raised by the validator in `REJECT` mode."""
+    with pytest.raises(RequestValidationError) as error:
+        RequestValidator(catalog=CATALOG).validate(endpoint, params)
+    return error.value
+
+
+def normalize(endpoint: str, params: dict[str, Any]) -> dict[str, Any] | None:
+    """Return the params normalized by the validator in `NORMALIZE` mode."""
+    validator = RequestValidator(ValidationModeEnum.NORMALIZE, catalog=CATALOG)
+    return validator.validate(endpoint, params)
+
+
+@pytest.mark.parametrize(
+    ("params", "expected_code", "expected_params"),
+    [
+        (
+            {"page": 0},
+            ResponseCodeEnum.PAGE_CAN_NOT_BE_LESS_THAN_ONE,
+            {"page": 1},
+        ),
+        (
+            {"pageSize": 150},
+            ResponseCodeEnum.MAXIMUM_RESULTS_REACHED,
+            {"pageSize": 100},
+        ),
+        (
+            {"pageSize": 0},
+            ResponseCodeEnum.PARAMETER_INVALID,
+            {"pageSize": 1},
+        ),
+        (
+            {"searchIn": "title,summary"},
+            ResponseCodeEnum.PARAMETER_INVALID,
+            {"searchIn": "title"},
+        ),
+        ({"sortBy": "date"}, ResponseCodeEnum.PARAMETER_INVALID, {}),
+        ({"from": "yesterday"}, ResponseCodeEnum.PARAMETER_INVALID, {}),
+        (
+            {"sources": "bbc-news, cnn"},
+            ResponseCodeEnum.PARAMETER_INVALID,
+            {"sources": "bbc-news"},
+        ),
+    ],
+)
+def test_invalid_value_is_rejected_or_normalized(
+    params: dict[str, Any],
+    expected_code: ResponseCodeEnum,
+    expected_params: dict[str, Any],
+) -> None:
+    """Test that a fixable value raises in `REJECT` mode, and is fixed otherwise."""
+    params = {"q": "bitcoin", **params}
+
+    assert reject(EVERYTHING, params).code == expected_code
+    actual_params = normalize(EVERYTHING, params)
+    assert actual_params == {"q": "bitcoin", **expected_params}
+
+
+@pytest.mark.parametrize("value", [2.7, True, "2.7", [2]])
+@pytest.mark.parametrize("mode", list(ValidationModeEnum))
+def test_integer_param_refuses_other_values(
+    value: Any, mode: ValidationModeEnum
+) -> None:
+    """Test that a value which is not a whole number raises in both modes."""
+    with pytest.raises(RequestValidationError, match="must be an integer"):
+        RequestValidator(mode).validate(EVERYTHING, {"q": "ai", "pageSize": value})
+
+
+def test_whole_number_values_are_sent_as_integers() -> None:
+    """Test that a whole float or a numeric string is accepted as an integer."""
+    actual_params = RequestValidator().validate(
+        EVERYTHING, {"q": "ai", "page": "2", "pageSize": 20.0}
+    )
+    expected_params = {"q": "ai", "page": 2, "pageSize": 20}
+    assert actual_params == expected_params
+
+
+def test_from_older_than_the_max_age() -> None:
+    """Test that a too old `from` raises, or is moved to the oldest valid date."""
+    too_old = datetime.now(tz=timezone.utc) - timedelta(days=6 * 365)
+    params = {"q": "ai", "from": too_old.strftime("%Y-%m-%d")}
+
+    assert "too far in the past" in reject(EVERYTHING, params).message
+    normalized = normalize(EVERYTHING, params)
+    assert normalized is not None
+    actual_age = datetime.now(tz=timezone.utc) - datetime.fromisoformat(
+        normalized["from"]
+    ).replace(tzinfo=timezone.utc)
+    assert timedelta(days=5 * 365 - 1) < actual_age < timedelta(days=5 * 365)
+
+
+@pytest.mark.parametrize("mode", list(ValidationModeEnum))
+def test_unfixable_requests_raise_in_both_modes(mode: ValidationModeEnum) -> None:
+    """Test that a missing query and a too long one are never fixed."""
+    validator = RequestValidator(mode)
+
+    with pytest.raises(RequestValidationError) as error:
+        validator.validate(EVERYTHING, {"sortBy": "publishedAt"})
+    assert error.value.code == ResponseCodeEnum.PARAMETER_MISSING
+    with pytest.raises(RequestValidationError) as error:
+        validator.validate(EVERYTHING, {"q": "a" * 501})
+    assert error.value.code == ResponseCodeEnum.QUERY_TOO_LONG
+
+
+@pytest.mark.parametrize(
+    ("params", "expected_refused"),
+    [
+        ({"q": "ai"}, False),
+        ({"q": "ai", "page": 5, "pageSize": 20}, False),
+        ({"q": "ai", "page": 6, "pageSize": 20}, True),
+        ({"q": "ai", "page": 2}, True),
+    ],
+)
+def test_pages_past_the_results_cap(
+    params: dict[str, Any], expected_refused: bool
+) -> None:
+    """Test that the pages starting past the results cap of the plan are refused."""
+    validator = RequestValidator(max_results=100)
+
+    try:
+        validator.validate(EVERYTHING, params)
+    except RequestValidationError as error:
+        assert error.code == ResponseCodeEnum.MAXIMUM_RESULTS_REACHED
+        actual_refused = True
+    else:
+        actual_refused = False
+    assert actual_refused == expected_refused
+
+
+@pytest.mark.parametrize(
+    "endpoint", [APIEndpointEnum.SOURCES, APIEndpointEnum.TOP_HEADLINES_SOURCES]
+)
+def test_sources_requests_are_validated(endpoint: APIEndpointEnum) -> None:
+    """Test that the params of both paths of the sources are checked."""
+    assert reject(endpoint.value, {"country": "xx"}).param == "country"
+    actual_params = normalize(endpoint.value, {"country": "xx", "language": "fr"})
+    expected_params = {"language": "fr"}
+    assert actual_params == expected_params
+
+
+def test_unknown_endpoints_and_params_are_passed_through() -> None:
+    """Test that the validator leaves alone what it has no spec for."""
+    validator = RequestValidator()
+
+    assert validator.validate("/unknown", {"page": 0}) == {"page": 0}
+    actual_params = validator.validate(EVERYTHING, {"q": "ai", "domains": "bbc.co.uk"})
+    expected_params = {"q": "ai", "domains": "bbc.co.uk"}
+    assert actual_params == expected_params
+    assert validator.validate(APIEndpointEnum.TOP_HEADLINES.value, None) is None
@@ -1,10 +1,117 @@
-from .api_clients import APIClient, AsyncAPIClient
-from .enums import APIEndpointEnum, ResponseCodeEnum, ResponseStatusEnum
+"""
+Toolkit for testing and consuming NewsAPI.
+
+The public names are resolved lazily (PEP 562), so importing the package, or a
+light name like `APIEndpointEnum`, does not import `httpx`, `numpy` or the other
+heavy dependencies of the modules which are not used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_clients import APIClient, AsyncAPIClient, RequestResult, RequestSpec
+    from .bridge import AsyncBridge
+    from .columnar import ArticleStore
+    from .crawler import ParallelCrawler
+    from .dedupe import ArticleDeduplicator
+    from .enums import (
+        APIEndpointEnum,
+        DedupeModeEnum,
+        ResponseCodeEnum,
+        ResponseStatusEnum,
+        ValidationModeEnum,
+    )
+    from .journal import JournaledJobRunner, RequestJournal
+    from .monitor import APIMonitor, SampleStore
+    from .planner import QueryPlanner, Shard
+    from .poller import ArticlePoller, PollState
+    from .postman import PostmanCollection, PostmanItem, PostmanRunner
+    from .profiling import RequestProfiler
+    from .rate_limit import RateLimiter
+    from .sources import SourceCatalog
+    from .transports import CannedTransport
+    from .validation import RequestValidationError, RequestValidator
+
+# Public name, mapped to the submodule defining it.
+_LAZY_ATTRIBUTES = {
+    "APIClient": "api_clients",
+    "APIEndpointEnum": "enums",
+    "APIMonitor": "monitor",
+    "ArticleDeduplicator": "dedupe",
+    "ArticlePoller": "poller",
+    "ArticleStore": "columnar",
+    "AsyncAPIClient": "api_clients",
+    "AsyncBridge": "bridge",
+    "CannedTransport": "transports",
+    "DedupeModeEnum": "enums",
+    "JournaledJobRunner": "journal",
+    "ParallelCrawler": "crawler",
+    "PollState": "poller",
+    "PostmanCollection": "postman",
+    "PostmanItem": "postman",
+    "PostmanRunner": "postman",
+    "QueryPlanner": "planner",
+    "RateLimiter": "rate_limit",
+    "RequestResult": "api_clients",
+    "RequestSpec": "api_clients",
+    "RequestJournal": "journal",
+    "RequestProfiler": "profiling",
+    "RequestValidationError": "validation",
+    "RequestValidator": "validation",
+    "ResponseCodeEnum": "enums",
+    "ResponseStatusEnum": "enums",
+    "SampleStore": "monitor",
+    "Shard": "planner",
+    "SourceCatalog": "sources",
+    "ValidationModeEnum": "enums",
+}
 
 __all__ = [
     "APIClient",
     "APIEndpointEnum",
+    "APIMonitor",
+    "ArticleDeduplicator",
+    "ArticlePoller",
+    "ArticleStore",
     "AsyncAPIClient",
+    "AsyncBridge",
+    "CannedTransport",
+    "DedupeModeEnum",
+    "JournaledJobRunner",
+    "ParallelCrawler",
+    "PollState",
+    "PostmanCollection",
+    "PostmanItem",
+    "PostmanRunner",
+    "QueryPlanner",
+    "RateLimiter",
+    "RequestJournal",
+    "RequestProfiler",
+    "RequestResult",
+    "RequestSpec",
+    "RequestValidationError",
+    "RequestValidator",
     "ResponseCodeEnum",
     "ResponseStatusEnum",
+    "SampleStore",
+    "Shard",
+    "SourceCatalog",
+    "ValidationModeEnum",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining a public name on its first access."""
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes, including the lazy ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
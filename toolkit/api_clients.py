@@ -1,23 +1,145 @@
 """Client for making HTTP requests using the httpx library."""
 
-from typing import Any
+import asyncio
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from .enums import APIEndpointEnum
+from .profiling import RequestProfiler, RequestTimer
+from .rate_limit import RateLimiter
+from .validation import RequestValidator
+
+if TYPE_CHECKING:
+    from .bridge import AsyncBridge
+
+# Seconds the current task last waited for the rate limiter of `AsyncAPIClient`.
+_rate_limit_wait: ContextVar[float] = ContextVar("_rate_limit_wait", default=0.0)
+
 
 class BaseAPIClient:
-    """Parent class for API clients."""
+    """
+    Parent class for API clients.
+
+    The normalized base URL, the default headers and the URLs of the endpoints are
+    prepared once, so building a request only looks them up. Hence the base URL and
+    the default headers are read-only once the client is created.
+    """
+
+    # Maximum number of endpoint URLs kept in the URL cache of a client.
+    URL_CACHE_SIZE = 256
 
     def __init__(
         self,
         base_url: str,
         timeout: int = 10,
         default_headers: dict[str, Any] | None = None,
+        validator: RequestValidator | None = None,
+        profiler: RequestProfiler | None = None,
     ) -> None:
         """Initialize the subclasses of the `BaseAPIClient`."""
-        self.base_url = base_url
+        self._base_url = base_url
+        self._root_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.default_headers = default_headers or {}
+        self._default_headers: Mapping[str, Any] = MappingProxyType(
+            dict(default_headers or {})
+        )
+        self._validator = validator
+        self._profiler = profiler
+        self._urls: dict[str, str] = {}
+        for endpoint in APIEndpointEnum:
+            self._build_url(endpoint.value)
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL of the API."""
+        return self._base_url
+
+    @property
+    def default_headers(self) -> Mapping[str, Any]:
+        """Return the read-only headers sent with every request."""
+        return self._default_headers
+
+    @property
+    def validator(self) -> RequestValidator | None:
+        """Return the validator of the request params, if any."""
+        return self._validator
+
+    @property
+    def profiler(self) -> RequestProfiler | None:
+        """Return the profiler of the requests, if any."""
+        return self._profiler
+
+    def _build_url(self, endpoint: str) -> str:
+        """Return the full URL of an endpoint, from the URL cache when possible."""
+        try:
+            return self._urls[endpoint]
+        except KeyError:
+            url = f"{self._root_url}/{endpoint.lstrip('/')}"
+            if len(self._urls) < self.URL_CACHE_SIZE:
+                self._urls[endpoint] = url
+            return url
+
+    def _build_headers(self, headers: dict[str, Any] | None) -> Mapping[str, Any]:
+        """Return the request headers, copying the defaults only to override them."""
+        if not headers:
+            return self._default_headers
+        return {**self._default_headers, **headers}
+
+    def _validate(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        timer: RequestTimer | None,
+    ) -> dict[str, Any] | None:
+        """Return the validated params of a request, timing it when profiled."""
+        if self._validator is None:
+            return params
+        params = self._validator.validate(endpoint, params)
+        if timer is not None:
+            timer.mark("validate")
+        return params
+
+    def _prepare_request(
+        self, endpoint: str, headers: dict[str, Any] | None, timer: RequestTimer | None
+    ) -> tuple[str, Mapping[str, Any]]:
+        """Return the URL and the headers of a request, timing them when profiled."""
+        if timer is None:
+            return self._build_url(endpoint), self._build_headers(headers)
+        full_url = self._build_url(endpoint)
+        timer.mark("url")
+        request_headers = self._build_headers(headers)
+        timer.mark("headers")
+        return full_url, request_headers
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    """A request to send, as given to `APIClient.map` or `AsyncAPIClient.map`."""
+
+    endpoint: str
+    params: dict[str, Any] | None = None
+    method: str = "GET"
+    headers: dict[str, Any] | None = None
+    payload: dict[str, Any] | None = None
+
+
+@dataclass
+class RequestResult:
+    """Outcome of a request sent by `APIClient.map` or `AsyncAPIClient.map`."""
+
+    spec: RequestSpec
+    response: httpx.Response | None = None
+    error: Exception | None = None
+    # Seconds spent sending the request, the wait for the rate limiter excluded.
+    elapsed: float = 0.0
 
 
 class APIClient(BaseAPIClient):
@@ -28,12 +150,140 @@ class APIClient(BaseAPIClient):
         base_url: str,
         timeout: int = 10,
         default_headers: dict[str, Any] | None = None,
+        transport: httpx.BaseTransport | None = None,
+        bridge: "AsyncBridge | None" = None,
+        rate_limiter: RateLimiter | None = None,
+        validator: RequestValidator | None = None,
+        profiler: RequestProfiler | None = None,
     ) -> None:
-        """Initialize the `APIClient`."""
+        """
+        Initialize the `APIClient`.
+
+        By default every request opens its own `httpx.Client`. Once opened, with
+        `open` or `with`, the client keeps a single connection pool, which is safe to
+        share between threads, until it is closed.
+
+        Parameters
+        ----------
+        base_url : str
+            The base URL of the API.
+        timeout : int, optional
+            The timeout of the requests, in seconds.
+        default_headers : dict, optional
+            Headers sent with every request.
+        transport : httpx.BaseTransport, optional
+            The transport of the underlying `httpx.Client`, e.g. an in-process one.
+        bridge : AsyncBridge, optional
+            When given, the requests are sent by the pooled `AsyncAPIClient` of the
+            bridge, on its event loop thread, instead of by `httpx.Client`. They keep
+            the base URL, headers, timeout and validator of this client. Use
+            `AsyncBridge.sync_client` to create such a client.
+        rate_limiter : RateLimiter, optional
+            Limiter every request waits for, whatever the thread sending it.
+        validator : RequestValidator, optional
+            When given, the params of every request are validated before it is sent,
+            and a `RequestValidationError` is raised instead of sending a request the
+            API would refuse.
+        profiler : RequestProfiler, optional
+            When given, the time spent in every stage of every request is recorded
+            in the profiler, see `toolkit.profiling`.
+        """
         super().__init__(
-            base_url=base_url, timeout=timeout, default_headers=default_headers
+            base_url=base_url,
+            timeout=timeout,
+            default_headers=default_headers,
+            validator=validator,
+            profiler=profiler,
         )
-        self._client = httpx.Client
+        self._client = partial(httpx.Client, transport=transport)
+        self._bridge = bridge
+        self._pool: httpx.Client | None = None
+        self._rate_limiter = rate_limiter
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the client keeps a connection pool open."""
+        return self._pool is not None
+
+    def open(self) -> None:
+        """Open the connection pool shared by the following requests."""
+        if self._pool is None:
+            self._pool = self._client()
+
+    def close(self) -> None:
+        """Close the connection pool, if open."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.close()
+
+    def __enter__(self) -> "APIClient":
+        """Open the connection pool when entering the context."""
+        self.open()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the connection pool when leaving the context."""
+        self.close()
+
+    def map(
+        self, requests: Iterable[RequestSpec], max_workers: int = 8
+    ) -> list[RequestResult]:
+        """
+        Send many requests concurrently from a pool of threads.
+
+        The threads share one connection pool: the pool of the bridge if any, else the
+        pool of the client, opened for the duration of the call if needed. At most
+        `2 * max_workers` requests are queued at a time, and every request goes
+        through the rate limiter of the client, so a large or lazy iterable of
+        requests never floods the pool or exceeds the rate limit.
+
+        Parameters
+        ----------
+        requests : iterable of RequestSpec
+            The requests to send.
+        max_workers : int, optional
+            Number of threads sending the requests.
+
+        Returns
+        -------
+        list of RequestResult
+            The results, in the order of the requests. A failed request holds its
+            exception instead of a response; it does not stop the other requests.
+        """
+        opened = self._bridge is None and self._pool is None
+        if opened:
+            self.open()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures: list[Future[RequestResult]] = []
+                in_flight: set[Future[RequestResult]] = set()
+                for spec in requests:
+                    if len(in_flight) >= 2 * max_workers:
+                        _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = executor.submit(self._send_spec, spec)
+                    futures.append(future)
+                    in_flight.add(future)
+                return [future.result() for future in futures]
+        finally:
+            if opened:
+                self.close()
+
+    def _send_spec(self, spec: RequestSpec) -> RequestResult:
+        """Send a request, timing it and capturing its exception."""
+        result = RequestResult(spec)
+        timer = None if self._profiler is None else self._profiler.start()
+        start = time.perf_counter()
+        try:
+            params = self._validate(spec.endpoint, spec.params, timer)
+            self._wait_for_rate_limit(timer)
+            start = time.perf_counter()
+            result.response = self._send(
+                spec.method, spec.endpoint, spec.headers, params, spec.payload, timer
+            )
+        except Exception as error:
+            result.error = error
+        result.elapsed = time.perf_counter() - start
+        return result
 
     def _request(
         self,
@@ -67,11 +317,52 @@ class APIClient(BaseAPIClient):
         httpx.Response
             The HTTP response object.
         """
-        full_url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        request_headers = {**self.default_headers, **(headers or {})}
+        timer = None if self._profiler is None else self._profiler.start()
+        params = self._validate(endpoint, params, timer)
+        self._wait_for_rate_limit(timer)
+        return self._send(method, endpoint, headers, params, payload, timer, **kwargs)
+
+    def _wait_for_rate_limit(self, timer: RequestTimer | None) -> None:
+        """Wait for the rate limiter, if any, timing it when profiled."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+            if timer is not None:
+                timer.mark("rate_limit")
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        payload: dict[str, Any] | None,
+        timer: RequestTimer | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a validated request, once the rate limiter let it through."""
+        full_url, request_headers = self._prepare_request(endpoint, headers, timer)
+        if self._bridge is not None:
+            return self._bridge.run(
+                self._bridge.api_client._send(
+                    method,
+                    full_url,
+                    request_headers,
+                    params,
+                    payload,
+                    self.timeout,
+                    timer,
+                    **kwargs,
+                )
+            )
+
+        if timer is not None:
+            kwargs["extensions"] = {
+                **kwargs.get("extensions", {}),
+                "trace": timer.trace,
+            }
 
-        with self._client() as client:
-            response: httpx.Response = client.request(
+        if self._pool is not None:
+            response: httpx.Response = self._pool.request(
                 method,
                 full_url,
                 headers=request_headers,
@@ -80,7 +371,21 @@ class APIClient(BaseAPIClient):
                 timeout=self.timeout,
                 **kwargs,
             )
-            return response
+        else:
+            with self._client() as client:
+                response = client.request(
+                    method,
+                    full_url,
+                    headers=request_headers,
+                    params=params,
+                    data=payload,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+
+        if timer is not None:
+            timer.finish(response)
+        return response
 
     def get(
         self,
@@ -270,7 +575,7 @@ class APIClient(BaseAPIClient):
         return (
             f"APIClient(base_url={self.base_url}, "
             f"timeout={self.timeout}, "
-            f"default_headers={self.default_headers})"
+            f"default_headers={dict(self.default_headers)})"
         )
 
 
@@ -282,12 +587,139 @@ class AsyncAPIClient(BaseAPIClient):
         base_url: str,
         timeout: int = 10,
         default_headers: dict[str, Any] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        limits: httpx.Limits | None = None,
+        rate_limiter: RateLimiter | None = None,
+        validator: RequestValidator | None = None,
+        profiler: RequestProfiler | None = None,
     ) -> None:
-        """Initialize the `AsyncAPIClient`."""
+        """
+        Initialize the `AsyncAPIClient`.
+
+        By default every request opens its own `httpx.AsyncClient`, so the client can
+        be shared between event loops. Once opened, with `open` or `async with`, the
+        client keeps a single connection pool, bound to the current event loop, for
+        all its requests until it is closed.
+
+        Parameters
+        ----------
+        base_url : str
+            The base URL of the API.
+        timeout : int, optional
+            The timeout of the requests, in seconds.
+        default_headers : dict, optional
+            Headers sent with every request.
+        transport : httpx.AsyncBaseTransport, optional
+            The transport of the underlying `httpx.AsyncClient`, e.g. an in-process one.
+        limits : httpx.Limits, optional
+            The connection limits of the pool, the httpx defaults if not given.
+        rate_limiter : RateLimiter, optional
+            Limiter every request waits for, whatever the task sending it.
+        validator : RequestValidator, optional
+            When given, the params of every request are validated before it is sent,
+            and a `RequestValidationError` is raised instead of sending a request the
+            API would refuse.
+        profiler : RequestProfiler, optional
+            When given, the time spent in every stage of every request is recorded
+            in the profiler, see `toolkit.profiling`.
+        """
         super().__init__(
-            base_url=base_url, timeout=timeout, default_headers=default_headers
+            base_url=base_url,
+            timeout=timeout,
+            default_headers=default_headers,
+            validator=validator,
+            profiler=profiler,
         )
-        self._client = httpx.AsyncClient
+        client_kwargs: dict[str, Any] = {"transport": transport}
+        if limits is not None:
+            client_kwargs["limits"] = limits
+        self._client = partial(httpx.AsyncClient, **client_kwargs)
+        self._pool: httpx.AsyncClient | None = None
+        self._rate_limiter = rate_limiter
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the client keeps a connection pool open."""
+        return self._pool is not None
+
+    async def open(self) -> None:
+        """Open the connection pool shared by the following requests."""
+        if self._pool is None:
+            self._pool = self._client()
+
+    async def aclose(self) -> None:
+        """Close the connection pool, if open."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        """Open the connection pool when entering the context."""
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close the connection pool when leaving the context."""
+        await self.aclose()
+
+    async def map(
+        self, requests: Iterable[RequestSpec], max_concurrency: int = 8
+    ) -> list[RequestResult]:
+        """
+        Send many requests concurrently on the event loop.
+
+        The requests share the connection pool of the client, opened for the duration
+        of the call if needed. `max_concurrency` tasks take the requests from the
+        iterable one at a time, so a large or lazy iterable of requests never floods
+        the pool.
+
+        Parameters
+        ----------
+        requests : iterable of RequestSpec
+            The requests to send.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time.
+
+        Returns
+        -------
+        list of RequestResult
+            The results, in the order of the requests. A failed request holds its
+            exception instead of a response; it does not stop the other requests.
+        """
+        specs = enumerate(requests)
+        results: dict[int, RequestResult] = {}
+
+        async def send_all() -> None:
+            for index, spec in specs:
+                results[index] = await self._send_spec(spec)
+
+        opened = self._pool is None
+        if opened:
+            await self.open()
+        try:
+            await asyncio.gather(*(send_all() for _ in range(max_concurrency)))
+        finally:
+            if opened:
+                await self.aclose()
+        return [results[index] for index in range(len(results))]
+
+    async def _send_spec(self, spec: RequestSpec) -> RequestResult:
+        """Send a request, timing it and capturing its exception."""
+        result = RequestResult(spec)
+        _rate_limit_wait.set(0.0)
+        start = time.perf_counter()
+        try:
+            result.response = await self._request(
+                spec.method,
+                spec.endpoint,
+                headers=spec.headers,
+                params=spec.params,
+                payload=spec.payload,
+            )
+        except Exception as error:
+            result.error = error
+        result.elapsed = time.perf_counter() - start - _rate_limit_wait.get()
+        return result
 
     async def _request(
         self,
@@ -321,20 +753,78 @@ class AsyncAPIClient(BaseAPIClient):
         httpx.Response
             The HTTP response object.
         """
-        full_url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        request_headers = {**self.default_headers, **(headers or {})}
+        timer = None if self._profiler is None else self._profiler.start()
+        params = self._validate(endpoint, params, timer)
+        await self._wait_for_rate_limit(timer)
+        full_url, request_headers = self._prepare_request(endpoint, headers, timer)
+        return await self._send(
+            method,
+            full_url,
+            request_headers,
+            params,
+            payload,
+            self.timeout,
+            timer,
+            **kwargs,
+        )
+
+    async def _wait_for_rate_limit(self, timer: RequestTimer | None) -> None:
+        """Wait for the rate limiter, if any, recording the wait of the task."""
+        if self._rate_limiter is not None:
+            start = time.perf_counter()
+            await self._rate_limiter.acquire_async()
+            _rate_limit_wait.set(time.perf_counter() - start)
+            if timer is not None:
+                timer.mark("rate_limit")
 
-        async with self._client() as client:
-            response: httpx.Response = await client.request(
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, Any],
+        params: dict[str, Any] | None,
+        payload: dict[str, Any] | None,
+        timeout: int,
+        timer: RequestTimer | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a validated request, with its full URL and headers, on the pool.
+
+        `APIClient` instances bridged to this client send their requests through this
+        method, with their own URL, headers and timeout.
+        """
+        if timer is not None:
+            kwargs["extensions"] = {
+                **kwargs.get("extensions", {}),
+                "trace": timer.atrace,
+            }
+
+        if self._pool is not None:
+            response: httpx.Response = await self._pool.request(
                 method,
-                full_url,
-                headers=request_headers,
+                url,
+                headers=headers,
                 params=params,
                 data=payload,
-                timeout=self.timeout,
+                timeout=timeout,
                 **kwargs,
             )
-            return response
+        else:
+            async with self._client() as client:
+                response = await client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    data=payload,
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+        if timer is not None:
+            timer.finish(response)
+        return response
 
     async def get(
         self,
@@ -524,5 +1014,5 @@ class AsyncAPIClient(BaseAPIClient):
         return (
             f"AsyncAPIClient(base_url={self.base_url}, "
             f"timeout={self.timeout}, "
-            f"default_headers={self.default_headers})"
+            f"default_headers={dict(self.default_headers)})"
         )
@@ -0,0 +1,106 @@
+"""Bridge running the asynchronous client for synchronous callers."""
+
+import asyncio
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+from .api_clients import APIClient, AsyncAPIClient
+
+T = TypeVar("T")
+
+
+class AsyncBridge:
+    """
+    Background event loop thread owning a single pooled `AsyncAPIClient`.
+
+    The `APIClient` instances created by `sync_client` hand their requests over to
+    the loop thread and block until the response is received. Hence every thread
+    calling them shares the connection pool and the connection limits of the
+    asynchronous client, and the requests of several threads run concurrently on
+    the loop.
+    """
+
+    def __init__(self, api_client: AsyncAPIClient) -> None:
+        """
+        Initialize the `AsyncBridge`, starting its loop and opening the client pool.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client sending every request; it is opened on the loop of the bridge.
+        """
+        self.api_client = api_client
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="AsyncBridge", daemon=True
+        )
+        self._thread.start()
+        self.run(api_client.open())
+
+    def _run_loop(self) -> None:
+        """Run the event loop of the bridge until it is stopped."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @property
+    def is_closed(self) -> bool:
+        """Return whether the bridge is closed."""
+        return self._loop.is_closed()
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the loop of the bridge, blocking until it completes.
+
+        Parameters
+        ----------
+        coroutine : Coroutine
+            The coroutine to run.
+
+        Returns
+        -------
+        Any
+            The result of the coroutine.
+
+        Raises
+        ------
+        RuntimeError
+            If called from the loop thread itself, which would deadlock.
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError("`AsyncBridge.run` can not be called from its loop.")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def sync_client(self) -> APIClient:
+        """
+        Return an `APIClient` sending its requests through the bridge.
+
+        The client takes the base URL, headers, timeout, validator and profiler of the
+        bridged `AsyncAPIClient`.
+        """
+        return APIClient(
+            base_url=self.api_client.base_url,
+            timeout=self.api_client.timeout,
+            default_headers=dict(self.api_client.default_headers),
+            bridge=self,
+            validator=self.api_client.validator,
+            profiler=self.api_client.profiler,
+        )
+
+    def close(self) -> None:
+        """Close the client pool, then stop and close the loop."""
+        if self.is_closed:
+            return
+        self.run(self.api_client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "AsyncBridge":
+        """Return the bridge itself, to be used as a context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the bridge when leaving the context."""
+        self.close()
@@ -0,0 +1,125 @@
+"""Canonical form of the requests, so equivalent requests share the same key."""
+
+import hashlib
+import re
+from collections.abc import Mapping
+from typing import Any
+from urllib.parse import urlencode
+
+# Comma separated params whose items are unordered.
+SET_PARAMS = frozenset({"sources", "domains", "excludeDomains", "searchIn"})
+
+# Params whose items are case insensitive identifiers.
+LOWERCASE_PARAMS = frozenset({"sources", "domains", "excludeDomains"})
+
+# Values equivalent to leaving the param out.
+DEFAULT_PARAMS = {"page": "1"}
+
+# A `+` joining two words, i.e. a space encoded as in a query string. A `+` in
+# front of a word is the "must appear" operator of the API and is kept.
+_JOINING_PLUS = re.compile(r"(?<=[^\s+])\+(?=[^\s+])")
+
+
+def canonical_endpoint(endpoint: str) -> str:
+    """Return the endpoint with exactly one leading slash and no trailing one."""
+    return "/" + endpoint.strip().strip("/")
+
+
+def canonical_value(name: str, value: Any) -> str | None:
+    """
+    Return the canonical string of a param value, `None` when it is left out.
+
+    Parameters
+    ----------
+    name : str
+        The name of the param.
+    value : Any
+        The value, as given to the client.
+
+    Returns
+    -------
+    str, optional
+        The value as sent to the API, with the whitespace collapsed, the words of
+        `q` joined with `+` split apart, and the items of the unordered comma
+        separated params sorted and deduplicated.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        text = "true" if value else "false"
+    elif isinstance(value, list | tuple | set | frozenset):
+        text = ",".join(str(item) for item in value if item is not None)
+    else:
+        text = str(value)
+
+    if name in ("q", "qInTitle"):
+        text = _JOINING_PLUS.sub(" ", text)
+    text = " ".join(text.split())
+    if name in SET_PARAMS:
+        items = {item.strip() for item in text.split(",")} - {""}
+        if name in LOWERCASE_PARAMS:
+            items = {item.lower() for item in items}
+        text = ",".join(sorted(items))
+    if DEFAULT_PARAMS.get(name) == text:
+        return None
+    return text
+
+
+def canonical_params(params: Mapping[str, Any] | None) -> list[tuple[str, str]]:
+    """Return the params as `(name, value)` pairs sorted by name, in canonical form."""
+    pairs = []
+    for name, value in (params or {}).items():
+        text = canonical_value(name, value)
+        if text is not None:
+            pairs.append((name, text))
+    return sorted(pairs)
+
+
+def canonical_query(endpoint: str, params: Mapping[str, Any] | None) -> str:
+    """
+    Return the canonical form of a request, as a readable relative URL.
+
+    Parameters
+    ----------
+    endpoint : str
+        The requested endpoint.
+    params : mapping, optional
+        The URL params of the request.
+
+    Returns
+    -------
+    str
+        The canonical endpoint, followed by the canonical params, if any.
+    """
+    query = urlencode(canonical_params(params))
+    endpoint = canonical_endpoint(endpoint)
+    return f"{endpoint}?{query}" if query else endpoint
+
+
+def request_key(
+    endpoint: str, params: Mapping[str, Any] | None, method: str = "GET"
+) -> str:
+    """
+    Return the stable hash key of a request.
+
+    Equivalent requests, differing only by the order of their params, the types of
+    their values, the order of the items of their comma separated params or their
+    whitespace, share the same key. The key suits caches, request deduplication and
+    record/replay stores.
+
+    Parameters
+    ----------
+    endpoint : str
+        The requested endpoint.
+    params : mapping, optional
+        The URL params of the request.
+    method : str, optional
+        The HTTP method of the request.
+
+    Returns
+    -------
+    str
+        The SHA-256 hex digest of the canonical request.
+    """
+    canonical = f"{method.upper()} {canonical_query(endpoint, params)}"
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,403 @@
+"""Columnar storage for large sets of articles."""
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
+
+import httpx
+
+from .timestamps import to_epoch_seconds
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# Column name, followed by the path of the value in an article returned by the API.
+ARTICLE_FIELDS: dict[str, tuple[str, ...]] = {
+    "source_id": ("source", "id"),
+    "source_name": ("source", "name"),
+    "author": ("author",),
+    "title": ("title",),
+    "description": ("description",),
+    "url": ("url",),
+    "url_to_image": ("urlToImage",),
+    "published_at": ("publishedAt",),
+    "content": ("content",),
+}
+
+# Value of the null timestamps, which is also the `NaT` of NumPy `datetime64`.
+NULL_EPOCH = -(2**63)
+
+
+class StringColumn:
+    """
+    Column of nullable strings, stored as UTF-8 bytes and int64 offsets.
+
+    The layout matches the Arrow `large_string` type, so the column is exported to
+    Arrow without copying its data.
+    """
+
+    __slots__ = ("_data", "_offsets", "_valid")
+
+    def __init__(self) -> None:
+        """Initialize an empty `StringColumn`."""
+        self._data = bytearray()
+        self._offsets = array("q", [0])
+        self._valid = bytearray()
+
+    def append(self, value: str | None) -> None:
+        """Append a value to the column."""
+        if value is not None:
+            self._data += value.encode()
+        self._offsets.append(len(self._data))
+        self._valid.append(value is not None)
+
+    def __len__(self) -> int:
+        """Return the number of values in the column."""
+        return len(self._valid)
+
+    def __getitem__(self, index: int) -> str | None:
+        """Return the value at the given row."""
+        if not self._valid[index]:
+            return None
+        index %= len(self)
+        return self._data[self._offsets[index] : self._offsets[index + 1]].decode()
+
+    def __iter__(self) -> Iterator[str | None]:
+        """Iterate over the values of the column."""
+        return (self[index] for index in range(len(self)))
+
+    def slice(self, start: int, stop: int) -> "StringColumn":
+        """Return the rows in `[start, stop)` as a new column, copying bytes only."""
+        column = StringColumn()
+        base = self._offsets[start]
+        column._data = self._data[base : self._offsets[stop]]
+        column._offsets = array(
+            "q", (offset - base for offset in self._offsets[start : stop + 1])
+        )
+        column._valid = self._valid[start:stop]
+        return column
+
+    def take(self, indices: Iterable[int]) -> "StringColumn":
+        """Return the given rows as a new column."""
+        column = StringColumn()
+        for index in indices:
+            column._data += self._data[self._offsets[index] : self._offsets[index + 1]]
+            column._offsets.append(len(column._data))
+            column._valid.append(self._valid[index])
+        return column
+
+    @property
+    def null_count(self) -> int:
+        """Return the number of null values in the column."""
+        return len(self._valid) - sum(self._valid)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the buffers, in bytes."""
+        return (
+            len(self._data)
+            + len(self._offsets) * self._offsets.itemsize
+            + len(self._valid)
+        )
+
+    def to_arrow(self) -> "pyarrow.Array":
+        """Return the column as an Arrow `large_string` array, sharing its buffers."""
+        import pyarrow
+
+        validity = _arrow_validity(self._valid) if self.null_count else None
+        return pyarrow.Array.from_buffers(
+            pyarrow.large_string(),
+            len(self),
+            [validity, pyarrow.py_buffer(self._offsets), pyarrow.py_buffer(self._data)],
+        )
+
+
+class TimestampColumn:
+    """Column of nullable timestamps, stored as int64 seconds since the epoch."""
+
+    __slots__ = ("_valid", "_values")
+
+    def __init__(self) -> None:
+        """Initialize an empty `TimestampColumn`."""
+        self._values = array("q")
+        self._valid = bytearray()
+
+    def append(self, value: str | None) -> None:
+        """Append a `publishedAt` value to the column."""
+        self._values.append(to_epoch_seconds(value) if value else NULL_EPOCH)
+        self._valid.append(bool(value))
+
+    def append_epoch(self, value: int | None) -> None:
+        """Append a timestamp given in seconds since the epoch."""
+        self._values.append(NULL_EPOCH if value is None else value)
+        self._valid.append(value is not None)
+
+    def __len__(self) -> int:
+        """Return the number of values in the column."""
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int | None:
+        """Return the epoch seconds at the given row."""
+        return self._values[index] if self._valid[index] else None
+
+    def __iter__(self) -> Iterator[int | None]:
+        """Iterate over the values of the column."""
+        return (self[index] for index in range(len(self)))
+
+    def slice(self, start: int, stop: int) -> "TimestampColumn":
+        """Return the rows in `[start, stop)` as a new column."""
+        column = TimestampColumn()
+        column._values = self._values[start:stop]
+        column._valid = self._valid[start:stop]
+        return column
+
+    def take(self, indices: Iterable[int]) -> "TimestampColumn":
+        """Return the given rows as a new column."""
+        column = TimestampColumn()
+        for index in indices:
+            column._values.append(self._values[index])
+            column._valid.append(self._valid[index])
+        return column
+
+    @property
+    def null_count(self) -> int:
+        """Return the number of null values in the column."""
+        return len(self._valid) - sum(self._valid)
+
+    @property
+    def epoch_seconds(self) -> memoryview:
+        """Return a view of the int64 values, holding `NULL_EPOCH` for nulls."""
+        return memoryview(self._values)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the buffers, in bytes."""
+        return len(self._values) * self._values.itemsize + len(self._valid)
+
+    def to_arrow(self) -> "pyarrow.Array":
+        """Return the column as an Arrow UTC timestamp array, sharing its buffer."""
+        import pyarrow
+
+        validity = _arrow_validity(self._valid) if self.null_count else None
+        return pyarrow.Array.from_buffers(
+            pyarrow.timestamp("s", tz="UTC"),
+            len(self),
+            [validity, pyarrow.py_buffer(self._values)],
+        )
+
+
+def _arrow_validity(valid: bytearray) -> "pyarrow.Buffer":
+    """Pack a validity bytearray, one byte per row, into an Arrow bitmap."""
+    import pyarrow
+
+    flags = pyarrow.Array.from_buffers(
+        pyarrow.uint8(), len(valid), [None, pyarrow.py_buffer(valid)]
+    )
+    return flags.cast(pyarrow.bool_()).buffers()[1]
+
+
+def _require_pyarrow() -> None:
+    """Raise an informative error when `pyarrow` is not installed."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as error:
+        raise ImportError(
+            "The Arrow and Parquet export requires `pyarrow`; "
+            "install it with `pip install pyarrow`."
+        ) from error
+
+
+class ArticleStore:
+    """
+    Container holding articles column by column, instead of as a list of dicts.
+
+    Every string field is kept in a `StringColumn` and `publishedAt` in a
+    `TimestampColumn`, so the memory used grows with the size of the text only. The
+    articles are turned back into dicts only when a row is accessed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty `ArticleStore`."""
+        self.columns: dict[str, StringColumn | TimestampColumn] = {
+            name: TimestampColumn() if name == "published_at" else StringColumn()
+            for name in ARTICLE_FIELDS
+        }
+
+    @classmethod
+    def from_articles(cls, articles: Iterable[dict[str, Any]]) -> "ArticleStore":
+        """Build a store holding the given articles."""
+        store = cls()
+        store.extend(articles)
+        return store
+
+    def append(self, article: dict[str, Any]) -> None:
+        """Append an article, as returned by the API."""
+        for name, path in ARTICLE_FIELDS.items():
+            value: Any = article
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            self.columns[name].append(value)
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        """
+        Append an article given as a row of values, in the order of `ARTICLE_FIELDS`.
+
+        The `published_at` value of the row is in seconds since the epoch.
+        """
+        for column, value in zip(self.columns.values(), row, strict=True):
+            if isinstance(column, TimestampColumn):
+                column.append_epoch(value)
+            else:
+                column.append(value)
+
+    def extend(self, articles: Iterable[dict[str, Any]]) -> None:
+        """Append every given article."""
+        for article in articles:
+            self.append(article)
+
+    def extend_from_response(self, response: httpx.Response) -> int:
+        """
+        Append the articles of an `/everything` or `/top-headlines` response.
+
+        Parameters
+        ----------
+        response : httpx.Response
+            A successful response of the API.
+
+        Returns
+        -------
+        int
+            The number of appended articles.
+        """
+        articles = response.json().get("articles", [])
+        self.extend(articles)
+        return len(articles)
+
+    def __len__(self) -> int:
+        """Return the number of articles in the store."""
+        return len(self.columns["url"])
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "ArticleStore": ...
+
+    def __getitem__(self, index: int | slice) -> "dict[str, Any] | ArticleStore":
+        """Return an article as a dict, or a slice of the store as a new store."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._from_columns(
+                    {
+                        name: column.slice(start, max(start, stop))
+                        for name, column in self.columns.items()
+                    }
+                )
+            return self.take(range(start, stop, step))
+
+        source_id, source_name = self.columns["source_id"], self.columns["source_name"]
+        article: dict[str, Any] = {
+            "source": {"id": source_id[index], "name": source_name[index]}
+        }
+        for name, path in ARTICLE_FIELDS.items():
+            if path[0] != "source":
+                article[path[0]] = self.columns[name][index]
+        article["publishedAt"] = self._format_published_at(article["publishedAt"])
+        return article
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the articles, materializing them one at a time."""
+        return (self[index] for index in range(len(self)))
+
+    def take(self, indices: Iterable[int]) -> "ArticleStore":
+        """Return the articles at the given rows as a new store."""
+        indices = list(indices)
+        return self._from_columns(
+            {name: column.take(indices) for name, column in self.columns.items()}
+        )
+
+    def filter(self, mask: Sequence[bool]) -> "ArticleStore":
+        """Return the articles whose entry in the mask is true, as a new store."""
+        return self.take(index for index, keep in enumerate(mask) if keep)
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> "ArticleStore":
+        """
+        Return the articles whose value in a column matches a predicate.
+
+        Parameters
+        ----------
+        name : str
+            A column name, one of the keys of `ARTICLE_FIELDS`.
+        predicate : callable
+            Called with the value of the column, e.g. epoch seconds for
+            `published_at`.
+
+        Returns
+        -------
+        ArticleStore
+            The matching articles.
+        """
+        return self.filter([predicate(value) for value in self.columns[name]])
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of all the column buffers, in bytes."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """
+        Return the articles as an Arrow table, without copying the column buffers.
+
+        Raises
+        ------
+        ImportError
+            If `pyarrow` is not installed.
+        """
+        _require_pyarrow()
+        import pyarrow
+
+        return pyarrow.table(
+            {name: column.to_arrow() for name, column in self.columns.items()}
+        )
+
+    def write_parquet(self, path: str | Path, **kwargs: Any) -> None:
+        """
+        Write the articles to a Parquet file.
+
+        Parameters
+        ----------
+        path : str or Path
+            Destination of the file.
+        **kwargs
+            Additional keyword arguments for `pyarrow.parquet.write_table`.
+
+        Raises
+        ------
+        ImportError
+            If `pyarrow` is not installed.
+        """
+        table = self.to_arrow()
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, str(path), **kwargs)
+
+    @classmethod
+    def _from_columns(
+        cls, columns: dict[str, StringColumn | TimestampColumn]
+    ) -> "ArticleStore":
+        """Build a store around existing columns."""
+        store = cls.__new__(cls)
+        store.columns = columns
+        return store
+
+    @staticmethod
+    def _format_published_at(value: int | None) -> str | None:
+        """Format epoch seconds back into the `publishedAt` format of the API."""
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value, tz=timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        )
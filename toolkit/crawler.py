@@ -0,0 +1,230 @@
+"""Crawler fetching pages asynchronously and processing them in worker processes."""
+
+import asyncio
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import httpx
+
+from .api_clients import AsyncAPIClient
+from .columnar import ARTICLE_FIELDS, ArticleStore
+from .dedupe import ArticleDeduplicator, fingerprint
+from .enums import DedupeModeEnum, ResponseStatusEnum
+from .timestamps import to_epoch_seconds
+
+# The fields an article needs to be kept.
+_REQUIRED_FIELDS = ("url", "title", "publishedAt")
+
+# Shared memory blocks attached by the current worker process, by name.
+_attached_buffers: dict[str, SharedMemory] = {}
+
+
+@dataclass
+class PageResult:
+    """Outcome of the processing of a page, sent back by a worker process."""
+
+    rows: list[tuple[Any, ...]] = field(default_factory=list)
+    fingerprints: list[int] = field(default_factory=list)
+    invalid: int = 0
+    failed: bool = False
+
+
+@dataclass
+class CrawlResult:
+    """Outcome of a crawl."""
+
+    store: ArticleStore
+    pages: int = 0
+    failed_pages: int = 0
+    invalid: int = 0
+    duplicates: int = 0
+
+
+def process_page(content: bytes) -> PageResult:
+    """
+    Decode, validate and normalize the articles of a response body.
+
+    Parameters
+    ----------
+    content : bytes
+        The JSON body of an `/everything` or `/top-headlines` response.
+
+    Returns
+    -------
+    PageResult
+        The articles as rows, in the order of `ARTICLE_FIELDS` with `published_at`
+        in epoch seconds, and their fingerprints.
+    """
+    result = PageResult()
+    try:
+        body = json.loads(content)
+    except ValueError:
+        result.failed = True
+        return result
+    if body.get("status") != ResponseStatusEnum.OK.value:
+        result.failed = True
+        return result
+
+    for article in body.get("articles", []):
+        if not all(article.get(name) for name in _REQUIRED_FIELDS):
+            result.invalid += 1
+            continue
+        try:
+            published_at = to_epoch_seconds(article["publishedAt"])
+        except ValueError:
+            result.invalid += 1
+            continue
+        row = []
+        for name, path in ARTICLE_FIELDS.items():
+            value: Any = article
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            row.append(published_at if name == "published_at" else value)
+        result.rows.append(tuple(row))
+        result.fingerprints.append(fingerprint(article))
+    return result
+
+
+def _process_shared_page(name: str, size: int) -> PageResult:
+    """Process a page stored in a shared memory block, in a worker process."""
+    buffer = _attached_buffers.get(name)
+    if buffer is None:
+        buffer = _attached_buffers[name] = SharedMemory(name=name)
+    return process_page(bytes(buffer.buf[:size]))
+
+
+class ParallelCrawler:
+    """
+    Fetch pages with an `AsyncAPIClient` and process them in a pool of processes.
+
+    The event loop only downloads: every response body is copied into one of a few
+    reusable shared memory blocks, and a worker process decodes, validates and
+    normalizes it from there, so no body is pickled on the way to the workers. The
+    workers send back compact rows and fingerprints, which are deduplicated and
+    appended to an `ArticleStore` in the main process. Bodies larger than a block
+    are sent to the workers as plain bytes. A page whose request fails is counted
+    as failed, without stopping the crawl.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        workers: int | None = None,
+        max_concurrency: int = 10,
+        buffer_size: int = 4 * 2**20,
+        dedupe_mode: DedupeModeEnum = DedupeModeEnum.EXACT,
+    ) -> None:
+        """
+        Initialize the `ParallelCrawler`.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client used to fetch the pages.
+        workers : int, optional
+            Number of worker processes, the number of CPUs by default. With 0, the
+            pages are processed in the event loop, without any process pool.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time.
+        buffer_size : int, optional
+            Size of every shared memory block, in bytes.
+        dedupe_mode : DedupeModeEnum, optional
+            Mode of the deduplication of the crawled articles.
+        """
+        self.api_client = api_client
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_concurrency = max_concurrency
+        self.buffer_size = buffer_size
+        self.dedupe_mode = dedupe_mode
+
+    async def crawl(
+        self, requests: Iterable[tuple[str, dict[str, Any]]]
+    ) -> CrawlResult:
+        """
+        Fetch and process every requested page.
+
+        Parameters
+        ----------
+        requests : iterable of tuple
+            The `(endpoint, params)` pairs of the pages.
+
+        Returns
+        -------
+        CrawlResult
+            The deduplicated articles and the counts of the crawl.
+        """
+        result = CrawlResult(store=ArticleStore())
+        deduplicator = ArticleDeduplicator(mode=self.dedupe_mode)
+        if self.workers == 0:
+            await self._crawl(requests, None, [], result, deduplicator)
+            return result
+
+        # Two blocks per worker keep every worker busy while the next page is copied.
+        buffers = [
+            SharedMemory(create=True, size=self.buffer_size)
+            for _ in range(2 * self.workers)
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                await self._crawl(requests, executor, buffers, result, deduplicator)
+        finally:
+            for buffer in buffers:
+                buffer.close()
+                buffer.unlink()
+        return result
+
+    async def _crawl(
+        self,
+        requests: Iterable[tuple[str, dict[str, Any]]],
+        executor: Executor | None,
+        buffers: list[SharedMemory],
+        result: CrawlResult,
+        deduplicator: ArticleDeduplicator,
+    ) -> None:
+        """Fetch the pages concurrently and merge their processed articles."""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        free_buffers: asyncio.Queue[SharedMemory] = asyncio.Queue()
+        for buffer in buffers:
+            free_buffers.put_nowait(buffer)
+
+        async def process(content: bytes) -> PageResult:
+            if executor is None:
+                return process_page(content)
+            if len(content) > self.buffer_size:
+                return await loop.run_in_executor(executor, process_page, content)
+            buffer = await free_buffers.get()
+            buffer.buf[: len(content)] = content
+            future = loop.run_in_executor(
+                executor, _process_shared_page, buffer.name, len(content)
+            )
+            # The block is only reused once the worker is done with it, even when
+            # the crawl is cancelled while the worker still reads it.
+            future.add_done_callback(lambda _: free_buffers.put_nowait(buffer))
+            return await asyncio.shield(future)
+
+        async def crawl_page(endpoint: str, params: dict[str, Any]) -> None:
+            try:
+                async with semaphore:
+                    response = await self.api_client.get(endpoint, params=params)
+            except httpx.HTTPError:
+                page = PageResult(failed=True)
+            else:
+                page = await process(response.content)
+            result.pages += 1
+            result.failed_pages += page.failed
+            result.invalid += page.invalid
+            for value, row in zip(page.fingerprints, page.rows, strict=True):
+                if deduplicator.add_fingerprint(value):
+                    result.store.append_row(row)
+                else:
+                    result.duplicates += 1
+
+        await asyncio.gather(
+            *(crawl_page(endpoint, params) for endpoint, params in requests)
+        )
@@ -0,0 +1,267 @@
+"""Article deduplication based on compact 64-bit fingerprints."""
+
+import hashlib
+import math
+from array import array
+from collections.abc import Iterable
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .enums import DedupeModeEnum
+
+# Query params which only track the referrer and never identify an article.
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ocid", "ref"})
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize an article URL, so the same article always maps to the same string.
+
+    The scheme, host and `www.` prefix, the fragment, the tracking params and the
+    trailing slash are dropped, and the remaining query params are sorted.
+
+    Parameters
+    ----------
+    url : str
+        The `url` field of an article.
+
+    Returns
+    -------
+    str
+        The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in _TRACKING_PARAMS and not name.startswith("utm_")
+    )
+    return urlunsplit(("", host, parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def fingerprint(article: dict[str, Any]) -> int:
+    """
+    Return the 64-bit fingerprint of an article.
+
+    The fingerprint hashes the normalized `url` together with the case folded,
+    whitespace collapsed `title`. Zero is reserved as the empty slot marker of
+    `FingerprintSet`, so the returned value is always in `[1, 2**64)`.
+
+    Parameters
+    ----------
+    article : dict
+        An article, as returned by the API.
+
+    Returns
+    -------
+    int
+        The fingerprint of the article.
+    """
+    url = normalize_url(article.get("url") or "")
+    title = " ".join((article.get("title") or "").casefold().split())
+    digest = hashlib.blake2b(
+        f"{url}\x00{title}".encode(), digest_size=8, usedforsecurity=False
+    ).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class FingerprintSet:
+    """
+    Exact set of fingerprints, stored in a flat array of unsigned 64-bit integers.
+
+    Open addressing with linear probing is used, and the table is doubled whenever
+    it gets half full, so every fingerprint costs between 16 and 32 bytes. Zero
+    marks the empty slots, so a zero fingerprint is stored as 1, as `fingerprint`
+    does.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """
+        Initialize the `FingerprintSet`.
+
+        Parameters
+        ----------
+        capacity : int, optional
+            Number of fingerprints the set holds before its first resize.
+        """
+        size = 1 << max(3, (2 * capacity - 1).bit_length())
+        self._slots = array("Q", [0]) * size
+        self._mask = size - 1
+        self._length = 0
+
+    def add(self, value: int) -> bool:
+        """Add a fingerprint, returning whether it was not in the set yet."""
+        value = value or 1
+        if 2 * (self._length + 1) > len(self._slots):
+            self._resize(2 * len(self._slots))
+
+        slots, mask = self._slots, self._mask
+        index = value & mask
+        while True:
+            slot = slots[index]
+            if slot == 0:
+                slots[index] = value
+                self._length += 1
+                return True
+            if slot == value:
+                return False
+            index = (index + 1) & mask
+
+    def __contains__(self, value: object) -> bool:
+        """Return whether the fingerprint is in the set."""
+        if not isinstance(value, int) or value < 0:
+            return False
+        value = value or 1
+        slots, mask = self._slots, self._mask
+        index = value & mask
+        while True:
+            slot = slots[index]
+            if slot == 0:
+                return False
+            if slot == value:
+                return True
+            index = (index + 1) & mask
+
+    def __len__(self) -> int:
+        """Return the number of fingerprints in the set."""
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the underlying table, in bytes."""
+        return len(self._slots) * self._slots.itemsize
+
+    def _resize(self, size: int) -> None:
+        """Rehash every fingerprint into a table of the given size."""
+        old_slots = self._slots
+        self._slots = array("Q", [0]) * size
+        self._mask = size - 1
+        self._length = 0
+        for value in old_slots:
+            if value:
+                self.add(value)
+
+
+class BloomFilter:
+    """
+    Approximate set of fingerprints, with no false negatives.
+
+    The `k` bit positions are derived from the two 32-bit halves of the fingerprint
+    (double hashing), so no extra hashing is needed per lookup.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Initialize the `BloomFilter`.
+
+        Parameters
+        ----------
+        capacity : int
+            Expected number of fingerprints.
+        error_rate : float, optional
+            Target false positive rate once `capacity` fingerprints are added.
+        """
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("`capacity` must be positive and `error_rate` in (0, 1).")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+        self._length = 0
+
+    def _positions(self, value: int) -> Iterable[int]:
+        """Yield the bit positions of a fingerprint."""
+        low, high = value & 0xFFFFFFFF, value >> 32 | 1
+        num_bits = self._num_bits
+        for i in range(self._num_hashes):
+            yield (low + i * high) % num_bits
+
+    def add(self, value: int) -> bool:
+        """Add a fingerprint, returning whether it was (probably) not added yet."""
+        bits = self._bits
+        added = False
+        for position in self._positions(value):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        self._length += added
+        return added
+
+    def __contains__(self, value: object) -> bool:
+        """Return whether the fingerprint was (probably) added."""
+        if not isinstance(value, int):
+            return False
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def __len__(self) -> int:
+        """Return the approximate number of distinct fingerprints added."""
+        return self._length
+
+    @property
+    def nbytes(self) -> int:
+        """Return the size of the bit array, in bytes."""
+        return len(self._bits)
+
+
+class ArticleDeduplicator:
+    """Drop the articles already seen, keeping only their fingerprints in memory."""
+
+    def __init__(
+        self,
+        mode: DedupeModeEnum = DedupeModeEnum.EXACT,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        """
+        Initialize the `ArticleDeduplicator`.
+
+        Parameters
+        ----------
+        mode : DedupeModeEnum, optional
+            `EXACT` keeps every fingerprint in a `FingerprintSet`; `APPROXIMATE` uses
+            a `BloomFilter`, which may drop a new article with `error_rate` chance.
+        capacity : int, optional
+            Expected number of distinct articles.
+        error_rate : float, optional
+            False positive rate of the approximate mode.
+        """
+        self.mode = DedupeModeEnum(mode)
+        self._seen: FingerprintSet | BloomFilter = (
+            FingerprintSet(capacity)
+            if self.mode == DedupeModeEnum.EXACT
+            else BloomFilter(capacity, error_rate)
+        )
+
+    def add(self, article: dict[str, Any]) -> bool:
+        """Record an article, returning whether it was not seen yet."""
+        return self._seen.add(fingerprint(article))
+
+    def add_fingerprint(self, value: int) -> bool:
+        """Record an article by its `fingerprint`, returning whether it is new."""
+        return self._seen.add(value)
+
+    def filter(self, articles: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the articles not seen yet, recording them on the way."""
+        return [article for article in articles if self.add(article)]
+
+    def __contains__(self, article: object) -> bool:
+        """Return whether the article was seen already."""
+        return isinstance(article, dict) and fingerprint(article) in self._seen
+
+    def __len__(self) -> int:
+        """Return the number of distinct articles seen."""
+        return len(self._seen)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the fingerprints, in bytes."""
+        return self._seen.nbytes
@@ -31,3 +31,18 @@ class APIEndpointEnum(str, Enum):
     EVERYTHING = "/everything"
     TOP_HEADLINES = "/top-headlines"
     SOURCES = "/sources"
+    TOP_HEADLINES_SOURCES = "/top-headlines/sources"
+
+
+class DedupeModeEnum(str, Enum):
+    """Enumeration of the article deduplication modes."""
+
+    EXACT = "exact"
+    APPROXIMATE = "approximate"
+
+
+class ValidationModeEnum(str, Enum):
+    """Enumeration of the ways the request validator handles invalid params."""
+
+    REJECT = "reject"
+    NORMALIZE = "normalize"
@@ -0,0 +1,260 @@
+"""Persistent request journal, to resume bulk jobs where they stopped."""
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .api_clients import AsyncAPIClient
+from .canonical import request_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS requests (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    response_path TEXT NOT NULL,
+    completed_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class JournalEntry:
+    """A completed request, as recorded in the journal."""
+
+    key: str
+    endpoint: str
+    params: dict[str, Any]
+    status_code: int
+    response_path: str
+    completed_at: float
+
+
+@dataclass
+class JobSummary:
+    """Outcome of a run of a `JournaledJobRunner`."""
+
+    completed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    pending: list[str] = field(default_factory=list)
+    rate_limited: bool = False
+
+
+class RequestJournal:
+    """
+    Append-only journal of the completed requests, stored in SQLite.
+
+    An entry is written once the response body is safely on disk, so every key in
+    the journal can be skipped when the job is restarted.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Initialize the `RequestJournal`, creating the database if needed.
+
+        Parameters
+        ----------
+        path : str or Path
+            The SQLite database file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    @staticmethod
+    def request_key(endpoint: str, params: dict[str, Any]) -> str:
+        """Return the key identifying a request, the same for equivalent ones."""
+        return request_key(endpoint, params)
+
+    def record(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        status_code: int,
+        response_path: str | Path,
+    ) -> str:
+        """
+        Record a completed request, returning its key.
+
+        Parameters
+        ----------
+        endpoint : str
+            The requested endpoint.
+        params : dict
+            The URL params of the request.
+        status_code : int
+            The status code of the response.
+        response_path : str or Path
+            Where the response body is stored.
+
+        Returns
+        -------
+        str
+            The key of the request.
+        """
+        key = self.request_key(endpoint, params)
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO requests VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    endpoint,
+                    json.dumps(params),
+                    status_code,
+                    str(response_path),
+                    time.time(),
+                ),
+            )
+        return key
+
+    def is_completed(self, key: str) -> bool:
+        """Return whether the request with the given key is recorded."""
+        row = self._connection.execute(
+            "SELECT 1 FROM requests WHERE key = ?", (key,)
+        ).fetchone()
+        return row is not None
+
+    def completed_keys(self) -> set[str]:
+        """Return the keys of all the recorded requests."""
+        return {row[0] for row in self._connection.execute("SELECT key FROM requests")}
+
+    def entries(self) -> Iterator[JournalEntry]:
+        """Iterate over the recorded requests, in completion order."""
+        rows = self._connection.execute(
+            "SELECT * FROM requests ORDER BY completed_at, rowid"
+        )
+        for key, endpoint, params, status_code, path, completed_at in rows:
+            yield JournalEntry(
+                key, endpoint, json.loads(params), status_code, path, completed_at
+            )
+
+    def __len__(self) -> int:
+        """Return the number of recorded requests."""
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM requests").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> "RequestJournal":
+        """Return the journal itself, to be used as a context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the journal when leaving the context."""
+        self.close()
+
+
+class JournaledJobRunner:
+    """
+    Run a bulk job of requests, skipping the ones completed by a previous run.
+
+    Every response is stored as a file in `output_dir`, then recorded in the journal.
+    Rate limited and server error responses are not recorded, so they are retried on
+    the next run; a rate limited response also stops the current run, to avoid
+    spending the remaining quota on requests which would be refused as well.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        journal: RequestJournal,
+        output_dir: str | Path,
+        max_concurrency: int = 5,
+    ) -> None:
+        """
+        Initialize the `JournaledJobRunner`.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client used to send the requests.
+        journal : RequestJournal
+            The journal of the completed requests.
+        output_dir : str or Path
+            Directory where the response bodies are stored.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time.
+        """
+        self.api_client = api_client
+        self.journal = journal
+        self.output_dir = Path(output_dir)
+        self.max_concurrency = max_concurrency
+
+    async def run(self, requests: Iterable[tuple[str, dict[str, Any]]]) -> JobSummary:
+        """
+        Send every request missing from the journal.
+
+        Parameters
+        ----------
+        requests : iterable of tuple
+            The `(endpoint, params)` pairs making up the job.
+
+        Returns
+        -------
+        JobSummary
+            The keys of the completed, skipped and still pending requests.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        summary = JobSummary()
+        completed_keys = self.journal.completed_keys()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        stop = asyncio.Event()
+
+        async def run_one(endpoint: str, params: dict[str, Any], key: str) -> None:
+            async with semaphore:
+                if stop.is_set():
+                    summary.pending.append(key)
+                    return
+                try:
+                    response = await self.api_client.get(endpoint, params=params)
+                except httpx.HTTPError:
+                    summary.pending.append(key)
+                    return
+
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                summary.rate_limited = True
+                stop.set()
+                summary.pending.append(key)
+            elif response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                summary.pending.append(key)
+            else:
+                path = self._store(key, response.content)
+                self.journal.record(endpoint, params, response.status_code, path)
+                summary.completed.append(key)
+
+        tasks = []
+        for endpoint, params in requests:
+            key = self.journal.request_key(endpoint, params)
+            if key in completed_keys:
+                summary.skipped.append(key)
+                continue
+            completed_keys.add(key)
+            tasks.append(run_one(endpoint, params, key))
+        await asyncio.gather(*tasks)
+        return summary
+
+    def _store(self, key: str, content: bytes) -> Path:
+        """Write a response body atomically, returning its path."""
+        path = self.output_dir / f"{key}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("wb") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,381 @@
+"""
+Continuous performance monitor of the API, storing its samples in SQLite.
+
+`APIMonitor` probes every endpoint of `APIEndpointEnum` periodically, with small
+representative requests, and records the latency, status code and body size of
+every probe in a `SampleStore`. The store keeps one compact row per sample, drops
+the samples older than its retention, and answers rolling percentile and error rate
+queries in SQL, without loading the samples in memory.
+
+The probes are spread so they never send more than `daily_quota` requests per day,
+and a rate limited probe doubles the interval until a probe succeeds again.
+
+Run it alongside the other consumers of the API key, with the base URL and the API
+key taken from the settings, and query it from another shell:
+
+    python -m toolkit.monitor run --db monitor.sqlite --daily-quota 50
+    python -m toolkit.monitor report --db monitor.sqlite --window 24
+"""
+
+import argparse
+import asyncio
+import math
+import sqlite3
+import sys
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .api_clients import AsyncAPIClient
+from .enums import APIEndpointEnum
+
+# Small requests representative of every endpoint, so the probes are cheap.
+PROBES: dict[APIEndpointEnum, dict[str, Any]] = {
+    APIEndpointEnum.EVERYTHING: {"q": "news", "pageSize": 1},
+    APIEndpointEnum.TOP_HEADLINES: {"country": "us", "pageSize": 1},
+    APIEndpointEnum.SOURCES: {"country": "us"},
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    timestamp INTEGER NOT NULL,
+    endpoint TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    latency_ms REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_endpoint ON samples (endpoint, timestamp);
+"""
+
+_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Outcome of a probe; a status code of 0 is a request which failed."""
+
+    timestamp: float
+    endpoint: str
+    status_code: int
+    latency_ms: float
+    size: int
+
+    @property
+    def is_error(self) -> bool:
+        """Return whether the probe failed or got an error response."""
+        return not HTTPStatus.OK <= self.status_code < HTTPStatus.BAD_REQUEST
+
+
+@dataclass(frozen=True)
+class EndpointSummary:
+    """Rolling statistics of the samples of an endpoint over a window."""
+
+    endpoint: str
+    samples: int
+    error_rate: float
+    percentiles: dict[int, float]
+
+    def __str__(self) -> str:
+        """Return the statistics on one line."""
+        latencies = ", ".join(
+            f"p{percent} {latency:.1f}" for percent, latency in self.percentiles.items()
+        )
+        return (
+            f"{self.endpoint}: {self.samples} samples, "
+            f"{self.error_rate:.1%} errors, {latencies or 'no latency'} ms"
+        )
+
+
+class SampleStore:
+    """
+    Time series of the probe samples, stored in SQLite.
+
+    Each sample is a row of five small columns, indexed by endpoint and time, and the
+    samples older than the retention are deleted as new ones are recorded, so the
+    file stays small whatever the time the monitor runs.
+    """
+
+    def __init__(self, path: str | Path, retention: timedelta = 30 * _DAY) -> None:
+        """
+        Initialize the `SampleStore`, creating the database if needed.
+
+        Parameters
+        ----------
+        path : str or Path
+            The SQLite database file.
+        retention : timedelta, optional
+            How long the samples are kept.
+        """
+        self.path = Path(path)
+        self.retention = retention
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+    def record(self, samples: Sequence[Sample]) -> None:
+        """Store samples, dropping the ones past the retention."""
+        oldest = time.time() - self.retention.total_seconds()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO samples VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        int(sample.timestamp),
+                        sample.endpoint,
+                        sample.status_code,
+                        sample.latency_ms,
+                        sample.size,
+                    )
+                    for sample in samples
+                ),
+            )
+            self._connection.execute(
+                "DELETE FROM samples WHERE timestamp < ?", (int(oldest),)
+            )
+
+    def samples(self, endpoint: str, window: timedelta) -> Iterator[Sample]:
+        """Yield the samples of an endpoint over the last `window`, oldest first."""
+        cursor = self._connection.execute(
+            "SELECT * FROM samples WHERE endpoint = ? AND timestamp >= ? "
+            "ORDER BY timestamp",
+            (endpoint, self._since(window)),
+        )
+        for row in cursor:
+            yield Sample(*row)
+
+    def endpoints(self) -> list[str]:
+        """Return the endpoints having samples."""
+        rows = self._connection.execute("SELECT DISTINCT endpoint FROM samples")
+        return sorted(endpoint for (endpoint,) in rows)
+
+    def percentiles(
+        self,
+        endpoint: str,
+        window: timedelta,
+        percents: Sequence[int] = (50, 95, 99),
+    ) -> dict[int, float]:
+        """
+        Return latency percentiles of the successful probes of an endpoint.
+
+        The percentiles are computed by SQLite with the nearest-rank method, so the
+        samples are never loaded in memory.
+
+        Parameters
+        ----------
+        endpoint : str
+            The probed endpoint.
+        window : timedelta
+            The rolling window, ending now.
+        percents : sequence of int, optional
+            The percentiles to compute, from 1 to 100.
+
+        Returns
+        -------
+        dict
+            The latency in milliseconds by percentile, empty without samples.
+        """
+        where = (
+            "FROM samples WHERE endpoint = ? AND timestamp >= ? "
+            "AND status_code BETWEEN 200 AND 399"
+        )
+        arguments = (endpoint, self._since(window))
+        (count,) = self._connection.execute(
+            f"SELECT COUNT(*) {where}", arguments
+        ).fetchone()
+        result = {}
+        for percent in percents if count else ():
+            rank = max(1, math.ceil(percent / 100 * count))
+            (latency,) = self._connection.execute(
+                f"SELECT latency_ms {where} ORDER BY latency_ms LIMIT 1 OFFSET ?",
+                (*arguments, rank - 1),
+            ).fetchone()
+            result[percent] = latency
+        return result
+
+    def error_rate(self, endpoint: str, window: timedelta) -> float:
+        """Return the share of failed probes of an endpoint over a window."""
+        total, errors = self._connection.execute(
+            "SELECT COUNT(*), SUM(status_code NOT BETWEEN 200 AND 399) "
+            "FROM samples WHERE endpoint = ? AND timestamp >= ?",
+            (endpoint, self._since(window)),
+        ).fetchone()
+        return errors / total if total else 0.0
+
+    def summary(
+        self, window: timedelta, percents: Sequence[int] = (50, 95, 99)
+    ) -> list[EndpointSummary]:
+        """Return the rolling statistics of every endpoint over a window."""
+        summaries = []
+        for endpoint in self.endpoints():
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM samples WHERE endpoint = ? AND timestamp >= ?",
+                (endpoint, self._since(window)),
+            ).fetchone()
+            summaries.append(
+                EndpointSummary(
+                    endpoint=endpoint,
+                    samples=count,
+                    error_rate=self.error_rate(endpoint, window),
+                    percentiles=self.percentiles(endpoint, window, percents),
+                )
+            )
+        return summaries
+
+    @staticmethod
+    def _since(window: timedelta) -> int:
+        """Return the timestamp of the start of a window ending now."""
+        return int(time.time() - window.total_seconds())
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+
+class APIMonitor:
+    """Probe the endpoints of the API periodically, recording the samples."""
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        store: SampleStore,
+        interval: timedelta = timedelta(minutes=15),
+        daily_quota: int | None = 50,
+        probes: Mapping[APIEndpointEnum | str, dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        Initialize the `APIMonitor`.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client sending the probes.
+        store : SampleStore
+            Where the samples are recorded.
+        interval : timedelta, optional
+            The shortest time between two rounds of probes.
+        daily_quota : int, optional
+            Maximum number of probes per day, which lengthens the interval when
+            needed; `None` for no limit.
+        probes : mapping, optional
+            The params of the probe of every endpoint, `PROBES` by default.
+        """
+        self.api_client = api_client
+        self.store = store
+        self.probes = {
+            getattr(endpoint, "value", endpoint): params
+            for endpoint, params in (probes or PROBES).items()
+        }
+        self.interval = interval
+        if daily_quota is not None:
+            if daily_quota < 1:
+                raise ValueError("The daily quota must be at least one request.")
+            self.interval = max(interval, _DAY * len(self.probes) / daily_quota)
+        self._backoff = 1
+
+    async def probe(self, endpoint: str, params: dict[str, Any]) -> Sample:
+        """Send the probe of an endpoint, returning its sample."""
+        timestamp = time.time()
+        start = time.perf_counter()
+        try:
+            response = await self.api_client.get(endpoint, params=params)
+        except httpx.HTTPError:
+            return Sample(
+                timestamp, endpoint, 0, (time.perf_counter() - start) * 1000, 0
+            )
+        return Sample(
+            timestamp,
+            endpoint,
+            response.status_code,
+            (time.perf_counter() - start) * 1000,
+            len(response.content),
+        )
+
+    async def probe_all(self) -> list[Sample]:
+        """Probe every endpoint concurrently and record the samples."""
+        samples = await asyncio.gather(
+            *(self.probe(endpoint, params) for endpoint, params in self.probes.items())
+        )
+        self.store.record(samples)
+        rate_limited = any(
+            sample.status_code == HTTPStatus.TOO_MANY_REQUESTS for sample in samples
+        )
+        self._backoff = min(self._backoff * 2, 64) if rate_limited else 1
+        return samples
+
+    @property
+    def next_delay(self) -> timedelta:
+        """Return the time to wait before the next round, backing off when limited."""
+        return min(self.interval * self._backoff, _DAY)
+
+    async def run(self, rounds: int | None = None) -> None:
+        """
+        Probe the endpoints every interval, forever or for a number of rounds.
+
+        Parameters
+        ----------
+        rounds : int, optional
+            Number of rounds of probes, unlimited by default.
+        """
+        count = 0
+        while rounds is None or count < rounds:
+            start = time.monotonic()
+            await self.probe_all()
+            count += 1
+            if rounds is not None and count >= rounds:
+                break
+            elapsed = time.monotonic() - start
+            await asyncio.sleep(max(0.0, self.next_delay.total_seconds() - elapsed))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the monitor, or report the statistics of its samples."""
+    parser = argparse.ArgumentParser(description="Monitor the API performance.")
+    parser.add_argument("command", choices=("run", "report"))
+    parser.add_argument("--db", default="monitor.sqlite")
+    parser.add_argument("--interval", type=float, default=15, help="In minutes.")
+    parser.add_argument("--daily-quota", type=int, default=50)
+    parser.add_argument("--retention", type=float, default=30, help="In days.")
+    parser.add_argument("--window", type=float, default=24, help="In hours.")
+    args = parser.parse_args(argv)
+
+    store = SampleStore(args.db, retention=timedelta(days=args.retention))
+    if args.command == "report":
+        for summary in store.summary(timedelta(hours=args.window)):
+            print(summary)
+        store.close()
+        return 0
+
+    from config.base import settings
+
+    async def monitor() -> None:
+        async with AsyncAPIClient(
+            base_url=settings.BASE_URL,
+            default_headers={"X-API-KEY": settings.API_KEY},
+            limits=httpx.Limits(max_connections=len(PROBES)),
+        ) as api_client:
+            await APIMonitor(
+                api_client,
+                store,
+                interval=timedelta(minutes=args.interval),
+                daily_quota=args.daily_quota,
+            ).run()
+
+    try:
+        asyncio.run(monitor())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""Planner splitting oversized `/everything` queries into date-sliced shards."""
+
+import asyncio
+import math
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from typing import Any
+
+from .api_clients import AsyncAPIClient
+from .enums import APIEndpointEnum, ResponseCodeEnum
+
+# Format of the `from` and `to` params sent by the planner, in UTC.
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+@dataclass
+class Shard:
+    """A date window of a query, small enough to be retrieved completely."""
+
+    start: datetime
+    end: datetime
+    total_results: int
+    truncated: bool = False
+    first_page: list[dict[str, Any]] = field(default_factory=list, repr=False)
+
+    def params(self) -> dict[str, str]:
+        """Return the `from` and `to` params of the shard."""
+        return {
+            "from": self.start.strftime(_DATETIME_FORMAT),
+            "to": self.end.strftime(_DATETIME_FORMAT),
+        }
+
+
+class QueryPlanner:
+    """
+    Retrieve the complete result set of an `/everything` query, shard by shard.
+
+    The API only returns the first `max_results` results of a query. The planner
+    probes the `totalResults` of the requested date window and recursively halves
+    the window until every shard fits under the cap, then fetches all the shards
+    concurrently. The probe asks for a full page, which is kept as the first page of
+    the shard, so no page is requested twice.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        max_results: int = 100,
+        page_size: int = 100,
+        max_concurrency: int = 5,
+        min_window: timedelta = timedelta(minutes=1),
+        horizon: timedelta | None = timedelta(days=5 * 365),
+    ) -> None:
+        """
+        Initialize the `QueryPlanner`.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client used to send the requests.
+        max_results : int, optional
+            The maximum number of results the plan of the API key can retrieve per
+            query.
+        page_size : int, optional
+            The `pageSize` param sent on every request, at most 100.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time.
+        min_window : timedelta, optional
+            Windows are not split below this duration; such shards are flagged as
+            truncated when they still exceed the cap.
+        horizon : timedelta, optional
+            How far in the past the API accepts the `from` param; earlier starts are
+            moved up to it. `None` disables the check.
+        """
+        self.api_client = api_client
+        self.max_results = max_results
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+        self.min_window = min_window
+        self.horizon = horizon
+
+    async def plan(
+        self, params: dict[str, Any], start: datetime, end: datetime
+    ) -> list[Shard]:
+        """
+        Split a date window into shards which fit under the results cap.
+
+        Parameters
+        ----------
+        params : dict
+            The query params, without `from`, `to`, `page` and `pageSize`.
+        start, end : datetime
+            The inclusive date window of the query, in UTC when naive.
+
+        Returns
+        -------
+        list of Shard
+            The shards, in chronological order.
+        """
+        start, end = _as_utc(start), _as_utc(end)
+        if self.horizon is not None:
+            start = max(start, datetime.now(tz=timezone.utc) - self.horizon)
+        if start > end:
+            return []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await self._split(params, start.replace(microsecond=0), end, semaphore)
+
+    async def execute(
+        self, params: dict[str, Any], shards: list[Shard]
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every page of the shards concurrently.
+
+        Parameters
+        ----------
+        params : dict
+            The query params the shards were planned for.
+        shards : list of Shard
+            The shards returned by `plan`.
+
+        Returns
+        -------
+        list of dict
+            The articles, deduplicated by URL.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        requests: list[Coroutine[Any, Any, list[dict[str, Any]]]] = []
+        for shard in shards:
+            retrievable = min(shard.total_results, self.max_results)
+            last_page = math.ceil(retrievable / self.page_size)
+            requests.extend(
+                self._fetch_page(params, shard, page, semaphore)
+                for page in range(2, last_page + 1)
+            )
+        pages = await asyncio.gather(*requests)
+
+        articles: list[dict[str, Any]] = []
+        seen_urls: set[str] = set()
+        for page in [shard.first_page for shard in shards] + pages:
+            for article in page:
+                url = article.get("url")
+                if url in seen_urls:
+                    continue
+                if url is not None:
+                    seen_urls.add(url)
+                articles.append(article)
+        return articles
+
+    async def run(
+        self, params: dict[str, Any], start: datetime, end: datetime
+    ) -> list[dict[str, Any]]:
+        """Plan the shards of a query, then fetch all their articles."""
+        shards = await self.plan(params, start, end)
+        return await self.execute(params, shards)
+
+    async def _split(
+        self,
+        params: dict[str, Any],
+        start: datetime,
+        end: datetime,
+        semaphore: asyncio.Semaphore,
+    ) -> list[Shard]:
+        """Probe a window, halving it recursively while it exceeds the cap."""
+        shard = Shard(start=start, end=end, total_results=0)
+        body = await self._get(params, shard, 1, semaphore)
+        shard.total_results = body.get("totalResults", 0)
+        if shard.total_results <= self.max_results:
+            shard.first_page = body.get("articles", [])
+            return [shard]
+        if end - start <= self.min_window:
+            shard.truncated = True
+            shard.first_page = body.get("articles", [])
+            return [shard]
+
+        middle = start + (end - start) / 2
+        middle = middle.replace(microsecond=0)
+        # The `from` and `to` params are inclusive, down to the second.
+        left, right = await asyncio.gather(
+            self._split(params, start, middle, semaphore),
+            self._split(params, middle + timedelta(seconds=1), end, semaphore),
+        )
+        return left + right
+
+    async def _fetch_page(
+        self,
+        params: dict[str, Any],
+        shard: Shard,
+        page: int,
+        semaphore: asyncio.Semaphore,
+    ) -> list[dict[str, Any]]:
+        """Fetch a page of a shard, empty once the results cap is reached."""
+        body = await self._get(params, shard, page, semaphore)
+        articles: list[dict[str, Any]] = body.get("articles", [])
+        return articles
+
+    async def _get(
+        self,
+        params: dict[str, Any],
+        shard: Shard,
+        page: int,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, Any]:
+        """Send a request of a shard, returning its decoded body."""
+        query_params = {
+            **params,
+            **shard.params(),
+            "page": page,
+            "pageSize": self.page_size,
+        }
+        async with semaphore:
+            response = await self.api_client.get(
+                APIEndpointEnum.EVERYTHING.value, params=query_params
+            )
+        body: dict[str, Any] = response.json()
+        if response.status_code != HTTPStatus.OK:
+            if body.get("code") == ResponseCodeEnum.MAXIMUM_RESULTS_REACHED.value:
+                return {}
+            response.raise_for_status()
+        return body
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return the datetime in UTC, assuming UTC for naive values."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
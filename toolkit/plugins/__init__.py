@@ -0,0 +1,9 @@
+"""Pytest plugins of the test suite, registered by the root `conftest.py`."""
+
+from contextvars import ContextVar
+
+# The node id of the test running in the current context, to attribute requests.
+current_test: ContextVar[str | None] = ContextVar("current_test", default=None)
+
+# Whether the requests of the current context must reach the API, bypassing caches.
+fresh_responses: ContextVar[bool] = ContextVar("fresh_responses", default=False)
@@ -0,0 +1,87 @@
+"""
+Pytest plugin running asynchronous `pytest-bdd` steps on a shared event loop.
+
+`pytest-bdd` calls the step functions synchronously, so a coroutine step function
+would only return its coroutine. Decorating it with `async_step`, below the step
+decorator, runs it to completion instead:
+
+    @given("a user with a valid API key", target_fixture="response")
+    @async_step
+    async def given_user(api_client: AsyncAPIClient) -> httpx.Response:
+        return await api_client.get(APIEndpointEnum.TOP_HEADLINES.value)
+
+The steps run on the loop of the session-scoped `async_bridge` fixture, an
+`AsyncBridge` opening the `api_client` fixture of the suite, so the steps of every
+scenario share the same connection pool and a step may gather several requests.
+"""
+
+import inspect
+from collections.abc import Callable, Coroutine, Generator
+from functools import wraps
+from typing import Any, TypeVar
+
+import pytest
+
+from toolkit.api_clients import AsyncAPIClient
+from toolkit.bridge import AsyncBridge
+
+T = TypeVar("T")
+
+# Name of the fixture running the steps, added to their signature.
+BRIDGE_FIXTURE = "async_bridge"
+
+
+def async_step(
+    step_func: Callable[..., Coroutine[Any, Any, T]],
+) -> Callable[..., T]:
+    """
+    Turn a coroutine function into a step function running it on the session loop.
+
+    Parameters
+    ----------
+    step_func : Callable
+        The coroutine function of the step; its arguments are resolved by
+        `pytest-bdd` as for any step function.
+
+    Returns
+    -------
+    Callable
+        A synchronous step function returning the result of the coroutine.
+    """
+    signature = inspect.signature(step_func)
+    takes_bridge = BRIDGE_FIXTURE in signature.parameters
+
+    @wraps(step_func)
+    def step(**kwargs: Any) -> T:
+        bridge: AsyncBridge = (
+            kwargs[BRIDGE_FIXTURE] if takes_bridge else kwargs.pop(BRIDGE_FIXTURE)
+        )
+        return bridge.run(step_func(**kwargs))
+
+    if not takes_bridge:
+        bridge_param = inspect.Parameter(
+            BRIDGE_FIXTURE, inspect.Parameter.POSITIONAL_OR_KEYWORD
+        )
+        signature = signature.replace(
+            parameters=[bridge_param, *signature.parameters.values()]
+        )
+    # `pytest-bdd` requests the fixtures named in the signature of the step.
+    step.__signature__ = signature  # type: ignore[attr-defined]
+    return step
+
+
+@pytest.fixture(scope="session")
+def async_bridge(api_client: AsyncAPIClient) -> Generator[AsyncBridge, None, None]:
+    """
+    Provide the `AsyncBridge` running the asynchronous steps of the session.
+
+    The `api_client` fixture of the suite is opened on the loop of the bridge, so
+    its connection pool is reused by every step, and closed with the session.
+
+    Yields
+    ------
+    AsyncBridge
+        The bridge of the session.
+    """
+    with AsyncBridge(api_client) as bridge:
+        yield bridge
@@ -0,0 +1,218 @@
+"""
+Pytest plugin running the independent async tests concurrently, on one event loop.
+
+Enable it with `--async-concurrency N`. The async tests which only depend on
+session-scoped fixtures and on their parametrization are then set up one after the
+other as usual, but their coroutines all run together on a single event loop, at
+most `N` at a time, so the loop keeps sending requests while others wait for the
+network. Every test keeps its own setup, call and teardown reports, logged in the
+collection order once the concurrent tests are done, so a failing test is reported
+like any other without affecting its neighbours.
+
+The concurrent coroutines are awaited directly, bypassing the `pytest_pyfunc_call`
+and `pytest_runtest_call` hooks, which would run them one at a time. A plugin taking
+over the call of some tests through these hooks lists their markers in its
+`call_markers` attribute, like the `LatencyChecker` does, and those tests are left
+out of the concurrent ones.
+
+The other tests, and the ones marked with `@pytest.mark.serial` or with a marker of
+`call_markers`, run first, one at a time. The output of the concurrent tests is not
+captured per test, and `-x` or `--maxfail` stop the reporting, not the calls
+already gathered.
+"""
+
+import asyncio
+import inspect
+import time
+from collections.abc import Collection
+from typing import Any
+
+import pytest
+from _pytest.outcomes import OutcomeException
+from _pytest.runner import CallInfo, call_and_report
+
+from . import current_test
+
+
+def call_markers(config: pytest.Config) -> frozenset[str]:
+    """Return the markers of the tests whose call is taken over by a plugin."""
+    markers: set[str] = set()
+    for hook in (config.hook.pytest_pyfunc_call, config.hook.pytest_runtest_call):
+        for hookimpl in hook.get_hookimpls():
+            markers.update(getattr(hookimpl.plugin, "call_markers", ()))
+    return frozenset(markers)
+
+
+def is_concurrent(item: pytest.Item, serial_markers: Collection[str] = ()) -> bool:
+    """
+    Return whether a test can run concurrently with the other async tests.
+
+    Parameters
+    ----------
+    item : pytest.Item
+        The test.
+    serial_markers : collection of str, optional
+        Markers of the tests to run one at a time, besides `serial`.
+
+    Returns
+    -------
+    bool
+        Whether the test is async and only depends on session-scoped fixtures.
+    """
+    if not isinstance(item, pytest.Function) or not inspect.iscoroutinefunction(
+        item.obj
+    ):
+        return False
+    if any(item.get_closest_marker(name) for name in ("serial", *serial_markers)):
+        return False
+    params = item.callspec.params if hasattr(item, "callspec") else {}
+    for name in item.fixturenames:
+        if name == "request" or name in params:
+            continue
+        # Every test has its own values of the narrower fixtures, which pytest only
+        # keeps for one test at a time.
+        definitions = item._fixtureinfo.name2fixturedefs.get(name)
+        if not definitions or definitions[-1].scope != "session":
+            return False
+    return True
+
+
+class ConcurrentRunner:
+    """Run the test loop, gathering the concurrent tests on one event loop."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        """
+        Initialize the `ConcurrentRunner`.
+
+        Parameters
+        ----------
+        max_concurrency : int
+            Maximum number of tests running at the same time.
+        """
+        self.max_concurrency = max_concurrency
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session: pytest.Session) -> bool:
+        """Run the serial tests, then the concurrent ones."""
+        if (
+            session.testsfailed
+            and not session.config.option.continue_on_collection_errors
+        ):
+            raise session.Interrupted(
+                f"{session.testsfailed} error{'s' if session.testsfailed != 1 else ''}"
+                " during collection"
+            )
+        if session.config.option.collectonly:
+            return True
+
+        markers = call_markers(session.config)
+        concurrent: list[pytest.Item] = []
+        serial: list[pytest.Item] = []
+        for item in session.items:
+            (concurrent if is_concurrent(item, markers) else serial).append(item)
+        following = serial[1:] + concurrent[:1]
+        for index, item in enumerate(serial):
+            nextitem = following[index] if index < len(following) else None
+            item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+            self._check_stop(session)
+        if concurrent:
+            self._run_concurrently(session, concurrent)
+        return True
+
+    def _run_concurrently(
+        self, session: pytest.Session, items: list[pytest.Item]
+    ) -> None:
+        """Set the tests up, run their calls together, then log their reports."""
+        reports: dict[str, list[pytest.TestReport]] = {}
+        runnable: list[pytest.Function] = []
+        for index, item in enumerate(items):
+            setup = call_and_report(item, "setup", log=False)
+            reports[item.nodeid] = [setup]
+            if setup.passed and isinstance(item, pytest.Function):
+                runnable.append(item)
+            # The fixtures of the tests are session-scoped, so tearing a test down
+            # before its call only pops it from the setup stack; the last one keeps
+            # the session fixtures alive until every call is done.
+            if index + 1 < len(items):
+                teardown = call_and_report(
+                    item, "teardown", log=False, nextitem=items[index + 1]
+                )
+                reports[item.nodeid].append(teardown)
+
+        calls = asyncio.run(self._call_all(runnable))
+        for item, call in zip(runnable, calls, strict=True):
+            report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+            reports[item.nodeid].insert(1, report)
+        last = items[-1]
+        reports[last.nodeid].append(
+            call_and_report(last, "teardown", log=False, nextitem=None)
+        )
+
+        for item in items:
+            item.ihook.pytest_runtest_logstart(
+                nodeid=item.nodeid, location=item.location
+            )
+            for report in reports[item.nodeid]:
+                item.ihook.pytest_runtest_logreport(report=report)
+            item.ihook.pytest_runtest_logfinish(
+                nodeid=item.nodeid, location=item.location
+            )
+            self._check_stop(session)
+
+    async def _call_all(self, items: list[pytest.Function]) -> list[CallInfo[None]]:
+        """Call the tests concurrently, returning the outcome of every call."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def call(item: pytest.Function) -> CallInfo[None]:
+            async with semaphore:
+                current_test.set(item.nodeid)
+                kwargs: dict[str, Any] = {
+                    name: item.funcargs[name] for name in item._fixtureinfo.argnames
+                }
+                excinfo = None
+                start, precise_start = time.time(), time.perf_counter()
+                try:
+                    await item.obj(**kwargs)
+                except (Exception, OutcomeException, asyncio.CancelledError) as error:
+                    excinfo = pytest.ExceptionInfo.from_exception(error)
+                duration = time.perf_counter() - precise_start
+                return CallInfo(
+                    None,
+                    excinfo,
+                    start,
+                    start + duration,
+                    duration,
+                    "call",
+                    _ispytest=True,
+                )
+
+        return await asyncio.gather(*(call(item) for item in items))
+
+    @staticmethod
+    def _check_stop(session: pytest.Session) -> None:
+        """Stop the run as requested by `-x` or `--maxfail`."""
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option of the concurrent runner."""
+    group = parser.getgroup("concurrency", "concurrent async tests")
+    group.addoption(
+        "--async-concurrency",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Run the independent async tests concurrently, N at a time.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the concurrent runner when enabled."""
+    max_concurrency = config.getoption("--async-concurrency")
+    if max_concurrency:
+        config.pluginmanager.register(
+            ConcurrentRunner(max_concurrency), "concurrent-runner"
+        )
@@ -0,0 +1,221 @@
+"""
+Pytest plugin asserting latency objectives with the `latency` marker.
+
+A test marked with `@pytest.mark.latency(p95_ms=500, samples=20, concurrency=2)` is
+called `samples` times, at most `concurrency` calls at a time, and the time of
+every request it sends through `httpx` is recorded. The test then fails when a
+percentile of those times exceeds its objective, `p50_ms`, `p95_ms`, `p99_ms` or
+`max_ms`, reporting the whole distribution. The distributions of all the latency
+tests are reported at the end of the run.
+
+The responses of the calls are always sent again, never shared through the response
+memo of the suite, as signaled by `fresh_responses`. With `--no-latency`, the
+marked tests are called once and their objectives are not checked.
+"""
+
+import asyncio
+import inspect
+import statistics
+import time
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from . import fresh_responses
+
+if TYPE_CHECKING:
+    from _pytest.terminal import TerminalReporter
+
+# Objectives of the marker, by percentile.
+OBJECTIVES = {"p50_ms": 50, "p95_ms": 95, "p99_ms": 99, "max_ms": 100}
+
+
+@dataclass(frozen=True)
+class LatencyReport:
+    """Distribution of the request times of a latency test, in milliseconds."""
+
+    samples: int
+    concurrency: int
+    timings: tuple[float, ...]
+
+    def percentile(self, percent: int) -> float:
+        """Return a percentile of the request times, from 1 to 100."""
+        if percent >= 100 or len(self.timings) == 1:
+            return max(self.timings)
+        return statistics.quantiles(self.timings, n=100, method="inclusive")[
+            percent - 1
+        ]
+
+    def breaches(self, objectives: dict[str, float]) -> list[str]:
+        """Return the objectives exceeded by the request times."""
+        return [
+            f"{name[:-3]} {self.percentile(OBJECTIVES[name]):.1f} ms > {limit} ms"
+            for name, limit in objectives.items()
+            if self.percentile(OBJECTIVES[name]) > limit
+        ]
+
+    def __str__(self) -> str:
+        """Return the distribution on one line."""
+        return (
+            f"{len(self.timings)} requests in {self.samples} calls "
+            f"(concurrency {self.concurrency}): min {min(self.timings):.1f}, "
+            f"p50 {self.percentile(50):.1f}, p95 {self.percentile(95):.1f}, "
+            f"p99 {self.percentile(99):.1f}, max {max(self.timings):.1f} ms"
+        )
+
+
+class LatencyChecker:
+    """Repeat the latency tests and check their objectives."""
+
+    # The tests whose call the checker takes over, left out of the concurrent ones.
+    call_markers = ("latency",)
+
+    def __init__(self) -> None:
+        """Initialize the `LatencyChecker`, with no test reported yet."""
+        self.reports: dict[str, LatencyReport] = {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_pyfunc_call(self, pyfuncitem: pytest.Function) -> bool | None:
+        """Call a latency test repeatedly, timing the requests it sends."""
+        marker = pyfuncitem.get_closest_marker("latency")
+        if marker is None:
+            return None
+        options = dict(marker.kwargs)
+        samples = int(options.pop("samples", 20))
+        concurrency = int(options.pop("concurrency", 1))
+        unknown = set(options) - set(OBJECTIVES)
+        if unknown or samples < 1 or concurrency < 1:
+            raise pytest.UsageError(
+                f"Invalid latency marker on {pyfuncitem.nodeid}: {marker.kwargs}"
+            )
+
+        # pytest-asyncio runs the coroutine of the test with a synchronous wrapper.
+        function = getattr(pyfuncitem.obj, "_raw_test_func", pyfuncitem.obj)
+        kwargs = {
+            name: pyfuncitem.funcargs[name]
+            for name in inspect.signature(function).parameters
+            if name in pyfuncitem.funcargs
+        }
+        timings: list[float] = []
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            _time_requests(monkeypatch, timings)
+            token = fresh_responses.set(True)
+            try:
+                if inspect.iscoroutinefunction(function):
+                    _run_on_test_loop(
+                        pyfuncitem,
+                        _repeat_async(function, kwargs, samples, concurrency),
+                    )
+                else:
+                    _repeat_sync(function, kwargs, samples, concurrency)
+            finally:
+                fresh_responses.reset(token)
+
+        if not timings:
+            pytest.fail("The latency test sent no request.", pytrace=False)
+        report = LatencyReport(samples, concurrency, tuple(timings))
+        self.reports[pyfuncitem.nodeid] = report
+        breaches = report.breaches(options)
+        if breaches:
+            pytest.fail(
+                f"Latency objective breached: {', '.join(breaches)}\n{report}",
+                pytrace=False,
+            )
+        return True
+
+    def pytest_terminal_summary(self, terminalreporter: "TerminalReporter") -> None:
+        """Report the distribution of the request times of every latency test."""
+        if not self.reports:
+            return
+        terminalreporter.write_sep("-", "latency")
+        for nodeid, report in self.reports.items():
+            terminalreporter.write_line(f"{nodeid}: {report}")
+
+
+def _time_requests(monkeypatch: pytest.MonkeyPatch, timings: list[float]) -> None:
+    """Record the time of every request sent by `httpx`, in milliseconds."""
+    send_sync = httpx.Client.send
+    send_async = httpx.AsyncClient.send
+
+    def send(client: httpx.Client, *args: Any, **kwargs: Any) -> httpx.Response:
+        start = time.perf_counter()
+        response = send_sync(client, *args, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        return response
+
+    async def async_send(
+        client: httpx.AsyncClient, *args: Any, **kwargs: Any
+    ) -> httpx.Response:
+        start = time.perf_counter()
+        response = await send_async(client, *args, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+        return response
+
+    monkeypatch.setattr(httpx.Client, "send", send)
+    monkeypatch.setattr(httpx.AsyncClient, "send", async_send)
+
+
+def _run_on_test_loop(
+    item: pytest.Function, coroutine: Coroutine[Any, Any, Any]
+) -> None:
+    """Run a coroutine on the event loop of the test, or on a new one if it has none."""
+    # pytest-asyncio provides the loop of the test as the `event_loop` fixture.
+    loop = item.funcargs.get("event_loop")
+    if isinstance(loop, asyncio.AbstractEventLoop):
+        loop.run_until_complete(coroutine)
+    else:
+        asyncio.run(coroutine)
+
+
+async def _repeat_async(
+    function: Callable[..., Any],
+    kwargs: dict[str, Any],
+    samples: int,
+    concurrency: int,
+) -> None:
+    """Await the test coroutine `samples` times, `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call() -> None:
+        async with semaphore:
+            await function(**kwargs)
+
+    await asyncio.gather(*(call() for _ in range(samples)))
+
+
+def _repeat_sync(
+    function: Callable[..., Any],
+    kwargs: dict[str, Any],
+    samples: int,
+    concurrency: int,
+) -> None:
+    """Call the test function `samples` times, from `concurrency` threads."""
+    call = partial(function, **kwargs)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Every call sees the context of the test, e.g. `fresh_responses`.
+        futures = [executor.submit(copy_context().run, call) for _ in range(samples)]
+        for future in futures:
+            future.result()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option disabling the latency objectives."""
+    group = parser.getgroup("latency", "latency objectives")
+    group.addoption(
+        "--no-latency",
+        action="store_true",
+        default=False,
+        help="Call the latency tests once, without checking their objectives.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the latency checker unless disabled."""
+    if not config.getoption("--no-latency"):
+        config.pluginmanager.register(LatencyChecker(), "latency-checker")
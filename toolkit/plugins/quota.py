@@ -0,0 +1,298 @@
+"""
+Pytest plugin fitting the test run into the daily request quota of the API key.
+
+Enable it with `--quota N`, `N` being the number of requests the key may send per
+day. The plugin then:
+
+- estimates the request cost of every test, from its `@pytest.mark.quota(cost=...)`
+  marker, or else from the most requests it sent on a previous run, or else from
+  `--quota-default-cost`;
+- orders the tests by priority, the `smoke` ones first, then the `error` ones, then
+  the others; within each group, the tests deferred by the previous run come first,
+  then the tests which waited the longest since their last run;
+- deselects the tests which do not fit in what is left of today's quota, and skips
+  the following ones as soon as the requests actually sent, or a rate limited
+  response, say the quota is spent.
+
+The requests sent today, the cost profile and the last run of every test are kept
+in the `--quota-state` file, so the deferred tests run first on the next day and a
+full coverage run spreads over several days.
+"""
+
+import json
+import os
+import time
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from . import current_test
+
+if TYPE_CHECKING:
+    from _pytest.terminal import TerminalReporter
+
+# Markers putting the tests first, in priority order.
+PRIORITY_MARKERS = ("smoke", "error")
+
+
+@dataclass
+class QuotaState:
+    """State of the quota scheduler, persisted between runs."""
+
+    day: str = ""
+    spent: int = 0
+    costs: dict[str, int] = field(default_factory=dict)
+    last_run: dict[str, float] = field(default_factory=dict)
+    deferred: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation of the state."""
+        return {
+            "day": self.day,
+            "spent": self.spent,
+            "costs": self.costs,
+            "last_run": self.last_run,
+            "deferred": self.deferred,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuotaState":
+        """Build the state back from its `to_dict` representation."""
+        return cls(
+            day=data.get("day", ""),
+            spent=data.get("spent", 0),
+            costs=data.get("costs", {}),
+            last_run=data.get("last_run", {}),
+            deferred=data.get("deferred", []),
+        )
+
+
+class QuotaScheduler:
+    """Order, trim and meter the test run against the daily request quota."""
+
+    def __init__(
+        self, daily_quota: int, state_path: str | Path, default_cost: int = 1
+    ) -> None:
+        """
+        Initialize the `QuotaScheduler`, loading its persisted state if any.
+
+        Parameters
+        ----------
+        daily_quota : int
+            Number of requests the API key may send per day.
+        state_path : str or Path
+            JSON file holding the state between runs.
+        default_cost : int, optional
+            Estimated cost of the tests without marker nor recorded cost.
+        """
+        self.daily_quota = daily_quota
+        self.state_path = Path(state_path)
+        self.default_cost = default_cost
+        self.state = self.load()
+        today = datetime.now(tz=timezone.utc).date().isoformat()
+        if self.state.day != today:
+            self.state.day = today
+            self.state.spent = 0
+        self.deferred: dict[str, None] = {}
+        self._previously_deferred = frozenset(self.state.deferred)
+        self.rate_limited = False
+        self._sent: dict[str, int] = {}
+        self._monkeypatch = pytest.MonkeyPatch()
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of requests left for today."""
+        return max(0, self.daily_quota - self.state.spent)
+
+    def load(self) -> QuotaState:
+        """Load the persisted state, returning an empty one on the first run."""
+        if not self.state_path.exists():
+            return QuotaState()
+        return QuotaState.from_dict(
+            json.loads(self.state_path.read_text(encoding="utf-8"))
+        )
+
+    def save(self) -> None:
+        """Persist the state atomically, so a crash never leaves a partial file."""
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(self.state.to_dict()), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+    def cost(self, item: pytest.Item) -> int:
+        """Return the estimated number of requests sent by a test."""
+        marker = item.get_closest_marker("quota")
+        if marker is not None:
+            return int(marker.kwargs.get("cost", marker.args[0] if marker.args else 1))
+        return self.state.costs.get(item.nodeid, self.default_cost)
+
+    def priority(self, item: pytest.Item) -> tuple[int, bool, float]:
+        """Return the sort key of a test, the most urgent first."""
+        rank = next(
+            (
+                index
+                for index, name in enumerate(PRIORITY_MARKERS)
+                if item.get_closest_marker(name) is not None
+            ),
+            len(PRIORITY_MARKERS),
+        )
+        return (
+            rank,
+            item.nodeid not in self._previously_deferred,
+            self.state.last_run.get(item.nodeid, 0.0),
+        )
+
+    def record(self, response: httpx.Response) -> None:
+        """Count a request sent, against today's quota and the running test."""
+        self.state.spent += 1
+        node_id = current_test.get()
+        if node_id is not None:
+            self._sent[node_id] = self._sent.get(node_id, 0) + 1
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            self.rate_limited = True
+
+    def install(self) -> None:
+        """Meter every request sent by `httpx` during the run."""
+        scheduler = self
+        send_sync = httpx.Client.send
+        send_async = httpx.AsyncClient.send
+
+        def send(client: httpx.Client, *args: Any, **kwargs: Any) -> httpx.Response:
+            response = send_sync(client, *args, **kwargs)
+            scheduler.record(response)
+            return response
+
+        async def async_send(
+            client: httpx.AsyncClient, *args: Any, **kwargs: Any
+        ) -> httpx.Response:
+            response = await send_async(client, *args, **kwargs)
+            scheduler.record(response)
+            return response
+
+        self._monkeypatch.setattr(httpx.Client, "send", send)
+        self._monkeypatch.setattr(httpx.AsyncClient, "send", async_send)
+
+    def uninstall(self) -> None:
+        """Restore the `httpx` methods."""
+        self._monkeypatch.undo()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self, config: pytest.Config, items: list[pytest.Item]
+    ) -> None:
+        """Order the tests by priority and deselect the ones over the quota."""
+        items.sort(key=self.priority)
+        selected, deferred = [], []
+        budget = self.remaining
+        for item in items:
+            cost = self.cost(item)
+            if cost <= budget:
+                budget -= cost
+                selected.append(item)
+            else:
+                deferred.append(item)
+        if deferred:
+            self.deferred.update(dict.fromkeys(item.nodeid for item in deferred))
+            config.hook.pytest_deselected(items=deferred)
+            items[:] = selected
+
+    @pytest.hookimpl(wrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> Generator[None, Any, Any]:
+        """Attribute the requests sent while a test runs to that test."""
+        token = current_test.set(item.nodeid)
+        try:
+            return (yield)
+        finally:
+            current_test.reset(token)
+
+    def pytest_runtest_setup(self, item: pytest.Item) -> None:
+        """Skip a test which would go over the quota, deferring it."""
+        # The requests sent ahead for a test, e.g. in a batch, are already spent.
+        cost = self.cost(item) - self._sent.get(item.nodeid, 0)
+        if self.rate_limited or cost > self.remaining:
+            self.deferred[item.nodeid] = None
+            pytest.skip("Deferred: the daily request quota is spent.")
+
+    def pytest_runtest_logfinish(self, nodeid: str) -> None:
+        """
+        Record the cost and the time of the run of a test.
+
+        The cost is the most requests the test sent on a run: a run may send fewer,
+        when it stops at a failure or has responses served without a request.
+        """
+        if nodeid in self.deferred:
+            return
+        self.state.costs[nodeid] = max(
+            self._sent.pop(nodeid, 0), self.state.costs.get(nodeid, 0)
+        )
+        self.state.last_run[nodeid] = time.time()
+
+    def pytest_sessionfinish(self) -> None:
+        """Persist the state, with the deferred tests for the next run."""
+        self.state.deferred = list(self.deferred)
+        self.save()
+
+    def pytest_terminal_summary(self, terminalreporter: "TerminalReporter") -> None:
+        """Report the quota spent and the deferred tests."""
+        terminalreporter.write_sep("-", "request quota")
+        terminalreporter.write_line(
+            f"{self.state.spent} of {self.daily_quota} requests spent today "
+            f"({self.state.day}), {len(self.deferred)} tests deferred to the next "
+            f"run, state saved in {self.state_path}"
+        )
+        if self.rate_limited:
+            terminalreporter.write_line("The API answered with a rate limited error.")
+
+
+_SCHEDULER_KEY = pytest.StashKey[QuotaScheduler]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options of the quota scheduler."""
+    group = parser.getgroup("quota", "request quota scheduling")
+    group.addoption(
+        "--quota",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Fit the run into a daily quota of N requests.",
+    )
+    group.addoption(
+        "--quota-state",
+        default=".pytest_quota.json",
+        help="File keeping the quota state between runs.",
+    )
+    group.addoption(
+        "--quota-default-cost",
+        type=int,
+        default=1,
+        help="Estimated cost of the tests with no marker nor recorded cost.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the scheduler when a quota is given."""
+    daily_quota = config.getoption("--quota")
+    if daily_quota is None:
+        return
+    scheduler = QuotaScheduler(
+        daily_quota,
+        config.rootpath / config.getoption("--quota-state"),
+        config.getoption("--quota-default-cost"),
+    )
+    scheduler.install()
+    config.stash[_SCHEDULER_KEY] = scheduler
+    config.pluginmanager.register(scheduler, "quota-scheduler")
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Restore `httpx` once the run is over."""
+    scheduler = config.stash.get(_SCHEDULER_KEY, None)
+    if scheduler is not None:
+        scheduler.uninstall()
@@ -0,0 +1,388 @@
+"""Incremental poller fetching only the articles published since the last run."""
+
+import asyncio
+import json
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from .api_clients import AsyncAPIClient
+from .canonical import canonical_query
+from .enums import APIEndpointEnum, ResponseCodeEnum
+from .timestamps import parse_published_at
+
+# Parameters owned by the poller; they are never part of the tracked query identity.
+_CONTROLLED_PARAMS = frozenset({"from", "sortBy", "page", "pageSize"})
+
+
+@dataclass
+class PollState:
+    """
+    State of a single tracked query, persisted between runs.
+
+    While the articles published since the watermark do not fit in a single poll,
+    the watermark stays where it is: `cursor` holds the `publishedAt` of the oldest
+    article delivered so far, so the next polls resume below it, and the watermark
+    moves to `pending_watermark`, the newest article delivered, once they reach it.
+    """
+
+    endpoint: str
+    params: dict[str, Any]
+    watermark: str | None = None
+    boundary_urls: set[str] = field(default_factory=set)
+    cursor: str | None = None
+    cursor_urls: set[str] = field(default_factory=set)
+    pending_watermark: str | None = None
+    pending_urls: set[str] = field(default_factory=set)
+
+    def is_seen(self, url: str, published_at: datetime) -> bool:
+        """Return whether an article was delivered by a previous poll."""
+        if self.watermark is not None:
+            watermark = parse_published_at(self.watermark)
+            if published_at < watermark or (
+                published_at == watermark and url in self.boundary_urls
+            ):
+                return True
+        if self.cursor is not None:
+            cursor = parse_published_at(self.cursor)
+            if published_at > cursor or (
+                published_at == cursor and url in self.cursor_urls
+            ):
+                return True
+        return False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable representation of the state."""
+        return {
+            "endpoint": self.endpoint,
+            "params": self.params,
+            "watermark": self.watermark,
+            "boundary_urls": sorted(self.boundary_urls),
+            "cursor": self.cursor,
+            "cursor_urls": sorted(self.cursor_urls),
+            "pending_watermark": self.pending_watermark,
+            "pending_urls": sorted(self.pending_urls),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PollState":
+        """Build the state back from its `to_dict` representation."""
+        return cls(
+            endpoint=data["endpoint"],
+            params=data["params"],
+            watermark=data.get("watermark"),
+            boundary_urls=set(data.get("boundary_urls", [])),
+            cursor=data.get("cursor"),
+            cursor_urls=set(data.get("cursor_urls", [])),
+            pending_watermark=data.get("pending_watermark"),
+            pending_urls=set(data.get("pending_urls", [])),
+        )
+
+
+class ArticlePoller:
+    """
+    Poll tracked queries for articles newer than their high-watermark.
+
+    For every tracked query the newest `publishedAt` seen so far is kept as a
+    watermark. On `/everything` the watermark is sent as the `from` param, together
+    with `sortBy=publishedAt`, so the API only returns the fresh tail of the result
+    set. As `from` is inclusive, the URLs published exactly at the watermark are kept
+    as well, to drop the duplicates on the boundary. `/top-headlines` has no date
+    filter, hence the watermark is applied on the client side there.
+
+    The watermark only moves once a poll reaches it, or the end of the results. On
+    `/everything`, a poll stopped earlier by `max_pages` or by the results cap of the
+    plan leaves a cursor, sent as the `to` param, and the next polls deliver the
+    older articles below it until the watermark is reached. `/top-headlines` is
+    paged to the end on every poll, as it has no `to` param to resume with.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        state_path: str | Path,
+        page_size: int = 100,
+        max_pages: int = 1,
+        max_concurrency: int = 10,
+    ) -> None:
+        """
+        Initialize the `ArticlePoller`, loading the persisted state if any.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client used to send the requests.
+        state_path : str or Path
+            JSON file holding the tracked queries and their watermarks.
+        page_size : int, optional
+            The `pageSize` param sent on every request.
+        max_pages : int, optional
+            Maximum number of pages fetched per `/everything` query and poll; the
+            articles left are delivered by the next polls.
+        max_concurrency : int, optional
+            Maximum number of queries polled at the same time.
+        """
+        self.api_client = api_client
+        self.state_path = Path(state_path)
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.max_concurrency = max_concurrency
+        self.states: dict[str, PollState] = self.load()
+
+    @staticmethod
+    def query_key(endpoint: str, params: dict[str, Any]) -> str:
+        """Return the key identifying a tracked query, the same for equivalent ones."""
+        return canonical_query(
+            endpoint,
+            {
+                name: value
+                for name, value in params.items()
+                if name not in _CONTROLLED_PARAMS
+            },
+        )
+
+    def track(self, endpoint: str, params: dict[str, Any]) -> str:
+        """
+        Start tracking a query, keeping its state if it is tracked already.
+
+        Parameters
+        ----------
+        endpoint : str
+            Either the `/everything` or the `/top-headlines` endpoint.
+        params : dict
+            The query params, without the ones controlled by the poller.
+
+        Returns
+        -------
+        str
+            The key of the tracked query.
+        """
+        if endpoint not in (
+            APIEndpointEnum.EVERYTHING.value,
+            APIEndpointEnum.TOP_HEADLINES.value,
+        ):
+            raise ValueError(f"Polling is not supported for the `{endpoint}` endpoint.")
+
+        key = self.query_key(endpoint, params)
+        if key not in self.states:
+            query_params = {
+                name: value
+                for name, value in params.items()
+                if name not in _CONTROLLED_PARAMS
+            }
+            self.states[key] = PollState(endpoint=endpoint, params=query_params)
+        return key
+
+    def untrack(self, key: str) -> None:
+        """Stop tracking a query and forget its state."""
+        self.states.pop(key, None)
+
+    def load(self) -> dict[str, PollState]:
+        """Load the persisted states, returning an empty mapping on the first run."""
+        if not self.state_path.exists():
+            return {}
+        data = json.loads(self.state_path.read_text(encoding="utf-8"))
+        return {key: PollState.from_dict(state) for key, state in data.items()}
+
+    def save(self) -> None:
+        """Persist the states atomically, so a crash never leaves a partial file."""
+        data = {key: state.to_dict() for key, state in self.states.items()}
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+
+    async def poll(self, key: str) -> list[dict[str, Any]]:
+        """
+        Fetch the articles published since the previous poll of a tracked query.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by `track`.
+
+        Returns
+        -------
+        list of dict
+            The new articles, newest first.
+
+        Raises
+        ------
+        httpx.HTTPStatusError
+            If the API responds with an error on the first page.
+        """
+        state = self.states[key]
+        first_poll = state.watermark is None and state.cursor is None
+        articles, complete = await self._fetch(state)
+        # The first poll starts the tracking from its newest articles, so the older
+        # results of the query are not drained.
+        return self._advance(state, articles, complete or first_poll)
+
+    async def poll_all(
+        self, save: bool = True
+    ) -> dict[str, list[dict[str, Any]] | BaseException]:
+        """
+        Poll every tracked query concurrently.
+
+        A failing query does not stop the others; its state is left untouched and the
+        exception is returned in place of its articles.
+
+        Parameters
+        ----------
+        save : bool, optional
+            Whether to persist the states once all the queries are polled.
+
+        Returns
+        -------
+        dict
+            The new articles, or the raised exception, keyed by the query key.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def poll_one(key: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self.poll(key)
+
+        keys = list(self.states)
+        results = await asyncio.gather(
+            *(poll_one(key) for key in keys), return_exceptions=True
+        )
+        if save:
+            self.save()
+        return dict(zip(keys, results, strict=True))
+
+    async def _fetch(self, state: PollState) -> tuple[list[dict[str, Any]], bool]:
+        """
+        Fetch the pages of a query, stopping as soon as no fresh data is left.
+
+        Returns the articles, and whether the fetch reached the watermark or the end
+        of the results, as opposed to stopping at `max_pages` or the results cap.
+        """
+        params: dict[str, Any] = {**state.params, "pageSize": self.page_size}
+        everything = state.endpoint == APIEndpointEnum.EVERYTHING.value
+        if everything:
+            params["sortBy"] = "publishedAt"
+            if state.watermark is not None:
+                params["from"] = state.watermark
+            if state.cursor is not None:
+                params["to"] = state.cursor
+
+        articles: list[dict[str, Any]] = []
+        page = 1
+        while not everything or page <= self.max_pages:
+            response = await self.api_client.get(
+                state.endpoint, params={**params, "page": page}
+            )
+            if response.status_code != HTTPStatus.OK:
+                # The results cap of the plan ends the pagination; on `/everything`
+                # the next poll resumes below the oldest article fetched.
+                if page > 1 and _error_code(response) == (
+                    ResponseCodeEnum.MAXIMUM_RESULTS_REACHED.value
+                ):
+                    return articles, not everything
+                response.raise_for_status()
+
+            page_articles = response.json().get("articles", [])
+            articles.extend(page_articles)
+            # Only the pages of `/everything` are sorted by `publishedAt`; an old
+            # headline says nothing about the ones on the next pages.
+            if len(page_articles) < self.page_size or (
+                everything and self._reached_watermark(state, page_articles)
+            ):
+                return articles, True
+            page += 1
+        return articles, False
+
+    @staticmethod
+    def _reached_watermark(state: PollState, articles: list[dict[str, Any]]) -> bool:
+        """Return whether a page, sorted newest first, goes past the watermark."""
+        if state.watermark is None or not articles:
+            return False
+        oldest = articles[-1].get("publishedAt")
+        return oldest is not None and parse_published_at(oldest) <= parse_published_at(
+            state.watermark
+        )
+
+    @staticmethod
+    def _advance(
+        state: PollState, articles: list[dict[str, Any]], complete: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Filter out the already seen articles and move the watermark or the cursor.
+
+        The watermark moves to the newest article delivered since it was reached
+        last, when the poll is complete. Otherwise the cursor moves down to the
+        oldest article of the poll. A poll delivering nothing new ends the drain as
+        well, so a cursor never gets stuck.
+        """
+        fresh: list[tuple[datetime, dict[str, Any]]] = []
+        seen_urls: set[str] = set()
+        for article in articles:
+            url, published_raw = article.get("url"), article.get("publishedAt")
+            if not url or not published_raw or url in seen_urls:
+                continue
+            published_at = parse_published_at(published_raw)
+            if not state.is_seen(url, published_at):
+                seen_urls.add(url)
+                fresh.append((published_at, article))
+
+        if fresh and state.pending_watermark is None:
+            state.pending_watermark, state.pending_urls = _edge(fresh, max)
+        if complete or not fresh:
+            _move_watermark(state)
+        else:
+            cursor, cursor_urls = _edge(fresh, min)
+            if state.cursor is not None and parse_published_at(
+                state.cursor
+            ) == parse_published_at(cursor):
+                state.cursor_urls |= cursor_urls
+            else:
+                state.cursor, state.cursor_urls = cursor, cursor_urls
+        return [article for _, article in fresh]
+
+
+def _error_code(response: httpx.Response) -> str | None:
+    """Return the `code` of an error response, `None` when its body is not JSON."""
+    try:
+        code = response.json().get("code")
+    except ValueError:
+        return None
+    return code if isinstance(code, str) else None
+
+
+def _edge(
+    articles: list[tuple[datetime, dict[str, Any]]],
+    pick: Callable[[Iterable[datetime]], datetime],
+) -> tuple[str, set[str]]:
+    """Return the newest or oldest `publishedAt` of articles, with its URLs."""
+    edge = pick(published_at for published_at, _ in articles)
+    edge_articles = [
+        article for published_at, article in articles if published_at == edge
+    ]
+    return edge_articles[0]["publishedAt"], {
+        article["url"] for article in edge_articles
+    }
+
+
+def _move_watermark(state: PollState) -> None:
+    """Move the watermark to the newest article of the drain, ending it."""
+    if state.pending_watermark is not None:
+        pending = parse_published_at(state.pending_watermark)
+        if (
+            state.watermark is not None
+            and parse_published_at(state.watermark) == pending
+        ):
+            state.boundary_urls |= state.pending_urls
+        else:
+            state.watermark, state.boundary_urls = (
+                state.pending_watermark,
+                state.pending_urls,
+            )
+    state.cursor, state.cursor_urls = None, set()
+    state.pending_watermark, state.pending_urls = None, set()
@@ -0,0 +1,332 @@
+"""
+Runner of Postman v2.1 collections, on top of `AsyncAPIClient`.
+
+The requests of a collection, such as `docs/News-API.postman_collection.json`, are
+converted to `RequestSpec` instances, with their `{{variables}}` resolved, their
+disabled query params and headers left out and the `apikey` or `bearer` auth of the
+item, or else of its folders or collection, applied. They are then sent
+concurrently through a pooled `AsyncAPIClient`, and their timings reported.
+
+Run a collection headless, with the `baseUrl` and `apiKey` variables taken from the
+settings, with `python -m toolkit.postman [collection] [--concurrency N]`.
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl
+
+from .api_clients import AsyncAPIClient, RequestResult, RequestSpec
+
+# Collection shipped with the repository.
+DEFAULT_COLLECTION = (
+    Path(__file__).resolve().parent.parent / "docs" / "News-API.postman_collection.json"
+)
+
+# A `{{name}}` variable reference.
+_VARIABLE = re.compile(r"\{\{\s*([^{}]+?)\s*\}\}")
+
+
+def resolve(text: str, variables: Mapping[str, str]) -> str:
+    """Replace the known `{{name}}` variables of a text, leaving the others as is."""
+    return _VARIABLE.sub(
+        lambda match: str(variables.get(match.group(1), match.group(0))), text
+    )
+
+
+def _enabled(entries: Sequence[dict[str, Any]] | None) -> Iterator[tuple[str, str]]:
+    """Yield the `(key, value)` pairs of the entries which are not disabled."""
+    for entry in entries or ():
+        if not entry.get("disabled", False):
+            yield entry["key"], str(entry.get("value") or "")
+
+
+@dataclass(frozen=True)
+class PostmanItem:
+    """A request of a collection, with its variables resolved."""
+
+    name: str
+    method: str
+    url: str
+    params: dict[str, str]
+    headers: dict[str, str]
+    payload: dict[str, str] | None = None
+
+    def spec(self, base_url: str) -> RequestSpec:
+        """
+        Return the request as sent by a client of the given base URL.
+
+        Parameters
+        ----------
+        base_url : str
+            The base URL of the client.
+
+        Returns
+        -------
+        RequestSpec
+            The request, its endpoint relative to the base URL.
+
+        Raises
+        ------
+        ValueError
+            If the URL of the request is not under the base URL.
+        """
+        root_url = base_url.rstrip("/")
+        if self.url != root_url and not self.url.startswith(root_url + "/"):
+            raise ValueError(
+                f"The URL {self.url!r} of {self.name!r} is not under {base_url!r}."
+            )
+        return RequestSpec(
+            endpoint=self.url[len(root_url) :],
+            params=self.params or None,
+            method=self.method,
+            headers=self.headers or None,
+            payload=self.payload,
+        )
+
+
+class PostmanCollection:
+    """A Postman v2.1 collection, as exported by Postman."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """
+        Initialize the `PostmanCollection`.
+
+        Parameters
+        ----------
+        data : dict
+            The JSON content of the collection.
+        """
+        self.data = data
+        self.name: str = data.get("info", {}).get("name", "")
+        self.variables = dict(_enabled(data.get("variable")))
+
+    @classmethod
+    def from_file(cls, path: str | Path = DEFAULT_COLLECTION) -> "PostmanCollection":
+        """Load a collection from its exported JSON file."""
+        return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def items(self, variables: Mapping[str, str] | None = None) -> list[PostmanItem]:
+        """
+        Return the requests of the collection, folders included, in order.
+
+        Parameters
+        ----------
+        variables : mapping, optional
+            Values of the variables, overriding the ones of the collection.
+
+        Returns
+        -------
+        list of PostmanItem
+            The requests, named after their folders and their own name.
+
+        Raises
+        ------
+        ValueError
+            If a request uses an auth type or a body mode which is not supported.
+        """
+        values = {**self.variables, **(variables or {})}
+        entries = self.data.get("item", [])
+        return list(self._walk(entries, (), self.data.get("auth"), values))
+
+    def _walk(
+        self,
+        entries: list[dict[str, Any]],
+        folders: tuple[str, ...],
+        auth: dict[str, Any] | None,
+        variables: dict[str, str],
+    ) -> Iterator[PostmanItem]:
+        """Yield the requests of the entries, recursing into the folders."""
+        for entry in entries:
+            # A folder, or a request, without auth inherits the auth of its parent.
+            if "item" in entry:
+                yield from self._walk(
+                    entry["item"],
+                    (*folders, entry["name"]),
+                    entry.get("auth") or auth,
+                    variables,
+                )
+            else:
+                name = " / ".join((*folders, entry["name"]))
+                request = entry["request"]
+                yield _item(name, request, request.get("auth") or auth, variables)
+
+
+def _item(
+    name: str,
+    request: dict[str, Any],
+    auth: dict[str, Any] | None,
+    variables: Mapping[str, str],
+) -> PostmanItem:
+    """Build the item of a request, resolving its variables."""
+    url = request["url"]
+    if isinstance(url, str):
+        raw, _, query = url.partition("?")
+        params = dict(parse_qsl(query, keep_blank_values=True))
+    else:
+        raw = url["raw"].partition("?")[0]
+        params = dict(_enabled(url.get("query")))
+    headers = dict(_enabled(request.get("header")))
+    if auth:
+        _apply_auth(name, auth, headers, params)
+
+    body = request.get("body") or {}
+    mode = body.get("mode")
+    payload = None
+    # Postman exports the requests without a body with an empty `raw` one.
+    if mode and body.get(mode):
+        if mode not in ("urlencoded", "formdata"):
+            raise ValueError(f"The {mode!r} body of {name!r} is not supported.")
+        payload = {
+            key: resolve(value, variables) for key, value in _enabled(body.get(mode))
+        }
+
+    return PostmanItem(
+        name=name,
+        method=request.get("method", "GET").upper(),
+        url=resolve(raw, variables),
+        params={key: resolve(value, variables) for key, value in params.items()},
+        headers={key: resolve(value, variables) for key, value in headers.items()},
+        payload=payload,
+    )
+
+
+def _apply_auth(
+    name: str, auth: dict[str, Any], headers: dict[str, str], params: dict[str, str]
+) -> None:
+    """Add the header or the query param of the auth of a request."""
+    kind = auth.get("type", "noauth")
+    options = {
+        option["key"]: str(option.get("value", "")) for option in auth.get(kind, [])
+    }
+    if kind == "noauth":
+        return
+    if kind == "bearer":
+        headers["Authorization"] = f"Bearer {options.get('token', '')}"
+    elif kind == "apikey":
+        target = params if options.get("in") == "query" else headers
+        target[options.get("key", "X-Api-Key")] = options.get("value", "")
+    else:
+        raise ValueError(f"The {kind!r} auth of {name!r} is not supported.")
+
+
+class PostmanRunner:
+    """Send the requests of a collection concurrently through an `AsyncAPIClient`."""
+
+    def __init__(self, api_client: AsyncAPIClient, max_concurrency: int = 5) -> None:
+        """
+        Initialize the `PostmanRunner`.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client sending the requests; its base URL is the root of their URLs.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time.
+        """
+        self.api_client = api_client
+        self.max_concurrency = max_concurrency
+
+    async def run(self, items: Sequence[PostmanItem]) -> list[RequestResult]:
+        """
+        Send the requests of the items concurrently.
+
+        Parameters
+        ----------
+        items : sequence of PostmanItem
+            The requests to send.
+
+        Returns
+        -------
+        list of RequestResult
+            The results, in the order of the items. A failed request holds its
+            exception instead of a response; it does not stop the other requests.
+        """
+        specs = [item.spec(self.api_client.base_url) for item in items]
+        return await self.api_client.map(specs, self.max_concurrency)
+
+
+def report(
+    items: Sequence[PostmanItem], results: Sequence[RequestResult], elapsed: float
+) -> str:
+    """
+    Return the timings of a run as a text table.
+
+    Parameters
+    ----------
+    items : sequence of PostmanItem
+        The requests sent.
+    results : sequence of RequestResult
+        Their results, in the same order.
+    elapsed : float
+        The wall time of the whole run, in seconds.
+
+    Returns
+    -------
+    str
+        One line per request, with its status, time and body size, then a summary.
+    """
+    width = max((len(item.name) for item in items), default=0)
+    lines = []
+    for item, result in zip(items, results, strict=True):
+        if result.response is not None:
+            status = str(result.response.status_code)
+            size = f"{len(result.response.content):,} B"
+        else:
+            status, size = "ERROR", type(result.error).__name__
+        lines.append(
+            f"{item.name:<{width}}  {item.method:<6} {status:>5} "
+            f"{result.elapsed * 1000:9.1f} ms  {size}"
+        )
+    total = sum(result.elapsed for result in results)
+    lines.append(
+        f"{len(results)} requests in {elapsed * 1000:.1f} ms "
+        f"({total * 1000:.1f} ms of request time)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run a collection, print its timings and return the exit status."""
+    from config.base import settings
+
+    parser = argparse.ArgumentParser(description="Run a Postman v2.1 collection.")
+    parser.add_argument("collection", nargs="?", default=DEFAULT_COLLECTION)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument(
+        "--var",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Value of a variable, overriding the settings and the collection.",
+    )
+    args = parser.parse_args(argv)
+
+    variables = {"baseUrl": settings.BASE_URL, "apiKey": settings.API_KEY}
+    for var in args.var:
+        name, _, value = var.partition("=")
+        variables[name] = value
+    items = PostmanCollection.from_file(args.collection).items(variables)
+
+    async def run_all() -> list[RequestResult]:
+        async with AsyncAPIClient(variables["baseUrl"]) as api_client:
+            return await PostmanRunner(api_client, args.concurrency).run(items)
+
+    start = time.perf_counter()
+    results = asyncio.run(run_all())
+    print(report(items, results, time.perf_counter() - start))
+    failed = any(
+        result.response is None or result.response.is_error for result in results
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""
+Opt-in profiler of the request pipeline of the API clients.
+
+Given a `RequestProfiler` (`profiler=` on both clients), every request records the
+time, with `time.perf_counter_ns`, spent in each stage of the pipeline:
+
+- `validate`: the pre-flight validation of the params, when a validator is set.
+- `rate_limit`: the wait for the rate limiter of the client, when one is set.
+- `url` and `headers`: building the URL and merging the headers.
+- `acquire`: getting a connection from the pool, connecting it if needed.
+- `send`: writing the request headers and body.
+- `first_byte`: waiting for the response headers.
+- `body_read`: reading the response body.
+- `httpx`: the rest of the time spent in httpx and its transport.
+- `decode`: parsing the JSON body, when the caller calls `response.json()`.
+
+The connection stages come from the `trace` extension of httpcore, so with a
+transport not based on httpcore, such as `CannedTransport`, all the transport time
+is counted in `httpx`. The clients check a single attribute when no profiler is
+given, so profiling costs nothing when off. When on, the `json` method of every
+response is wrapped to time the decoding the caller does, after the request is
+recorded. The requests an `APIClient` sends through an `AsyncBridge` are profiled by
+the profiler of the `APIClient`, which `AsyncBridge.sync_client` shares with the
+bridged `AsyncAPIClient`.
+
+`RequestProfiler.dump_stats` writes the stages in the `pstats` format of cProfile,
+readable by `pstats`, snakeviz or gprof2dot, with the stages as functions called by
+the request.
+"""
+
+import marshal
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+STAGES = (
+    "validate",
+    "rate_limit",
+    "url",
+    "headers",
+    "acquire",
+    "send",
+    "first_byte",
+    "body_read",
+    "httpx",
+    "decode",
+)
+
+# Stage ending at each httpcore trace event, whatever the HTTP version.
+_EVENT_STAGES = {
+    "send_request_headers.started": "acquire",
+    "send_request_body.complete": "send",
+    "receive_response_headers.complete": "first_byte",
+    "receive_response_body.complete": "body_read",
+}
+
+# Pseudo file name of the functions of the `pstats` dump.
+_STATS_FILE = "<request>"
+
+
+class RequestTimer:
+    """Timings of the stages of a single request, in nanoseconds."""
+
+    def __init__(self, profiler: "RequestProfiler") -> None:
+        """Initialize the `RequestTimer`, starting the request now."""
+        self._profiler = profiler
+        self.start_ns = self._last_ns = time.perf_counter_ns()
+        self.stages: dict[str, int] = {}
+
+    def mark(self, stage: str) -> None:
+        """End a stage, which started where the previous one ended."""
+        now = time.perf_counter_ns()
+        self.stages[stage] = self.stages.get(stage, 0) + now - self._last_ns
+        self._last_ns = now
+
+    def trace(self, event: str, info: dict[str, Any]) -> None:
+        """Handle a trace event of a synchronous httpcore connection."""
+        stage = _EVENT_STAGES.get(event.partition(".")[2])
+        if stage is not None:
+            self.mark(stage)
+
+    async def atrace(self, event: str, info: dict[str, Any]) -> None:
+        """Handle a trace event of an asynchronous httpcore connection."""
+        self.trace(event, info)
+
+    def finish(self, response: httpx.Response) -> None:
+        """End the request with its response, record it, and time its decoding."""
+        self.mark("httpx")
+        record = self._profiler.record(self._last_ns - self.start_ns, self.stages)
+        decode = response.json
+        profiler = self._profiler
+
+        def json(**kwargs: Any) -> Any:
+            start_ns = time.perf_counter_ns()
+            try:
+                return decode(**kwargs)
+            finally:
+                profiler.record_stage(
+                    record, "decode", time.perf_counter_ns() - start_ns
+                )
+
+        response.json = json  # type: ignore[method-assign]
+
+
+class RequestProfiler:
+    """
+    Collector of the stage timings of the requests of one or more clients.
+
+    The totals of every stage are kept for the whole run, and the timings of the
+    last `max_records` requests for their percentiles. A profiler may be shared by
+    several clients and threads.
+    """
+
+    def __init__(self, max_records: int = 10_000) -> None:
+        """
+        Initialize the `RequestProfiler`.
+
+        Parameters
+        ----------
+        max_records : int, optional
+            Number of the last requests whose timings are kept.
+        """
+        self.requests = 0
+        self.total_ns = 0
+        self.stage_counts = dict.fromkeys(STAGES, 0)
+        self.stage_totals_ns = dict.fromkeys(STAGES, 0)
+        self.records: deque[dict[str, int]] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def start(self) -> RequestTimer:
+        """Return the timer of a request starting now."""
+        return RequestTimer(self)
+
+    def record(self, total_ns: int, stages: dict[str, int]) -> dict[str, int]:
+        """Add the stage timings of a request which took `total_ns`, return them."""
+        record = {"total": total_ns, **stages}
+        with self._lock:
+            self.requests += 1
+            self.total_ns += total_ns
+            for stage, elapsed_ns in stages.items():
+                self.stage_counts[stage] += 1
+                self.stage_totals_ns[stage] += elapsed_ns
+            self.records.append(record)
+        return record
+
+    def record_stage(self, record: dict[str, int], stage: str, elapsed_ns: int) -> None:
+        """Add the timing of a stage run after its request was recorded."""
+        with self._lock:
+            self.stage_counts[stage] += 1
+            self.stage_totals_ns[stage] += elapsed_ns
+            record[stage] = record.get(stage, 0) + elapsed_ns
+
+    def reset(self) -> None:
+        """Forget the timings recorded so far."""
+        with self._lock:
+            self.requests = self.total_ns = 0
+            self.stage_counts = dict.fromkeys(STAGES, 0)
+            self.stage_totals_ns = dict.fromkeys(STAGES, 0)
+            self.records.clear()
+
+    def percentile_us(self, stage: str, percent: int) -> float:
+        """Return a percentile of a stage, or `total`, over the kept requests."""
+        timings = [record[stage] / 1000 for record in self.records if stage in record]
+        if not timings:
+            return 0.0
+        if len(timings) == 1 or percent >= 100:
+            return max(timings)
+        return statistics.quantiles(timings, n=100, method="inclusive")[percent - 1]
+
+    def _rows(self) -> Iterator[tuple[str, int, int]]:
+        """Yield the name, count and total time of every timed stage, then `total`."""
+        for stage in STAGES:
+            if self.stage_counts[stage]:
+                yield stage, self.stage_counts[stage], self.stage_totals_ns[stage]
+        yield "total", self.requests, self.total_ns
+
+    def summary(self) -> str:
+        """Return a table of the timings of every stage, in microseconds."""
+        lines = [
+            f"{'stage':<12} {'count':>8} {'mean':>10} {'p95':>10} "
+            f"{'total ms':>10} {'share':>7}"
+        ]
+        for stage, count, total_ns in self._rows():
+            # The decoding is not part of the requests, so it has no share of them.
+            share = (
+                f"{total_ns / self.total_ns:>7.1%}"
+                if stage != "decode" and self.total_ns
+                else f"{'':>7}"
+            )
+            lines.append(
+                f"{stage:<12} {count:>8} {total_ns / count / 1000:>10.1f} "
+                f"{self.percentile_us(stage, 95):>10.1f} {total_ns / 1e6:>10.1f} "
+                f"{share}"
+            )
+        return "\n".join(lines)
+
+    def dump_stats(self, path: str | Path) -> None:
+        """
+        Write the stage timings as a cProfile dump, readable with `pstats.Stats`.
+
+        The requests are a `request` function calling one function per stage, except
+        `decode`, which the callers of the client run after the request.
+
+        Parameters
+        ----------
+        path : str or Path
+            The file written.
+        """
+        root = (_STATS_FILE, 0, "request")
+        stats: dict[tuple[str, int, str], tuple[Any, ...]] = {}
+        with self._lock:
+            stages_s = 0.0
+            for stage, count, total_ns in self._rows():
+                seconds = total_ns / 1e9
+                if stage == "total":
+                    own_s = seconds - stages_s
+                    stats[root] = (count, count, own_s, seconds, {})
+                    continue
+                callers = {}
+                if stage != "decode":
+                    callers[root] = (count, count, seconds, seconds)
+                    stages_s += seconds
+                stats[(_STATS_FILE, 0, stage)] = (
+                    count,
+                    count,
+                    seconds,
+                    seconds,
+                    callers,
+                )
+        Path(path).write_bytes(marshal.dumps(stats))
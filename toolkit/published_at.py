@@ -0,0 +1,143 @@
+"""Vectorized checks over the `publishedAt` column of a page of articles."""
+
+from collections.abc import Iterable, Sequence
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from .columnar import ArticleStore, TimestampColumn
+from .timestamps import to_epoch_seconds
+
+Datetime64Array = npt.NDArray[np.datetime64]
+
+
+def _to_naive_utc(value: str) -> str:
+    """Return the value as a naive UTC timestamp string, as parsed by NumPy."""
+    if value.endswith("Z"):
+        return value[:-1]
+    if "+" in value[10:] or "-" in value[10:]:
+        # Rare explicit offsets go through the slow path to be shifted into UTC.
+        return str(np.datetime64(to_epoch_seconds(value), "s"))
+    return value
+
+
+def to_datetime64(value: str | np.datetime64) -> np.datetime64:
+    """
+    Convert a single timestamp, e.g. a `from` or `to` param, to `datetime64[s]`.
+
+    Parameters
+    ----------
+    value : str or numpy.datetime64
+        ISO 8601 date or timestamp, in UTC when no offset is given.
+
+    Returns
+    -------
+    numpy.datetime64
+        The timestamp, in seconds.
+    """
+    if isinstance(value, np.datetime64):
+        converted: np.datetime64 = value.astype("datetime64[s]")
+        return converted
+    return np.datetime64(_to_naive_utc(value), "s")
+
+
+def published_at_array(
+    articles: Sequence[dict[str, Any]] | Iterable[str | None] | ArticleStore,
+) -> Datetime64Array:
+    """
+    Convert the `publishedAt` values of a page of articles in one call.
+
+    Parameters
+    ----------
+    articles : sequence of dict, iterable of str or ArticleStore
+        The articles of a response, their raw `publishedAt` values, or a store. The
+        `published_at` column of a store is viewed without parsing or copying.
+
+    Returns
+    -------
+    numpy.ndarray
+        A `datetime64[s]` array, holding `NaT` for the missing values.
+    """
+    if isinstance(articles, ArticleStore):
+        column = cast(TimestampColumn, articles.columns["published_at"])
+        # The nulls of the column are stored as `NaT` already.
+        return np.frombuffer(column.epoch_seconds, dtype=np.int64).view("datetime64[s]")
+
+    raw = [
+        article.get("publishedAt") if isinstance(article, dict) else article
+        for article in articles
+    ]
+    return np.array(
+        ["NaT" if value is None else _to_naive_utc(value) for value in raw],
+        dtype="datetime64[s]",
+    )
+
+
+def in_range(
+    published_at: Datetime64Array,
+    start: str | np.datetime64 | None = None,
+    end: str | np.datetime64 | None = None,
+) -> npt.NDArray[np.bool_]:
+    """
+    Return a mask of the timestamps within `[start, end]`.
+
+    Parameters
+    ----------
+    published_at : numpy.ndarray
+        A `datetime64` array, as returned by `published_at_array`.
+    start, end : str or numpy.datetime64, optional
+        The inclusive bounds, as sent in the `from` and `to` params.
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean mask, always false for `NaT`.
+    """
+    mask = ~np.isnat(published_at)
+    if start is not None:
+        mask &= published_at >= to_datetime64(start)
+    if end is not None:
+        mask &= published_at <= to_datetime64(end)
+    return mask
+
+
+def is_sorted_descending(published_at: Datetime64Array) -> bool:
+    """
+    Return whether the timestamps are sorted newest first, as for `sortBy=publishedAt`.
+
+    Missing values are ignored.
+    """
+    values = published_at[~np.isnat(published_at)]
+    return bool(np.all(values[:-1] >= values[1:]))
+
+
+def histogram(
+    published_at: Datetime64Array,
+    bin_width: np.timedelta64 = np.timedelta64(1, "h"),
+) -> tuple[npt.NDArray[np.int64], Datetime64Array]:
+    """
+    Count the timestamps per fixed width bin, aligned on multiples of the width.
+
+    Parameters
+    ----------
+    published_at : numpy.ndarray
+        A `datetime64` array, as returned by `published_at_array`.
+    bin_width : numpy.timedelta64, optional
+        Width of every bin, one hour by default.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The count of every bin and the start of every bin.
+    """
+    values = published_at[~np.isnat(published_at)].astype("datetime64[s]")
+    if not values.size:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype="datetime64[s]")
+
+    width = int(bin_width / np.timedelta64(1, "s"))
+    bins = values.astype(np.int64) // width
+    first = int(bins.min())
+    counts = np.bincount(bins - first).astype(np.int64)
+    starts = ((np.arange(counts.size) + first) * width).astype("datetime64[s]")
+    return counts, starts
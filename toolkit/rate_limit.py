@@ -0,0 +1,57 @@
+"""Token bucket rate limiter, shared by the threads or tasks sending requests."""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `rate` requests per second, with bursts of `burst`.
+
+    Every caller reserves its slot under a lock and then waits outside of it, so the
+    waiting callers are released one after another at the configured rate, whatever
+    the number of threads or tasks.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize the `RateLimiter`.
+
+        Parameters
+        ----------
+        rate : float
+            Sustained number of requests per second.
+        burst : int, optional
+            Number of requests allowed at once after an idle period.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("`rate` must be positive and `burst` at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait until it is actually available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request is allowed."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request is allowed."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
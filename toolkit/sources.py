@@ -0,0 +1,208 @@
+"""Catalog of the news sources, cached on disk and indexed in memory."""
+
+import json
+import os
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+from .api_clients import AsyncAPIClient
+from .enums import APIEndpointEnum
+
+# Fields of a source which are indexed, and the query params they validate.
+INDEXED_FIELDS = ("category", "language", "country")
+
+
+class SourceCatalog:
+    """
+    The sources returned by `/sources`, with indexes answering filters locally.
+
+    Every indexed field maps each of its values to the set of ids of the sources
+    having it, so a filter on several fields is an intersection of sets, with no
+    request sent. The catalog is downloaded once and cached in a JSON file until it
+    gets older than its time to live.
+    """
+
+    def __init__(
+        self, sources: Iterable[dict[str, Any]], fetched_at: float | None = None
+    ) -> None:
+        """
+        Initialize the `SourceCatalog`, building its indexes.
+
+        Parameters
+        ----------
+        sources : iterable of dict
+            The sources, as returned by the API. Sources without an `id` are dropped.
+        fetched_at : float, optional
+            When the sources were downloaded, in epoch seconds; now by default.
+        """
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self.by_id: dict[str, dict[str, Any]] = {
+            source["id"]: source for source in sources if source.get("id")
+        }
+        self.indexes: dict[str, dict[str, set[str]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+        for source_id, source in self.by_id.items():
+            for name, index in self.indexes.items():
+                value = source.get(name)
+                if value is not None:
+                    index.setdefault(value, set()).add(source_id)
+
+    @classmethod
+    async def load(
+        cls,
+        api_client: AsyncAPIClient,
+        cache_path: str | Path,
+        ttl: timedelta = timedelta(days=1),
+        refresh: bool = False,
+    ) -> "SourceCatalog":
+        """
+        Return the cached catalog, downloading it again once expired.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client used to download the sources.
+        cache_path : str or Path
+            JSON file caching the catalog.
+        ttl : timedelta, optional
+            How long the cached catalog is used before being downloaded again.
+        refresh : bool, optional
+            Whether to download the catalog even if the cached one is fresh.
+
+        Returns
+        -------
+        SourceCatalog
+            The catalog.
+
+        Raises
+        ------
+        httpx.HTTPStatusError
+            If the API responds with an error.
+        """
+        cache_path = Path(cache_path)
+        if not refresh and cache_path.exists():
+            catalog = cls.from_file(cache_path)
+            if not catalog.is_expired(ttl):
+                return catalog
+
+        response = await api_client.get(APIEndpointEnum.SOURCES.value)
+        if response.status_code != HTTPStatus.OK:
+            response.raise_for_status()
+        catalog = cls(response.json().get("sources", []))
+        catalog.save(cache_path)
+        return catalog
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "SourceCatalog":
+        """Load a catalog saved with `save`."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(data["sources"], fetched_at=data["fetched_at"])
+
+    def save(self, path: str | Path) -> None:
+        """Save the catalog atomically, so a crash never leaves a partial file."""
+        path = Path(path)
+        data = {"fetched_at": self.fetched_at, "sources": list(self.by_id.values())}
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def is_expired(self, ttl: timedelta) -> bool:
+        """Return whether the catalog is older than the given time to live."""
+        return time.time() - self.fetched_at > ttl.total_seconds()
+
+    def filter(
+        self,
+        category: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the sources matching every given value, like the `/sources` params.
+
+        Parameters
+        ----------
+        category, language, country : str, optional
+            The values to match; `None` matches every source.
+
+        Returns
+        -------
+        list of dict
+            The matching sources, in the order of the API response.
+        """
+        return [
+            self.by_id[source_id]
+            for source_id in self.ids(
+                category=category, language=language, country=country
+            )
+        ]
+
+    def ids(
+        self,
+        category: str | None = None,
+        language: str | None = None,
+        country: str | None = None,
+    ) -> list[str]:
+        """Return the ids of the sources matching every given value, in order."""
+        criteria = {"category": category, "language": language, "country": country}
+        matches: set[str] | None = None
+        for name, value in criteria.items():
+            if value is None:
+                continue
+            ids = self.indexes[name].get(value, set())
+            matches = ids if matches is None else matches & ids
+        if matches is None:
+            return list(self.by_id)
+        return [source_id for source_id in self.by_id if source_id in matches]
+
+    def valid_values(self, name: str) -> frozenset[str]:
+        """
+        Return the values accepted by a query param, as found in the catalog.
+
+        Parameters
+        ----------
+        name : str
+            One of `category`, `language`, `country` or `sources`.
+
+        Returns
+        -------
+        frozenset of str
+            The valid values.
+        """
+        if name == "sources":
+            return frozenset(self.by_id)
+        if name not in self.indexes:
+            raise ValueError(f"`{name}` is not a param validated by the catalog.")
+        return frozenset(self.indexes[name])
+
+    @property
+    def categories(self) -> frozenset[str]:
+        """Return the valid values of the `category` param."""
+        return self.valid_values("category")
+
+    @property
+    def languages(self) -> frozenset[str]:
+        """Return the valid values of the `language` param."""
+        return self.valid_values("language")
+
+    @property
+    def countries(self) -> frozenset[str]:
+        """Return the valid values of the `country` param."""
+        return self.valid_values("country")
+
+    def __getitem__(self, source_id: str) -> dict[str, Any]:
+        """Return the source with the given id."""
+        return self.by_id[source_id]
+
+    def __contains__(self, source_id: object) -> bool:
+        """Return whether a source with the given id is in the catalog."""
+        return source_id in self.by_id
+
+    def __len__(self) -> int:
+        """Return the number of sources."""
+        return len(self.by_id)
@@ -0,0 +1,518 @@
+"""
+Test cases read from the test case spreadsheet, `docs/API-Test-Cases-NewsAPI.xlsx`.
+
+The rows of the first sheet are streamed straight from the XML of the workbook, one
+at a time, so a spreadsheet of thousands of cases is never held in memory. Every row
+becomes one `SpreadsheetCase` per combination of the values listed in its "Query
+Parameters" cell; its expected status code, and the `"quoted"` values and non-empty
+arrays of its "Expected Response Data" cell, are checked against the response.
+
+A row described in prose, e.g. with a `{random number between 1-100}` param or with
+steps setting an invalid API key, can not be run as is: its cases are returned with
+the reason they need a manual run instead of a request.
+"""
+
+import asyncio
+import itertools
+import json
+import re
+import zipfile
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any
+from xml.etree.ElementTree import Element, iterparse
+
+from .api_clients import AsyncAPIClient, RequestResult, RequestSpec
+from .plugins import current_test
+
+# Spreadsheet shipped with the repository.
+DEFAULT_SPREADSHEET = (
+    Path(__file__).resolve().parent.parent / "docs" / "API-Test-Cases-NewsAPI.xlsx"
+)
+
+# Columns of the spreadsheet used by the cases.
+COLUMNS = {
+    "case_id": "Test Case ID",
+    "description": "Test Scenario/Description",
+    "endpoint": "API Endpoint",
+    "method": "HTTP Method",
+    "preconditions": "Preconditions",
+    "params": "Query Parameters",
+    "steps": "Test Steps",
+    "status_code": "Expected Status Code",
+    "expected": "Expected Response Data",
+}
+
+# Values of the placeholders of the spreadsheet which are not API keys.
+PLACEHOLDER_VALUES = {"variable": "bitcoin", "invalid_key": "invalid-api-key"}
+
+# Placeholders of the API keys, whose values are given when sending the requests.
+KEY_PLACEHOLDERS = ("valid_key", "rate_limited_key")
+
+# Placeholders known by default.
+PLACEHOLDERS = (*PLACEHOLDER_VALUES, *KEY_PLACEHOLDERS)
+
+# Test steps which can not be run by sending the request of the case as is.
+MANUAL_STEPS = ("invalid API key", "Authorization header", "last valid page")
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_RELATIONSHIPS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PACKAGE = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# A `- name: value` or `name=value` line of the "Query Parameters" cell.
+_PARAM = re.compile(r"^-?\s*(\w+)\s*[:=]\s*(.*)$")
+# A trailing note, such as `(example)` or `(Or other invalid values)`.
+_NOTE = re.compile(r"\s*\([^()]*\)\s*$")
+# A `{name}` placeholder of a value.
+_PLACEHOLDER = re.compile(r"\{([^{}]*)\}")
+# A value which is a bare token, not a prose description.
+_TOKEN = re.compile(r"^[\w.,{}-]*$")
+# A `- field: "value"` or `- field: non-empty array` line of the expectations.
+_EXPECTED = re.compile(r'^-?\s*(\w+):\s*(?:"([^"]*)"|(non-empty array))', re.IGNORECASE)
+
+
+def _column(reference: str) -> int:
+    """Return the zero based column index of a cell reference such as `AB12`."""
+    index = 0
+    for letter in itertools.takewhile(str.isalpha, reference):
+        index = index * 26 + ord(letter.upper()) - ord("A") + 1
+    return index - 1
+
+
+def _text(element: Element) -> str:
+    """Return the text of a shared or inline string, rich text runs included."""
+    return "".join(text.text or "" for text in element.iter(f"{_MAIN}t"))
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> list[str]:
+    """Return the shared strings of the workbook, the only part kept in memory."""
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings = []
+    with archive.open("xl/sharedStrings.xml") as part:
+        for _, element in iterparse(part):
+            if element.tag == f"{_MAIN}si":
+                strings.append(_text(element))
+                element.clear()
+    return strings
+
+
+def _sheet_path(archive: zipfile.ZipFile, sheet: str | None) -> str:
+    """Return the path of a sheet in the archive, the first one by default."""
+    with archive.open("xl/workbook.xml") as part:
+        sheets = [
+            element for _, element in iterparse(part) if element.tag == f"{_MAIN}sheet"
+        ]
+    selected = next(
+        (
+            element
+            for element in sheets
+            if sheet is None or element.get("name") == sheet
+        ),
+        None,
+    )
+    if selected is None:
+        raise ValueError(f"The workbook has no {sheet!r} sheet.")
+    with archive.open("xl/_rels/workbook.xml.rels") as part:
+        target: str = next(
+            element.get("Target", "")
+            for _, element in iterparse(part)
+            if element.tag == f"{_PACKAGE}Relationship"
+            and element.get("Id") == selected.get(f"{_RELATIONSHIPS}id")
+        )
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return str(PurePosixPath("xl") / target)
+
+
+def _cell_value(cell: Element, strings: Sequence[str]) -> str:
+    """Return the value of a cell as a string."""
+    kind = cell.get("t")
+    if kind == "inlineStr":
+        return _text(cell)
+    value = cell.find(f"{_MAIN}v")
+    if value is None or value.text is None:
+        return ""
+    if kind == "s":
+        return strings[int(value.text)]
+    return value.text
+
+
+def iter_rows(
+    path: str | Path = DEFAULT_SPREADSHEET, sheet: str | None = None
+) -> Iterator[list[str]]:
+    """
+    Stream the rows of a sheet of an xlsx workbook.
+
+    Only the shared strings are loaded; the rows are parsed and released one at a
+    time.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        The xlsx workbook.
+    sheet : str, optional
+        The name of the sheet, the first one by default.
+
+    Yields
+    ------
+    list of str
+        The values of the cells of a row, by column, `""` for an empty cell.
+    """
+    with zipfile.ZipFile(path) as archive:
+        strings = _shared_strings(archive)
+        with archive.open(_sheet_path(archive, sheet)) as part:
+            sheet_data = None
+            for event, element in iterparse(part, events=("start", "end")):
+                if event == "start":
+                    if element.tag == f"{_MAIN}sheetData":
+                        sheet_data = element
+                    continue
+                if element.tag != f"{_MAIN}row":
+                    continue
+                values: list[str] = []
+                for cell in element.iter(f"{_MAIN}c"):
+                    column = (
+                        _column(cell.get("r", "")) if cell.get("r") else len(values)
+                    )
+                    values.extend([""] * (column - len(values) + 1))
+                    values[column] = _cell_value(cell, strings)
+                yield values
+                # Drop the rows read so far, so memory does not grow with the sheet.
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+
+def iter_records(
+    path: str | Path = DEFAULT_SPREADSHEET, sheet: str | None = None
+) -> Iterator[dict[str, str]]:
+    """Stream the rows of a sheet as dicts keyed by the header of their column."""
+    rows = iter_rows(path, sheet)
+    header = next(rows, [])
+    for row in rows:
+        if any(value.strip() for value in row):
+            yield dict(itertools.zip_longest(header, row[: len(header)], fillvalue=""))
+
+
+@dataclass(frozen=True)
+class SpreadsheetCase:
+    """A request of a row of the spreadsheet, with the response it expects."""
+
+    case_id: str
+    description: str
+    endpoint: str
+    method: str
+    params: dict[str, str]
+    headers: dict[str, str]
+    status_code: int
+    expected: dict[str, str] = field(default_factory=dict)
+    non_empty: tuple[str, ...] = ()
+    manual: str | None = None
+
+    def spec(self, values: Mapping[str, str]) -> RequestSpec:
+        """
+        Return the request of the case, with its `{placeholders}` replaced.
+
+        Parameters
+        ----------
+        values : mapping
+            Value of every placeholder used by the case.
+
+        Returns
+        -------
+        RequestSpec
+            The request of the case.
+        """
+
+        def fill(text: str) -> str:
+            return _PLACEHOLDER.sub(lambda match: values[match.group(1)], text)
+
+        return RequestSpec(
+            endpoint=self.endpoint,
+            params={name: fill(value) for name, value in self.params.items()} or None,
+            method=self.method,
+            headers={name: fill(value) for name, value in self.headers.items()} or None,
+        )
+
+    def check(self, body: Mapping[str, Any]) -> list[str]:
+        """Return the differences between a response body and the expected one."""
+        problems = [
+            f"{name}: expected {value!r}, got {body.get(name)!r}"
+            for name, value in self.expected.items()
+            if body.get(name) != value
+        ]
+        problems.extend(
+            f"{name}: expected a non-empty array"
+            for name in self.non_empty
+            if not body.get(name)
+        )
+        return problems
+
+
+def _parse_values(text: str) -> list[str] | None:
+    """Return the values of a param cell, `None` when they are described in prose."""
+    text = _NOTE.sub("", text.strip())
+    if text.startswith("["):
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError:
+            items = [item.strip() for item in text.strip("[]").split(",")]
+            if not all(_TOKEN.match(item) for item in items):
+                return None
+        # `null` is sent as an empty value; `[]` and `{}` can not be sent at all.
+        values = ["" if item is None else item for item in items]
+        values = [str(value) for value in values if not isinstance(value, list | dict)]
+        return list(dict.fromkeys(values))
+    if text.startswith('"') and text.endswith('"') and len(text) > 1:
+        return [text[1:-1]]
+    return [text] if _TOKEN.match(text) else None
+
+
+def _parse_params(cell: str) -> dict[str, list[str]] | None:
+    """Return the values of every param of a row, `None` for a prose cell."""
+    params: dict[str, list[str]] = {}
+    for line in cell.splitlines():
+        # Indented lines and lines in parentheses only comment the previous one.
+        if (
+            not line.strip()
+            or line.startswith((" ", "("))
+            or line.strip() in ("-", "None")
+        ):
+            continue
+        for pair in re.split(r",\s*(?=\w+=)", line):
+            match = _PARAM.match(pair.strip())
+            if match is None:
+                return None
+            values = _parse_values(match.group(2))
+            if values is None:
+                return None
+            params[match.group(1)] = values
+    return params
+
+
+def _parse_expected(cell: str) -> tuple[dict[str, str], tuple[str, ...]]:
+    """Return the quoted values and the non-empty arrays expected in the body."""
+    expected, non_empty = {}, []
+    for line in cell.replace("“", '"').replace("”", '"').splitlines():
+        match = _EXPECTED.match(line.strip())
+        if match is None:
+            continue
+        if match.group(3):
+            non_empty.append(match.group(1).lower())
+        else:
+            expected[match.group(1).lower()] = match.group(2)
+    return expected, tuple(non_empty)
+
+
+def _status_code(record: Mapping[str, str]) -> int | None:
+    """Return the expected status code of a row, `None` when the cell has none."""
+    words = record.get(COLUMNS["status_code"], "").split()
+    return int(words[0]) if words and words[0].isdigit() else None
+
+
+def _manual_reason(
+    record: Mapping[str, str],
+    params: Mapping[str, list[str]] | None,
+    placeholders: Collection[str],
+) -> str | None:
+    """Return why the cases of a row need a manual run, `None` if they do not."""
+    if _status_code(record) is None:
+        return "the expected status code is missing"
+    steps = record.get(COLUMNS["steps"], "")
+    hint = next((hint for hint in MANUAL_STEPS if hint in steps), None)
+    if hint is not None:
+        return f"the test steps need {hint!r}"
+    if params is None:
+        return "the query parameters are described in prose"
+    unknown = {
+        name
+        for values in params.values()
+        for value in values
+        for name in _PLACEHOLDER.findall(value)
+    } - set(placeholders)
+    if unknown:
+        return f"no value for the placeholders {sorted(unknown)}"
+    return None
+
+
+def cases_from_record(
+    record: Mapping[str, str], placeholders: Collection[str] = PLACEHOLDERS
+) -> list[SpreadsheetCase]:
+    """
+    Return the cases of a row of the spreadsheet.
+
+    Parameters
+    ----------
+    record : mapping
+        The row, keyed by the headers of the spreadsheet.
+    placeholders : collection of str, optional
+        Names of the `{placeholders}` whose values are known when sending the
+        requests, `PLACEHOLDERS` by default.
+
+    Returns
+    -------
+    list of SpreadsheetCase
+        One case per combination of the param values of the row, suffixed with its
+        index when there are several, or a single manual case.
+    """
+    params = _parse_params(record.get(COLUMNS["params"], ""))
+    expected, non_empty = _parse_expected(record.get(COLUMNS["expected"], ""))
+    # The rate limited key is sent instead of the default one when required.
+    headers = {}
+    if "rate limited" in record.get(COLUMNS["preconditions"], "").lower():
+        headers["X-API-KEY"] = "{rate_limited_key}"
+    manual = _manual_reason(record, params, placeholders)
+
+    case_id = record[COLUMNS["case_id"]].strip()
+    combinations = (
+        [{}]
+        if manual or not params
+        else [
+            dict(zip(params, values, strict=True))
+            for values in itertools.product(*params.values())
+        ]
+    )
+    return [
+        SpreadsheetCase(
+            case_id=case_id if len(combinations) == 1 else f"{case_id}-{index}",
+            description=record.get(COLUMNS["description"], "").strip(),
+            endpoint=record.get(COLUMNS["endpoint"], "").strip(),
+            method=record.get(COLUMNS["method"], "GET").strip().upper(),
+            params=combination,
+            headers=headers,
+            status_code=_status_code(record) or 0,
+            expected=expected,
+            non_empty=non_empty,
+            manual=manual,
+        )
+        for index, combination in enumerate(combinations)
+    ]
+
+
+def load_cases(
+    path: str | Path = DEFAULT_SPREADSHEET, placeholders: Collection[str] = PLACEHOLDERS
+) -> Iterator[SpreadsheetCase]:
+    """
+    Stream the cases of the test case spreadsheet.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        The xlsx workbook of the test cases.
+    placeholders : collection of str, optional
+        Names of the `{placeholders}` whose values are known when sending the
+        requests, `PLACEHOLDERS` by default.
+
+    Yields
+    ------
+    SpreadsheetCase
+        The cases, in the order of the rows.
+    """
+    for record in iter_records(path):
+        if record.get(COLUMNS["case_id"], "").strip():
+            yield from cases_from_record(record, placeholders)
+
+
+class CaseBatch:
+    """
+    Send the requests of many cases in one concurrent batch, on first demand.
+
+    The first case asking for its result sends the requests of every case
+    concurrently, on one connection pool; the others wait for the batch, or read
+    its result once it is done, whatever their event loop. Every request of the
+    batch is sent with the `current_test` of its case set around it, so the request
+    quota plugin charges each test with its own request.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncAPIClient,
+        cases: Sequence[SpreadsheetCase],
+        values: Mapping[str, str],
+        max_concurrency: int = 8,
+        test_ids: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        Initialize the `CaseBatch`.
+
+        Parameters
+        ----------
+        api_client : AsyncAPIClient
+            The client sending the requests.
+        cases : sequence of SpreadsheetCase
+            The cases of the batch; the manual ones are left out.
+        values : mapping
+            Value of every placeholder used by the cases.
+        max_concurrency : int, optional
+            Maximum number of requests in flight at the same time.
+        test_ids : mapping, optional
+            The node id of the test of every case, by case id.
+        """
+        self.api_client = api_client
+        self.cases = [case for case in cases if case.manual is None]
+        self.values = values
+        self.max_concurrency = max_concurrency
+        self.test_ids = dict(test_ids or {})
+        self._results: dict[str, RequestResult] | None = None
+        self._pending: asyncio.Future[dict[str, RequestResult]] | None = None
+
+    async def result(self, case: SpreadsheetCase) -> RequestResult:
+        """Return the result of the request of a case, sending the batch if needed."""
+        if self._results is None:
+            self._results = await self._send()
+        if case.case_id not in self._results:
+            # A case outside of the batch is sent on its own.
+            [self._results[case.case_id]] = await self.api_client.map(
+                [case.spec(self.values)]
+            )
+        return self._results[case.case_id]
+
+    async def _send(self) -> dict[str, RequestResult]:
+        """Send the batch, or wait for the batch already sent on this loop."""
+        loop = asyncio.get_running_loop()
+        if self._pending is not None and self._pending.get_loop() is loop:
+            return await asyncio.shield(self._pending)
+
+        future = self._pending = loop.create_future()
+        try:
+            results = await self._send_cases()
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved, in case no other case waits for it.
+            future.exception()
+            raise
+        finally:
+            self._pending = None
+        mapping = {
+            case.case_id: result
+            for case, result in zip(self.cases, results, strict=True)
+        }
+        future.set_result(mapping)
+        return mapping
+
+    async def _send_cases(self) -> list[RequestResult]:
+        """Send the requests of the cases concurrently, in their order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send(case: SpreadsheetCase) -> RequestResult:
+            # Every send is a task of its own, so the test set here is the one
+            # charged for its request, whichever case is sent next.
+            test_id = self.test_ids.get(case.case_id)
+            token = None if test_id is None else current_test.set(test_id)
+            try:
+                async with semaphore:
+                    [result] = await self.api_client.map([case.spec(self.values)])
+            finally:
+                if token is not None:
+                    current_test.reset(token)
+            return result
+
+        opened = not self.api_client.is_open
+        if opened:
+            await self.api_client.open()
+        try:
+            return await asyncio.gather(*(send(case) for case in self.cases))
+        finally:
+            if opened:
+                await self.api_client.aclose()
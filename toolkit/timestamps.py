@@ -0,0 +1,28 @@
+"""Module providing helpers for the `publishedAt` timestamps of the articles."""
+
+from datetime import datetime, timezone
+
+
+def parse_published_at(value: str) -> datetime:
+    """
+    Parse a `publishedAt` value returned by the API into an aware datetime.
+
+    Parameters
+    ----------
+    value : str
+        ISO 8601 timestamp, optionally suffixed with `Z`.
+
+    Returns
+    -------
+    datetime
+        The timestamp, in UTC when no offset is given.
+    """
+    published_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if published_at.tzinfo is None:
+        published_at = published_at.replace(tzinfo=timezone.utc)
+    return published_at
+
+
+def to_epoch_seconds(value: str) -> int:
+    """Convert a `publishedAt` value into seconds since the Unix epoch."""
+    return int(parse_published_at(value).timestamp())
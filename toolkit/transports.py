@@ -0,0 +1,142 @@
+"""In-process transports serving canned API responses, for offline benchmarks."""
+
+import asyncio
+import json
+import time
+from collections.abc import Mapping
+from http import HTTPStatus
+
+import httpx
+
+from .enums import APIEndpointEnum, ResponseCodeEnum, ResponseStatusEnum
+
+_JSON_HEADERS = (("content-type", "application/json; charset=utf-8"),)
+
+
+def make_article(index: int) -> dict[str, object]:
+    """Return a synthetic article, shaped like the ones returned by the API."""
+    return {
+        "source": {"id": None, "name": f"Source {index % 50}"},
+        "author": f"Author {index % 1000}",
+        "title": f"Title of the article number {index}",
+        "description": "A short description of the article. " * 3,
+        "url": f"https://www.example.com/news/{index}",
+        "urlToImage": f"https://www.example.com/images/{index}.jpg",
+        "publishedAt": f"2025-01-{1 + index % 28:02d}T{index % 24:02d}:00:00Z",
+        "content": "The first characters of the article content. " * 4,
+    }
+
+
+def newsapi_payloads(page_size: int = 100) -> dict[str, bytes]:
+    """
+    Return canned response bodies for every endpoint of the API.
+
+    Parameters
+    ----------
+    page_size : int, optional
+        Number of articles in the `/everything` page.
+
+    Returns
+    -------
+    dict
+        The encoded JSON bodies, keyed by endpoint path.
+    """
+    everything = [make_article(index) for index in range(page_size)]
+    sources = [
+        {
+            "id": f"source-{index}",
+            "name": f"Source {index}",
+            "description": "A news source.",
+            "url": f"https://source-{index}.example.com",
+            "category": ("business", "general", "technology")[index % 3],
+            "language": ("en", "de", "fr")[index % 3],
+            "country": ("us", "de", "fr")[index % 3],
+        }
+        for index in range(128)
+    ]
+    bodies = {
+        APIEndpointEnum.EVERYTHING.value: {
+            "status": ResponseStatusEnum.OK.value,
+            "totalResults": 10_000,
+            "articles": everything,
+        },
+        APIEndpointEnum.TOP_HEADLINES.value: {
+            "status": ResponseStatusEnum.OK.value,
+            "totalResults": 20,
+            "articles": everything[:20],
+        },
+        APIEndpointEnum.SOURCES.value: {
+            "status": ResponseStatusEnum.OK.value,
+            "sources": sources,
+        },
+    }
+    return {path: json.dumps(body).encode() for path, body in bodies.items()}
+
+
+class CannedTransport(httpx.MockTransport):
+    """
+    Transport answering every request from preloaded response bodies.
+
+    The routes are matched on the last segment of the URL path, so the transport
+    works whatever the base URL of the client. The preloaded bytes are handed to
+    every response as they are, without being copied or re-encoded, hence the cost
+    of the transport itself stays negligible next to the client being measured.
+    The transport works for both `APIClient` and `AsyncAPIClient`.
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[str, bytes] | None = None,
+        status_code: int = HTTPStatus.OK,
+        latency: float = 0.0,
+    ) -> None:
+        """
+        Initialize the `CannedTransport`.
+
+        Parameters
+        ----------
+        routes : mapping, optional
+            Response bodies keyed by endpoint path, `newsapi_payloads()` by default.
+        status_code : int, optional
+            Status code of the responses of the known routes.
+        latency : float, optional
+            Simulated network latency of every request, in seconds.
+        """
+        super().__init__(self.respond)
+        self.routes = {
+            "/" + path.strip("/").rsplit("/", 1)[-1]: body
+            for path, body in (routes or newsapi_payloads()).items()
+        }
+        self.status_code = status_code
+        self.latency = latency
+        self.not_found = json.dumps(
+            {
+                "status": ResponseStatusEnum.ERROR.value,
+                "code": ResponseCodeEnum.PARAMETER_INVALID.value,
+                "message": "Unknown endpoint.",
+            }
+        ).encode()
+        self.requests_count = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a synchronous request, after the simulated latency."""
+        if self.latency:
+            time.sleep(self.latency)
+        return super().handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer an asynchronous request, after the simulated latency."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await super().handle_async_request(request)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        """Return the canned response of the requested endpoint."""
+        self.requests_count += 1
+        path = request.url.path
+        body = self.routes.get(path[path.rfind("/") :])
+        if body is None:
+            return httpx.Response(
+                HTTPStatus.NOT_FOUND, headers=_JSON_HEADERS, content=self.not_found
+            )
+        return httpx.Response(self.status_code, headers=_JSON_HEADERS, content=body)
@@ -0,0 +1,346 @@
+"""Pre-flight validation of the request params, before any network I/O."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from .enums import APIEndpointEnum, ResponseCodeEnum, ValidationModeEnum
+from .timestamps import parse_published_at
+
+if TYPE_CHECKING:
+    from .sources import SourceCatalog
+
+# Marker of a param dropped by the normalization.
+_DROPPED = object()
+
+
+class RequestValidationError(ValueError):
+    """A request the API would refuse, or would silently misread, found locally."""
+
+    def __init__(
+        self, endpoint: str, param: str, code: ResponseCodeEnum, message: str
+    ) -> None:
+        """
+        Initialize the `RequestValidationError`.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint of the request.
+        param : str
+            The name of the invalid param.
+        code : ResponseCodeEnum
+            The error code the API answers such a request with.
+        message : str
+            The description of the error.
+        """
+        super().__init__(f"{endpoint}: {message}")
+        self.endpoint = endpoint
+        self.param = param
+        self.code = code
+        self.message = message
+
+
+@dataclass(frozen=True)
+class ParamSpec:
+    """Constraints of a query param."""
+
+    integer: bool = False
+    minimum: int | None = None
+    maximum: int | None = None
+    max_length: int | None = None
+    choices: frozenset[str] | None = None
+    comma_separated: bool = False
+    date: bool = False
+    max_age: timedelta | None = None
+    # Name of the `SourceCatalog.valid_values` the values must belong to.
+    catalog_values: str | None = None
+
+
+@dataclass(frozen=True)
+class EndpointSpec:
+    """Constraints of the query params of an endpoint."""
+
+    params: Mapping[str, ParamSpec]
+    # At least one of these params must be set.
+    required_any: tuple[str, ...] = field(default=())
+
+
+_PAGE = ParamSpec(integer=True, minimum=1)
+_PAGE_SIZE = ParamSpec(integer=True, minimum=1, maximum=100)
+_QUERY = ParamSpec(max_length=500)
+_SOURCES = EndpointSpec(
+    params={
+        "category": ParamSpec(catalog_values="category"),
+        "language": ParamSpec(catalog_values="language"),
+        "country": ParamSpec(catalog_values="country"),
+    },
+)
+
+ENDPOINT_SPECS: dict[APIEndpointEnum, EndpointSpec] = {
+    APIEndpointEnum.EVERYTHING: EndpointSpec(
+        params={
+            "q": _QUERY,
+            "qInTitle": _QUERY,
+            "searchIn": ParamSpec(
+                choices=frozenset({"title", "description", "content"}),
+                comma_separated=True,
+            ),
+            "sources": ParamSpec(comma_separated=True, catalog_values="sources"),
+            "from": ParamSpec(date=True, max_age=timedelta(days=5 * 365)),
+            "to": ParamSpec(date=True),
+            "language": ParamSpec(catalog_values="language"),
+            "sortBy": ParamSpec(
+                choices=frozenset({"relevancy", "popularity", "publishedAt"})
+            ),
+            "page": _PAGE,
+            "pageSize": _PAGE_SIZE,
+        },
+        required_any=("q", "qInTitle", "sources", "domains"),
+    ),
+    APIEndpointEnum.TOP_HEADLINES: EndpointSpec(
+        params={
+            "q": _QUERY,
+            "country": ParamSpec(catalog_values="country"),
+            "category": ParamSpec(catalog_values="category"),
+            "sources": ParamSpec(comma_separated=True, catalog_values="sources"),
+            "page": _PAGE,
+            "pageSize": _PAGE_SIZE,
+        },
+    ),
+    # The sources are served under both paths.
+    APIEndpointEnum.SOURCES: _SOURCES,
+    APIEndpointEnum.TOP_HEADLINES_SOURCES: _SOURCES,
+}
+
+
+class RequestValidator:
+    """
+    Check the params of a request against the specs of its endpoint.
+
+    Two kinds of problems are caught: the values the API refuses with an error, like
+    `pageSize > 100`, `page < 1`, a too long `q` or a `from` older than five years,
+    and the values it silently ignores, like an unknown `sortBy`, which return
+    results the caller did not ask for. In `REJECT` mode both raise a
+    `RequestValidationError`. In `NORMALIZE` mode the out of range values are
+    clamped and the ignored ones dropped, and only the requests which cannot be
+    fixed, like a missing or too long `q`, raise. Params without a spec are passed
+    through untouched.
+    """
+
+    def __init__(
+        self,
+        mode: ValidationModeEnum = ValidationModeEnum.REJECT,
+        catalog: "SourceCatalog | None" = None,
+        max_results: int | None = None,
+        specs: Mapping[APIEndpointEnum, EndpointSpec] | None = None,
+    ) -> None:
+        """
+        Initialize the `RequestValidator`.
+
+        Parameters
+        ----------
+        mode : ValidationModeEnum, optional
+            Whether invalid values are rejected or normalized.
+        catalog : SourceCatalog, optional
+            When given, the `sources`, `category`, `language` and `country` values
+            are checked against the values of the catalog.
+        max_results : int, optional
+            The results cap of the plan of the API key; pages past it are refused.
+        specs : mapping, optional
+            The specs of the endpoints, `ENDPOINT_SPECS` by default.
+        """
+        self.mode = ValidationModeEnum(mode)
+        self.catalog = catalog
+        self.max_results = max_results
+        self.specs = ENDPOINT_SPECS if specs is None else specs
+
+    def validate(
+        self, endpoint: str, params: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """
+        Validate the params of a request.
+
+        Parameters
+        ----------
+        endpoint : str
+            The requested endpoint.
+        params : dict, optional
+            The URL params of the request.
+
+        Returns
+        -------
+        dict, optional
+            The params to send, normalized in `NORMALIZE` mode.
+
+        Raises
+        ------
+        RequestValidationError
+            If the request would be refused, or misread, by the API.
+        """
+        try:
+            spec = self.specs[APIEndpointEnum("/" + endpoint.strip("/"))]
+        except (KeyError, ValueError):
+            return params
+
+        validated: dict[str, Any] = {}
+        for name, value in (params or {}).items():
+            param_spec = spec.params.get(name)
+            if param_spec is not None and value is not None and value != "":
+                value = self._check(endpoint, name, value, param_spec)
+            if value is not _DROPPED:
+                validated[name] = value
+
+        if spec.required_any and not any(
+            validated.get(name) for name in spec.required_any
+        ):
+            raise RequestValidationError(
+                endpoint,
+                spec.required_any[0],
+                ResponseCodeEnum.PARAMETER_MISSING,
+                f"Set any of the following params: {', '.join(spec.required_any)}.",
+            )
+        if "pageSize" in spec.params:
+            self._check_results_cap(endpoint, validated)
+        return validated if params is not None else None
+
+    def _check(self, endpoint: str, name: str, value: Any, spec: ParamSpec) -> Any:
+        """Return the value of a param to send, or `_DROPPED`, raising if invalid."""
+        if spec.integer:
+            return self._check_integer(endpoint, name, value, spec)
+        if not isinstance(value, str):
+            return value
+
+        if spec.max_length is not None and len(value) > spec.max_length:
+            raise RequestValidationError(
+                endpoint,
+                name,
+                ResponseCodeEnum.QUERY_TOO_LONG,
+                f"`{name}` is longer than {spec.max_length} characters.",
+            )
+        if spec.date:
+            return self._check_date(endpoint, name, value, spec)
+        return self._check_choices(endpoint, name, value, spec)
+
+    def _check_integer(
+        self, endpoint: str, name: str, value: Any, spec: ParamSpec
+    ) -> int:
+        """Return the value of an integer param to send, clamped when normalizing."""
+        normalize = self.mode == ValidationModeEnum.NORMALIZE
+        number = _as_integer(value)
+        if number is None:
+            raise RequestValidationError(
+                endpoint,
+                name,
+                ResponseCodeEnum.PARAMETER_INVALID,
+                f"`{name}` must be an integer, got {value!r}.",
+            )
+
+        if spec.minimum is not None and number < spec.minimum:
+            if not normalize:
+                code = (
+                    ResponseCodeEnum.PAGE_CAN_NOT_BE_LESS_THAN_ONE
+                    if name == "page"
+                    else ResponseCodeEnum.PARAMETER_INVALID
+                )
+                raise RequestValidationError(
+                    endpoint, name, code, f"`{name}` must be >= {spec.minimum}."
+                )
+            number = spec.minimum
+        if spec.maximum is not None and number > spec.maximum:
+            if not normalize:
+                raise RequestValidationError(
+                    endpoint,
+                    name,
+                    ResponseCodeEnum.MAXIMUM_RESULTS_REACHED,
+                    f"`{name}` must be <= {spec.maximum}.",
+                )
+            number = spec.maximum
+        return number
+
+    def _check_choices(
+        self, endpoint: str, name: str, value: str, spec: ParamSpec
+    ) -> Any:
+        """Return the valid values of a param to send, or `_DROPPED`."""
+        valid_values = spec.choices
+        if spec.catalog_values is not None and self.catalog is not None:
+            valid_values = self.catalog.valid_values(spec.catalog_values)
+        if valid_values is None:
+            return value
+
+        values = (
+            [item.strip() for item in value.split(",")]
+            if spec.comma_separated
+            else [value]
+        )
+        invalid = [item for item in values if item not in valid_values]
+        if not invalid:
+            return value
+        if self.mode != ValidationModeEnum.NORMALIZE:
+            raise RequestValidationError(
+                endpoint,
+                name,
+                ResponseCodeEnum.PARAMETER_INVALID,
+                f"Invalid `{name}` value(s): {', '.join(invalid)}.",
+            )
+        kept = [item for item in values if item in valid_values]
+        return ",".join(kept) if kept else _DROPPED
+
+    def _check_date(self, endpoint: str, name: str, value: str, spec: ParamSpec) -> Any:
+        """Return the value of a date param to send, or `_DROPPED`."""
+        normalize = self.mode == ValidationModeEnum.NORMALIZE
+        try:
+            date = parse_published_at(value)
+        except ValueError:
+            # The API ignores the dates it cannot parse.
+            if normalize:
+                return _DROPPED
+            raise RequestValidationError(
+                endpoint,
+                name,
+                ResponseCodeEnum.PARAMETER_INVALID,
+                f"`{name}` is not an ISO 8601 date: {value!r}.",
+            ) from None
+
+        if spec.max_age is not None:
+            oldest = datetime.now(tz=timezone.utc) - spec.max_age
+            if date < oldest:
+                if not normalize:
+                    raise RequestValidationError(
+                        endpoint,
+                        name,
+                        ResponseCodeEnum.PARAMETER_INVALID,
+                        f"`{name}` is too far in the past, the oldest is {oldest:%F}.",
+                    )
+                # One more minute keeps the value valid while the request is sent.
+                return (oldest + timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:%S")
+        return value
+
+    def _check_results_cap(self, endpoint: str, params: dict[str, Any]) -> None:
+        """Refuse the pages starting past the results cap of the plan."""
+        if self.max_results is None:
+            return
+        try:
+            page = int(params.get("page") or 1)
+            page_size = int(params.get("pageSize") or 100)
+        except (TypeError, ValueError):
+            return
+        if (page - 1) * page_size >= self.max_results:
+            raise RequestValidationError(
+                endpoint,
+                "page",
+                ResponseCodeEnum.MAXIMUM_RESULTS_REACHED,
+                f"Only the first {self.max_results} results can be requested.",
+            )
+
+
+def _as_integer(value: Any) -> int | None:
+    """Return the integer a param value stands for, `None` if not a whole number."""
+    # `int` would silently truncate `2.7` to 2, and turn `True` into 1.
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None